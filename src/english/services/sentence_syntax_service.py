@@ -27,50 +27,34 @@ class SyntaxService:
     
     def __init__(self, config_dir: str = "src/english/config"):
         self.config_dir = Path(config_dir)
-        self.syntax_configs = self._load_syntax_configs()
+        grammar_dir = self.config_dir / "grammar_configs"
+        # 各阶段句法文件，首次访问时才加载
+        self._loaders: Dict[str, Path] = {
+            "elementary": grammar_dir / "小学句法.json",
+            "junior_high": grammar_dir / "初中句法.json",
+            "high_school": grammar_dir / "高中句法.json"
+        }
+        self._syntax_configs: Dict[str, List[Dict]] = {}
+    
+    def _get_stage(self, key: str) -> List[Dict]:
+        """获取指定阶段的句法配置（按需加载并缓存）"""
+        if key not in self._syntax_configs:
+            path = self._loaders.get(key)
+            self._syntax_configs[key] = self._load_syntax_file(path) if path else []
+        return self._syntax_configs[key]
     
-    def _load_syntax_configs(self) -> Dict[str, List[Dict]]:
-        """加载句法配置"""
-        syntax_configs = {}
-        
-        # 加载小学句法
-        elementary_file = self.config_dir / "grammar_configs" / "小学句法.json"
-        if elementary_file.exists():
-            try:
-                with open(elementary_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # 从实际配置文件中提取句法点
-                    syntax_points = self._extract_syntax_points(data)
-                    syntax_configs["elementary"] = syntax_points
-            except Exception as e:
-                print(f"⚠️ 加载小学句法失败: {e}")
-                syntax_configs["elementary"] = []
-        
-        # 加载初中句法
-        junior_file = self.config_dir / "grammar_configs" / "初中句法.json"
-        if junior_file.exists():
-            try:
-                with open(junior_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    syntax_points = self._extract_syntax_points(data)
-                    syntax_configs["junior_high"] = syntax_points
-            except Exception as e:
-                print(f"⚠️ 加载初中句法失败: {e}")
-                syntax_configs["junior_high"] = []
-        
-        # 加载高中句法
-        senior_file = self.config_dir / "grammar_configs" / "高中句法.json"
-        if senior_file.exists():
-            try:
-                with open(senior_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    syntax_points = self._extract_syntax_points(data)
-                    syntax_configs["high_school"] = syntax_points
-            except Exception as e:
-                print(f"⚠️ 加载高中句法失败: {e}")
-                syntax_configs["high_school"] = []
-        
-        return syntax_configs
+    def _load_syntax_file(self, path: Path) -> List[Dict]:
+        """加载单个句法配置文件"""
+        if not path.exists():
+            return []
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                # 从实际配置文件中提取句法点
+                return self._extract_syntax_points(data)
+        except Exception as e:
+            print(f"⚠️ 加载{path.stem}失败: {e}")
+            return []
     
     def _extract_syntax_points(self, data: Dict) -> List[Dict]:
         """从配置文件中提取句法点"""
@@ -320,7 +304,7 @@ class SyntaxService:
         }
         
         stage_key = stage_mapping.get(stage, "elementary")
-        return len(self.syntax_configs.get(stage_key, []))
+        return len(self._get_stage(stage_key))
     
     def get_syntax_points(self, stage: str) -> List[SyntaxPoint]:
         """获取指定阶段的句法点列表"""
@@ -331,7 +315,7 @@ class SyntaxService:
         }
         
         stage_key = stage_mapping.get(stage, "elementary")
-        points_data = self.syntax_configs.get(stage_key, [])
+        points_data = self._get_stage(stage_key)
         
         syntax_points = []
         for point_data in points_data:
@@ -356,8 +340,9 @@ class SyntaxService:
     def get_syntax_statistics(self) -> Dict[str, int]:
         """获取句法统计信息"""
         stats = {}
-        for stage, points in self.syntax_configs.items():
-            stats[stage] = len(points)
+        for stage, path in self._loaders.items():
+            if path.exists():
+                stats[stage] = len(self._get_stage(stage))
         
         stats["total"] = sum(stats.values())
         return stats
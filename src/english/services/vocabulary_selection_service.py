@@ -4,9 +4,87 @@
 根据学习阶段配置，选择合适的小学、初中、高中词库、词法和句法
 """
 
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, Mapping
+from types import MappingProxyType
 from pathlib import Path
-import json
+from functools import lru_cache, cached_property
+import os
+
+from src.english.services.word_data_service import SimpleWordService
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+# 按词性分词的词库所涵盖的全部词性
+_POS_LIST: Tuple[str, ...] = (
+    'noun', 'verb', 'adjective', 'adverb', 'preposition',
+    'pronoun', 'conjunction', 'article', 'determiner',
+    'interjection', 'numeral', 'modal', 'phrase', 'auxiliary'
+)
+
+# 学段 -> 词库文件名前缀
+_STAGE_PREFIX: Dict[str, str] = {
+    'elementary': '小学',
+    'junior_high': '初中',
+    'high_school': '高中'
+}
+
+@lru_cache(maxsize=256)
+def _load_pos_file_words(file_path: str) -> Tuple[Dict, ...]:
+    """读取单个词性词库文件的单词列表（按路径缓存）"""
+    with open(file_path, 'rb') as f:
+        data = _json_loads(f.read())
+    return tuple(data.get('words', []))
+
+# 学习阶段配置（只读，内外层均为MappingProxyType）
+_STAGE_CONFIGS: Mapping[str, Mapping] = MappingProxyType({
+    "第一阶段": MappingProxyType({
+        "name": "基础巩固 (小学中高年级)",
+        "vocab_ratios": MappingProxyType({"elementary": 1.0, "junior_high": 0.0, "high_school": 0.0}),
+        "morphology_ratios": MappingProxyType({"elementary": 1.0, "junior_high": 0.0, "high_school": 0.0}),
+        "syntax_ratios": MappingProxyType({"elementary": 1.0, "junior_high": 0.0, "high_school": 0.0})
+    }),
+    "第二阶段": MappingProxyType({
+        "name": "小学初中过渡 (小学高年级 - 初一)",
+        "vocab_ratios": MappingProxyType({"elementary": 0.6, "junior_high": 0.4, "high_school": 0.0}),
+        "morphology_ratios": MappingProxyType({"elementary": 0.7, "junior_high": 0.3, "high_school": 0.0}),
+        "syntax_ratios": MappingProxyType({"elementary": 0.7, "junior_high": 0.3, "high_school": 0.0})
+    }),
+    "第三阶段": MappingProxyType({
+        "name": "能力构建 (初中低年级)",
+        "vocab_ratios": MappingProxyType({"elementary": 0.3, "junior_high": 0.7, "high_school": 0.0}),
+        "morphology_ratios": MappingProxyType({"elementary": 0.2, "junior_high": 0.8, "high_school": 0.0}),
+        "syntax_ratios": MappingProxyType({"elementary": 0.2, "junior_high": 0.8, "high_school": 0.0})
+    }),
+    "第四阶段": MappingProxyType({
+        "name": "综合提升 (初中中高年级)",
+        "vocab_ratios": MappingProxyType({"elementary": 0.2, "junior_high": 0.8, "high_school": 0.0}),
+        "morphology_ratios": MappingProxyType({"elementary": 0.1, "junior_high": 0.9, "high_school": 0.0}),
+        "syntax_ratios": MappingProxyType({"elementary": 0.1, "junior_high": 0.9, "high_school": 0.0})
+    }),
+    "第五阶段": MappingProxyType({
+        "name": "初高中过渡 (初三 - 高一)",
+        "vocab_ratios": MappingProxyType({"elementary": 0.1, "junior_high": 0.55, "high_school": 0.35}),
+        "morphology_ratios": MappingProxyType({"elementary": 0.1, "junior_high": 0.45, "high_school": 0.45}),
+        "syntax_ratios": MappingProxyType({"elementary": 0.1, "junior_high": 0.45, "high_school": 0.45})
+    }),
+    "第六阶段": MappingProxyType({
+        "name": "精细打磨 (高中低年级)",
+        "vocab_ratios": MappingProxyType({"elementary": 0.1, "junior_high": 0.25, "high_school": 0.65}),
+        "morphology_ratios": MappingProxyType({"elementary": 0.1, "junior_high": 0.2, "high_school": 0.7}),
+        "syntax_ratios": MappingProxyType({"elementary": 0.1, "junior_high": 0.2, "high_school": 0.7})
+    }),
+    "第七阶段": MappingProxyType({
+        "name": "拔尖应用 (高中中高年级)",
+        "vocab_ratios": MappingProxyType({"elementary": 0.05, "junior_high": 0.15, "high_school": 0.8}),
+        "morphology_ratios": MappingProxyType({"elementary": 0.05, "junior_high": 0.15, "high_school": 0.8}),
+        "syntax_ratios": MappingProxyType({"elementary": 0.05, "junior_high": 0.15, "high_school": 0.8})
+    })
+})
 
 class VocabSelector:
     """词库选择器"""
@@ -23,143 +101,235 @@ class VocabSelector:
         else:
             self.config_dir = Path(config_dir)
         
-        # 加载词库统计数据
-        self.word_stats = self._load_word_statistics()
-        
-        # 阶段配置映射
-        self.stage_configs = {
-            "第一阶段": {
-                "name": "基础巩固 (小学中高年级)",
-                "vocab_ratios": {"elementary": 1.0, "junior_high": 0.0, "high_school": 0.0},
-                "morphology_ratios": {"elementary": 1.0, "junior_high": 0.0, "high_school": 0.0},
-                "syntax_ratios": {"elementary": 1.0, "junior_high": 0.0, "high_school": 0.0}
-            },
-            "第二阶段": {
-                "name": "小学初中过渡 (小学高年级 - 初一)",
-                "vocab_ratios": {"elementary": 0.6, "junior_high": 0.4, "high_school": 0.0},
-                "morphology_ratios": {"elementary": 0.7, "junior_high": 0.3, "high_school": 0.0},
-                "syntax_ratios": {"elementary": 0.7, "junior_high": 0.3, "high_school": 0.0}
-            },
-            "第三阶段": {
-                "name": "能力构建 (初中低年级)",
-                "vocab_ratios": {"elementary": 0.3, "junior_high": 0.7, "high_school": 0.0},
-                "morphology_ratios": {"elementary": 0.2, "junior_high": 0.8, "high_school": 0.0},
-                "syntax_ratios": {"elementary": 0.2, "junior_high": 0.8, "high_school": 0.0}
-            },
-            "第四阶段": {
-                "name": "综合提升 (初中中高年级)",
-                "vocab_ratios": {"elementary": 0.2, "junior_high": 0.8, "high_school": 0.0},
-                "morphology_ratios": {"elementary": 0.1, "junior_high": 0.9, "high_school": 0.0},
-                "syntax_ratios": {"elementary": 0.1, "junior_high": 0.9, "high_school": 0.0}
-            },
-            "第五阶段": {
-                "name": "初高中过渡 (初三 - 高一)",
-                "vocab_ratios": {"elementary": 0.1, "junior_high": 0.55, "high_school": 0.35},
-                "morphology_ratios": {"elementary": 0.1, "junior_high": 0.45, "high_school": 0.45},
-                "syntax_ratios": {"elementary": 0.1, "junior_high": 0.45, "high_school": 0.45}
-            },
-            "第六阶段": {
-                "name": "精细打磨 (高中低年级)",
-                "vocab_ratios": {"elementary": 0.1, "junior_high": 0.25, "high_school": 0.65},
-                "morphology_ratios": {"elementary": 0.1, "junior_high": 0.2, "high_school": 0.7},
-                "syntax_ratios": {"elementary": 0.1, "junior_high": 0.2, "high_school": 0.7}
-            },
-            "第七阶段": {
-                "name": "拔尖应用 (高中中高年级)",
-                "vocab_ratios": {"elementary": 0.05, "junior_high": 0.15, "high_school": 0.8},
-                "morphology_ratios": {"elementary": 0.05, "junior_high": 0.15, "high_school": 0.8},
-                "syntax_ratios": {"elementary": 0.05, "junior_high": 0.15, "high_school": 0.8}
-            }
-        }
+        # 阶段配置映射（模块级只读常量，各实例共享）
+        self.stage_configs = _STAGE_CONFIGS
+        
+        # 阶段名称 -> 阶段键的解析缓存，预置标准名称及其标题形式
+        self._stage_lookup: Dict[str, str] = {}
+        for stage_key in self.stage_configs:
+            self._stage_lookup[stage_key] = stage_key
+            self._stage_lookup[f"### {stage_key}"] = stage_key
+        
+        # 一次性列出按词性分词的词库目录，替代逐个文件的exists()检查
+        self._pos_vocab_dir = self.config_dir / 'word_configs' / 'classified_by_pos'
+        try:
+            self._classified_pos_files = set(os.listdir(self._pos_vocab_dir))
+        except FileNotFoundError:
+            self._classified_pos_files = set()
+        
+        # 阶段键 -> 按词性分组的词库文件完整路径（文件系统在运行期间视为不变）
+        self._pos_file_paths_cache: Dict[str, Dict[str, List[str]]] = {}
+        
+        # 阶段键 -> 各词性单词数量摘要
+        self._pos_words_summary_cache: Dict[str, Dict[str, int]] = {}
+    
+    @cached_property
+    def word_stats(self) -> Dict:
+        """词库统计数据（首次访问时加载）"""
+        return self._load_word_statistics()
+    
+    @cached_property
+    def _pos_table(self) -> Tuple[Tuple[str, ...], Tuple[Tuple[int, int, int], ...]]:
+        """三个学段的词性数量按统一的词性顺序对齐，供词性分布混合使用"""
+        return self._build_pos_matrix()
+    
+    @cached_property
+    def _precomputed(self) -> Dict[str, Dict]:
+        """各阶段资源数量（词库统计与阶段配置加载后不再变化，只计算一次）"""
+        return self._precompute_stage_resources()
+    
+    @cached_property
+    def _pos_words(self) -> Dict[Tuple[str, str], Tuple[Dict, ...]]:
+        """
+        所有按词性分词的单词列表（首次访问时一次性加载）
+        
+        Returns:
+            (学段, 词性) -> 单词元组
+        """
+        pos_words = {}
+        for level, prefix in _STAGE_PREFIX.items():
+            for pos in _POS_LIST:
+                file_name = f'{prefix}_{pos}_words.json'
+                if file_name not in self._classified_pos_files:
+                    continue
+                file_path = str(self._pos_vocab_dir / file_name)
+                try:
+                    pos_words[(level, pos)] = _load_pos_file_words(file_path)
+                except Exception as e:
+                    print(f"⚠️ 加载文件失败 {file_path}: {e}")
+        return pos_words
+    
+    def _active_levels(self, stage: str) -> List[str]:
+        """获取指定阶段词汇比例大于0的学段"""
+        config = self.get_stage_config(stage)
+        return [level for level in _STAGE_PREFIX if config['vocab_ratios'][level] > 0]
     
     def _load_word_statistics(self) -> Dict:
         """加载词库统计数据"""
-        import sys
-        from pathlib import Path
-        
-        # 添加项目根目录到Python路径
-        project_root = Path(__file__).parent.parent.parent.parent
-        sys.path.append(str(project_root))
-        
-        from src.english.services.word_data_service import SimpleWordService
         word_service = SimpleWordService()
         return word_service.get_learning_resource_statistics(show_stats=False)
     
-    def get_stage_config(self, stage: str) -> Dict:
+    def _resolve_stage_key(self, stage: str) -> str:
         """
-        获取指定阶段的配置
+        将阶段名称解析为阶段键（结果缓存）
         
         Args:
             stage: 学习阶段名称
             
         Returns:
-            阶段配置字典
+            阶段键，未匹配时为"第一阶段"
         """
+        stage_key = self._stage_lookup.get(stage)
+        if stage_key is not None:
+            return stage_key
+        
         # 清理阶段名称
         clean_stage = stage.replace('### ', '').strip()
         
-        # 查找匹配的阶段
-        for stage_key, config in self.stage_configs.items():
-            if stage_key in clean_stage:
-                return config
+        # 查找匹配的阶段，默认为第一阶段
+        stage_key = "第一阶段"
+        for key in self.stage_configs:
+            if key in clean_stage:
+                stage_key = key
+                break
         
-        # 默认返回第一阶段配置
-        return self.stage_configs["第一阶段"]
+        self._stage_lookup[stage] = stage_key
+        return stage_key
     
-    def calculate_stage_resources(self, stage: str) -> Tuple[int, int, int, Dict]:
+    def get_stage_config(self, stage: str) -> Mapping:
         """
-        计算指定阶段应该使用的资源数量
+        获取指定阶段的配置
         
         Args:
             stage: 学习阶段名称
             
         Returns:
-            (词汇总量, 词法总量, 句法总量, 词性分布)
+            阶段配置（只读映射）
         """
-        config = self.get_stage_config(stage)
+        return self.stage_configs[self._resolve_stage_key(stage)]
+    
+    def _precompute_stage_resources(self) -> Dict[str, Dict]:
+        """
+        预先计算所有阶段的资源数量
         
+        Returns:
+            阶段键 -> 资源数量字典
+        """
         # 获取基础数据
-        elementary_words = self.word_stats.get('words', {}).get('elementary', 0)
-        junior_high_words = self.word_stats.get('words', {}).get('junior_high', 0)
-        high_school_words = self.word_stats.get('words', {}).get('high_school', 0)
-        
-        elementary_morphology = self.word_stats.get('morphology', {}).get('elementary', 0)
-        junior_high_morphology = self.word_stats.get('morphology', {}).get('junior_high', 0)
-        high_school_morphology = self.word_stats.get('morphology', {}).get('high_school', 0)
-        
-        elementary_syntax = self.word_stats.get('syntax', {}).get('elementary', 0)
-        junior_high_syntax = self.word_stats.get('syntax', {}).get('junior_high', 0)
-        high_school_syntax = self.word_stats.get('syntax', {}).get('high_school', 0)
-        
-        # 计算词汇总量
-        vocab_total = int(
-            elementary_words * config['vocab_ratios']['elementary'] +
-            junior_high_words * config['vocab_ratios']['junior_high'] +
-            high_school_words * config['vocab_ratios']['high_school']
-        )
+        word_stats = self.word_stats
+        words = word_stats.get('words', {})
+        morphology = word_stats.get('morphology', {})
+        syntax = word_stats.get('syntax', {})
         
-        # 计算词法总量
-        morphology_total = int(
-            elementary_morphology * config['morphology_ratios']['elementary'] +
-            junior_high_morphology * config['morphology_ratios']['junior_high'] +
-            high_school_morphology * config['morphology_ratios']['high_school']
-        )
+        elementary_words = words.get('elementary', 0)
+        junior_high_words = words.get('junior_high', 0)
+        high_school_words = words.get('high_school', 0)
         
-        # 计算句法总量
-        syntax_total = int(
-            elementary_syntax * config['syntax_ratios']['elementary'] +
-            junior_high_syntax * config['syntax_ratios']['junior_high'] +
-            high_school_syntax * config['syntax_ratios']['high_school']
-        )
+        elementary_morphology = morphology.get('elementary', 0)
+        junior_high_morphology = morphology.get('junior_high', 0)
+        high_school_morphology = morphology.get('high_school', 0)
         
-        # 计算词性分布
-        pos_distribution = self._mix_pos_distributions(
-            config['vocab_ratios']['elementary'],
-            config['vocab_ratios']['junior_high'],
-            config['vocab_ratios']['high_school']
+        elementary_syntax = syntax.get('elementary', 0)
+        junior_high_syntax = syntax.get('junior_high', 0)
+        high_school_syntax = syntax.get('high_school', 0)
+        
+        precomputed = {}
+        for stage_key, config in self.stage_configs.items():
+            vocab_ratios = config['vocab_ratios']
+            morphology_ratios = config['morphology_ratios']
+            syntax_ratios = config['syntax_ratios']
+            
+            # 计算各阶段实际使用的数量
+            vocab_details = {
+                'elementary': int(elementary_words * vocab_ratios['elementary']),
+                'junior_high': int(junior_high_words * vocab_ratios['junior_high']),
+                'high_school': int(high_school_words * vocab_ratios['high_school']),
+                'total': 0
+            }
+            vocab_details['total'] = sum(vocab_details.values())
+            
+            morphology_details = {
+                'elementary': int(elementary_morphology * morphology_ratios['elementary']),
+                'junior_high': int(junior_high_morphology * morphology_ratios['junior_high']),
+                'high_school': int(high_school_morphology * morphology_ratios['high_school']),
+                'total': 0
+            }
+            morphology_details['total'] = sum(morphology_details.values())
+            
+            syntax_details = {
+                'elementary': int(elementary_syntax * syntax_ratios['elementary']),
+                'junior_high': int(junior_high_syntax * syntax_ratios['junior_high']),
+                'high_school': int(high_school_syntax * syntax_ratios['high_school']),
+                'total': 0
+            }
+            syntax_details['total'] = sum(syntax_details.values())
+            
+            precomputed[stage_key] = {
+                # 词汇、词法、句法总量
+                'vocab_total': int(
+                    elementary_words * vocab_ratios['elementary'] +
+                    junior_high_words * vocab_ratios['junior_high'] +
+                    high_school_words * vocab_ratios['high_school']
+                ),
+                'morphology_total': int(
+                    elementary_morphology * morphology_ratios['elementary'] +
+                    junior_high_morphology * morphology_ratios['junior_high'] +
+                    high_school_morphology * morphology_ratios['high_school']
+                ),
+                'syntax_total': int(
+                    elementary_syntax * syntax_ratios['elementary'] +
+                    junior_high_syntax * syntax_ratios['junior_high'] +
+                    high_school_syntax * syntax_ratios['high_school']
+                ),
+                'vocab_details': vocab_details,
+                'morphology_details': morphology_details,
+                'syntax_details': syntax_details,
+                # 词性分布
+                'pos_distribution': self._mix_pos_distributions(
+                    vocab_ratios['elementary'],
+                    vocab_ratios['junior_high'],
+                    vocab_ratios['high_school']
+                )
+            }
+        
+        return precomputed
+    
+    def calculate_stage_resources(self, stage: str) -> Tuple[int, int, int, Dict]:
+        """
+        计算指定阶段应该使用的资源数量
+        
+        Args:
+            stage: 学习阶段名称
+            
+        Returns:
+            (词汇总量, 词法总量, 句法总量, 词性分布)
+        """
+        resources = self._precomputed[self._resolve_stage_key(stage)]
+        return (
+            resources['vocab_total'],
+            resources['morphology_total'],
+            resources['syntax_total'],
+            dict(resources['pos_distribution'])
         )
+    
+    def _build_pos_matrix(self) -> Tuple[Tuple[str, ...], Tuple[Tuple[int, int, int], ...]]:
+        """
+        构建对齐的词性数量矩阵
         
-        return vocab_total, morphology_total, syntax_total, pos_distribution
+        Returns:
+            (词性列表, 每个词性对应的(小学, 初中, 高中)数量)
+        """
+        pos_distribution = self.word_stats.get('pos_distribution', {})
+        elementary_pos = pos_distribution.get('elementary', {})
+        junior_high_pos = pos_distribution.get('junior_high', {})
+        high_school_pos = pos_distribution.get('high_school', {})
+        
+        pos_keys = tuple(sorted(set(elementary_pos) | set(junior_high_pos) | set(high_school_pos)))
+        pos_matrix = tuple(
+            (elementary_pos.get(pos, 0), junior_high_pos.get(pos, 0), high_school_pos.get(pos, 0))
+            for pos in pos_keys
+        )
+        return pos_keys, pos_matrix
     
     def _mix_pos_distributions(self, elementary_ratio: float, junior_high_ratio: float, high_school_ratio: float) -> Dict:
         """
@@ -173,25 +343,16 @@ class VocabSelector:
         Returns:
             混合后的词性分布字典
         """
-        elementary_pos = self.word_stats.get('pos_distribution', {}).get('elementary', {})
-        junior_high_pos = self.word_stats.get('pos_distribution', {}).get('junior_high', {})
-        high_school_pos = self.word_stats.get('pos_distribution', {}).get('high_school', {})
-        
-        mixed = {}
-        all_pos = set(elementary_pos.keys()) | set(junior_high_pos.keys()) | set(high_school_pos.keys())
-        
-        for pos in all_pos:
-            count_elementary = elementary_pos.get(pos, 0)
-            count_junior_high = junior_high_pos.get(pos, 0)
-            count_high_school = high_school_pos.get(pos, 0)
-            
-            mixed[pos] = int(
+        pos_keys, pos_matrix = self._pos_table
+        return {
+            pos: int(
                 count_elementary * elementary_ratio +
                 count_junior_high * junior_high_ratio +
                 count_high_school * high_school_ratio
             )
-        
-        return mixed
+            for pos, (count_elementary, count_junior_high, count_high_school)
+            in zip(pos_keys, pos_matrix)
+        }
     
     def get_stage_vocab_details(self, stage: str) -> Dict:
         """
@@ -203,59 +364,19 @@ class VocabSelector:
         Returns:
             包含各阶段词库详细信息的字典
         """
-        config = self.get_stage_config(stage)
-        
-        # 获取基础数据
-        elementary_words = self.word_stats.get('words', {}).get('elementary', 0)
-        junior_high_words = self.word_stats.get('words', {}).get('junior_high', 0)
-        high_school_words = self.word_stats.get('words', {}).get('high_school', 0)
-        
-        elementary_morphology = self.word_stats.get('morphology', {}).get('elementary', 0)
-        junior_high_morphology = self.word_stats.get('morphology', {}).get('junior_high', 0)
-        high_school_morphology = self.word_stats.get('morphology', {}).get('high_school', 0)
-        
-        elementary_syntax = self.word_stats.get('syntax', {}).get('elementary', 0)
-        junior_high_syntax = self.word_stats.get('syntax', {}).get('junior_high', 0)
-        high_school_syntax = self.word_stats.get('syntax', {}).get('high_school', 0)
-        
-        # 计算各阶段实际使用的数量
-        vocab_details = {
-            'elementary': int(elementary_words * config['vocab_ratios']['elementary']),
-            'junior_high': int(junior_high_words * config['vocab_ratios']['junior_high']),
-            'high_school': int(high_school_words * config['vocab_ratios']['high_school']),
-            'total': 0
-        }
-        vocab_details['total'] = sum(vocab_details.values())
-        
-        morphology_details = {
-            'elementary': int(elementary_morphology * config['morphology_ratios']['elementary']),
-            'junior_high': int(junior_high_morphology * config['morphology_ratios']['junior_high']),
-            'high_school': int(high_school_morphology * config['morphology_ratios']['high_school']),
-            'total': 0
-        }
-        morphology_details['total'] = sum(morphology_details.values())
-        
-        syntax_details = {
-            'elementary': int(elementary_syntax * config['syntax_ratios']['elementary']),
-            'junior_high': int(junior_high_syntax * config['syntax_ratios']['junior_high']),
-            'high_school': int(high_school_syntax * config['syntax_ratios']['high_school']),
-            'total': 0
-        }
-        syntax_details['total'] = sum(syntax_details.values())
+        stage_key = self._resolve_stage_key(stage)
+        config = self.stage_configs[stage_key]
+        resources = self._precomputed[stage_key]
         
         return {
             'stage_name': config['name'],
-            'vocab_ratios': config['vocab_ratios'],
-            'morphology_ratios': config['morphology_ratios'],
-            'syntax_ratios': config['syntax_ratios'],
-            'vocab_details': vocab_details,
-            'morphology_details': morphology_details,
-            'syntax_details': syntax_details,
-            'pos_distribution': self._mix_pos_distributions(
-                config['vocab_ratios']['elementary'],
-                config['vocab_ratios']['junior_high'],
-                config['vocab_ratios']['high_school']
-            )
+            'vocab_ratios': dict(config['vocab_ratios']),
+            'morphology_ratios': dict(config['morphology_ratios']),
+            'syntax_ratios': dict(config['syntax_ratios']),
+            'vocab_details': dict(resources['vocab_details']),
+            'morphology_details': dict(resources['morphology_details']),
+            'syntax_details': dict(resources['syntax_details']),
+            'pos_distribution': dict(resources['pos_distribution'])
         }
     
     def list_all_stages(self) -> List[Dict]:
@@ -270,9 +391,9 @@ class VocabSelector:
             stages.append({
                 'key': stage_key,
                 'name': config['name'],
-                'vocab_ratios': config['vocab_ratios'],
-                'morphology_ratios': config['morphology_ratios'],
-                'syntax_ratios': config['syntax_ratios']
+                'vocab_ratios': dict(config['vocab_ratios']),
+                'morphology_ratios': dict(config['morphology_ratios']),
+                'syntax_ratios': dict(config['syntax_ratios'])
             })
         return stages
     
@@ -314,27 +435,12 @@ class VocabSelector:
         config = self.get_stage_config(stage)
         pos_vocab_files = {}
         
-        # 定义所有词性
-        pos_list = [
-            'noun', 'verb', 'adjective', 'adverb', 'preposition', 
-            'pronoun', 'conjunction', 'article', 'determiner', 
-            'interjection', 'numeral', 'modal', 'phrase', 'auxiliary'
-        ]
-        
         # 为每个词性确定需要加载的文件
-        for pos in pos_list:
-            pos_files = []
-            
-            if config['vocab_ratios']['elementary'] > 0:
-                pos_files.append(f'word_configs/classified_by_pos/小学_{pos}_words.json')
-            
-            if config['vocab_ratios']['junior_high'] > 0:
-                pos_files.append(f'word_configs/classified_by_pos/初中_{pos}_words.json')
-            
-            if config['vocab_ratios']['high_school'] > 0:
-                pos_files.append(f'word_configs/classified_by_pos/高中_{pos}_words.json')
-            
-            pos_vocab_files[pos] = pos_files
+        prefixes = [prefix for level, prefix in _STAGE_PREFIX.items() if config['vocab_ratios'][level] > 0]
+        for pos in _POS_LIST:
+            pos_vocab_files[pos] = [
+                f'word_configs/classified_by_pos/{prefix}_{pos}_words.json' for prefix in prefixes
+            ]
         
         return pos_vocab_files
     
@@ -348,37 +454,27 @@ class VocabSelector:
         Returns:
             按词性分组的词库文件完整路径字典
         """
-        config = self.get_stage_config(stage)
-        pos_file_paths = {}
+        stage_key = self._resolve_stage_key(stage)
+        cached = self._pos_file_paths_cache.get(stage_key)
+        if cached is not None:
+            return cached
         
-        # 定义所有词性
-        pos_list = [
-            'noun', 'verb', 'adjective', 'adverb', 'preposition', 
-            'pronoun', 'conjunction', 'article', 'determiner', 
-            'interjection', 'numeral', 'modal', 'phrase', 'auxiliary'
-        ]
+        config = self.stage_configs[stage_key]
+        pos_file_paths = {}
         
         # 为每个词性确定需要加载的文件完整路径
-        for pos in pos_list:
+        prefixes = [prefix for level, prefix in _STAGE_PREFIX.items() if config['vocab_ratios'][level] > 0]
+        for pos in _POS_LIST:
             pos_files = []
             
-            if config['vocab_ratios']['elementary'] > 0:
-                file_path = self.config_dir / 'word_configs' / 'classified_by_pos' / f'小学_{pos}_words.json'
-                if file_path.exists():
-                    pos_files.append(str(file_path))
-            
-            if config['vocab_ratios']['junior_high'] > 0:
-                file_path = self.config_dir / 'word_configs' / 'classified_by_pos' / f'初中_{pos}_words.json'
-                if file_path.exists():
-                    pos_files.append(str(file_path))
-            
-            if config['vocab_ratios']['high_school'] > 0:
-                file_path = self.config_dir / 'word_configs' / 'classified_by_pos' / f'高中_{pos}_words.json'
-                if file_path.exists():
-                    pos_files.append(str(file_path))
+            for prefix in prefixes:
+                file_name = f'{prefix}_{pos}_words.json'
+                if file_name in self._classified_pos_files:
+                    pos_files.append(str(self._pos_vocab_dir / file_name))
             
             pos_file_paths[pos] = pos_files
         
+        self._pos_file_paths_cache[stage_key] = pos_file_paths
         return pos_file_paths
     
     def load_pos_words(self, stage: str, pos: str) -> List[Dict]:
@@ -392,17 +488,11 @@ class VocabSelector:
         Returns:
             单词列表
         """
-        pos_file_paths = self.get_pos_vocab_file_paths(stage)
+        pos_words = self._pos_words
         all_words = []
         
-        for file_path in pos_file_paths.get(pos, []):
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    words = data.get('words', [])
-                    all_words.extend(words)
-            except Exception as e:
-                print(f"⚠️ 加载文件失败 {file_path}: {e}")
+        for level in self._active_levels(stage):
+            all_words.extend(pos_words.get((level, pos), ()))
         
         return all_words
     
@@ -417,8 +507,8 @@ class VocabSelector:
         Returns:
             单词数量
         """
-        words = self.load_pos_words(stage, pos)
-        return len(words)
+        pos_words = self._pos_words
+        return sum(len(pos_words.get((level, pos), ())) for level in self._active_levels(stage))
     
     def get_stage_pos_words_summary(self, stage: str) -> Dict[str, int]:
         """
@@ -430,17 +520,13 @@ class VocabSelector:
         Returns:
             各词性单词数量字典
         """
-        pos_list = [
-            'noun', 'verb', 'adjective', 'adverb', 'preposition', 
-            'pronoun', 'conjunction', 'article', 'determiner', 
-            'interjection', 'numeral', 'modal', 'phrase', 'auxiliary'
-        ]
-        
-        pos_counts = {}
-        for pos in pos_list:
-            pos_counts[pos] = self.get_pos_words_count(stage, pos)
+        stage_key = self._resolve_stage_key(stage)
+        cached = self._pos_words_summary_cache.get(stage_key)
+        if cached is None:
+            cached = {pos: self.get_pos_words_count(stage_key, pos) for pos in _POS_LIST}
+            self._pos_words_summary_cache[stage_key] = cached
         
-        return pos_counts
+        return dict(cached)
     
     def get_available_morphology_files(self, stage: str) -> List[str]:
         """
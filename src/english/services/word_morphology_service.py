@@ -5,14 +5,45 @@
 管理词法数据和学习进度
 """
 
-import json
+import copy
+import random
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 
-@dataclass
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+# 中文阶段名 <-> 阶段键
+_STAGE_ZH_TO_KEY = {
+    "小学": "elementary",
+    "初中": "junior_high",
+    "高中": "high_school"
+}
+_STAGE_KEY_TO_ZH = {v: k for k, v in _STAGE_ZH_TO_KEY.items()}
+
+# 搜索索引中的最大n-gram长度
+_SEARCH_GRAM_SIZE = 3
+
+# 各学习阶段对应的词法配置文件
+_STAGE_FILES = [
+    ("elementary", "小学词法.json"),
+    ("junior_high", "初中词法.json"),
+    ("high_school", "高中词法.json")
+]
+
+@dataclass(frozen=True)
 class MorphologyPoint:
-    """词法点数据类"""
+    """词法点数据类（不可变，实例在各调用间共享）"""
+    # 手动声明__slots__以兼容Python 3.10以下版本（dataclass的slots参数需要3.10+）
+    __slots__ = ("id", "name", "category", "description", "examples", "difficulty", "stage")
+    
     id: str
     name: str
     category: str
@@ -27,53 +58,76 @@ class MorphologyService:
     def __init__(self, config_dir: str = "src/english/config"):
         self.config_dir = Path(config_dir)
         self.morphology_configs = self._load_morphology_configs()
+        self._search_index = self._build_search_index()
+        self._by_category = self._build_category_index()
+        # 词法配置加载后不再变化，预先构建各阶段的MorphologyPoint列表
+        self._points_cache: Dict[str, List[MorphologyPoint]] = {
+            stage: self._build_morphology_points(stage) for stage in _STAGE_ZH_TO_KEY
+        }
+        self._detailed_stats = self._build_detailed_statistics()
     
     def _load_morphology_configs(self) -> Dict[str, List[Dict]]:
-        """加载词法配置"""
+        """加载词法配置（各阶段文件并发读取）"""
         morphology_configs = {}
         
-        # 加载小学词法
-        elementary_file = self.config_dir / "morphology_configs" / "小学词法.json"
-        if elementary_file.exists():
-            try:
-                with open(elementary_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # 从实际配置文件中提取词法点
-                    morphology_points = self._extract_morphology_points(data)
-                    morphology_configs["elementary"] = morphology_points
-            except Exception as e:
-                print(f"⚠️ 加载小学词法失败: {e}")
-                morphology_configs["elementary"] = []
-        
-        # 加载初中词法
-        junior_file = self.config_dir / "morphology_configs" / "初中词法.json"
-        if junior_file.exists():
-            try:
-                with open(junior_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    morphology_points = self._extract_morphology_points(data)
-                    morphology_configs["junior_high"] = morphology_points
-            except Exception as e:
-                print(f"⚠️ 加载初中词法失败: {e}")
-                morphology_configs["junior_high"] = []
-        
-        # 加载高中词法
-        senior_file = self.config_dir / "morphology_configs" / "高中词法.json"
-        if senior_file.exists():
-            try:
-                with open(senior_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    morphology_points = self._extract_morphology_points(data)
-                    morphology_configs["high_school"] = morphology_points
-            except Exception as e:
-                print(f"⚠️ 加载高中词法失败: {e}")
-                morphology_configs["high_school"] = []
+        with ThreadPoolExecutor(max_workers=len(_STAGE_FILES)) as executor:
+            futures = [
+                (stage_key, executor.submit(self._load_morphology_file, filename))
+                for stage_key, filename in _STAGE_FILES
+            ]
+            for stage_key, future in futures:
+                morphology_points = future.result()
+                if morphology_points is not None:
+                    morphology_configs[stage_key] = morphology_points
         
         return morphology_configs
     
+    def _load_morphology_file(self, filename: str) -> Optional[List[Dict]]:
+        """加载单个词法配置文件，文件不存在时返回None"""
+        file_path = self.config_dir / "morphology_configs" / filename
+        if not file_path.exists():
+            return None
+        try:
+            with open(file_path, 'rb') as f:
+                data = _json_loads(f.read())
+            # 从实际配置文件中提取词法点
+            return self._extract_morphology_points(data)
+        except Exception as e:
+            print(f"⚠️ 加载{file_path.stem}失败: {e}")
+            return []
+    
+    def _build_category_index(self) -> Dict[Tuple[str, str], List[int]]:
+        """构建 (阶段键, 分类) -> 词法点下标列表 的索引"""
+        by_category: Dict[Tuple[str, str], List[int]] = {}
+        for stage_key, points_data in self.morphology_configs.items():
+            for idx, point_data in enumerate(points_data):
+                by_category.setdefault((stage_key, point_data.get("category", "")), []).append(idx)
+        return by_category
+    
+    def _build_search_index(self) -> Dict[str, Dict[str, Set[int]]]:
+        """
+        构建词法点搜索索引
+        
+        对每个阶段，将名称、描述、分类的小写文本按1~3字符的n-gram
+        映射到词法点下标集合
+        """
+        search_index = {}
+        for stage_key, points_data in self.morphology_configs.items():
+            index: Dict[str, Set[int]] = {}
+            for idx, point_data in enumerate(points_data):
+                for field in ("name", "description", "category"):
+                    text = point_data.get(field, "").lower()
+                    for size in range(1, _SEARCH_GRAM_SIZE + 1):
+                        for start in range(len(text) - size + 1):
+                            index.setdefault(text[start:start + size], set()).add(idx)
+            search_index[stage_key] = index
+        return search_index
+    
     def _extract_morphology_points(self, data: Dict) -> List[Dict]:
         """从配置文件中提取词法点"""
         morphology_points = []
+        append_point = morphology_points.append
+        idx = 0
         
         # 遍历配置文件中的词性部分
         for key, value in data.items():
@@ -81,75 +135,80 @@ class MorphologyService:
                 parts_of_speech = value["parts_of_speech"]
                 if isinstance(parts_of_speech, list):
                     for pos in parts_of_speech:
+                        pos_name = pos.get("pos_name", "")
+                        
                         # 创建词法点
-                        point = {
-                            "id": f"{pos.get('pos_name', '')}_{len(morphology_points)}",
-                            "name": pos.get("pos_name", ""),
+                        append_point({
+                            "id": f"{pos_name}_{idx}",
+                            "name": pos_name,
                             "category": "词性",
                             "description": pos.get("pos_description", ""),
                             "examples": pos.get("learning_focus", []),
                             "difficulty": "elementary",
                             "stage": "elementary"
-                        }
-                        morphology_points.append(point)
+                        })
+                        idx += 1
                         
                         # 处理形式变化
-                        if "form_changes" in pos and isinstance(pos["form_changes"], list):
-                            for change in pos["form_changes"]:
-                                change_point = {
-                                    "id": f"{change.get('change_type', '')}_{len(morphology_points)}",
-                                    "name": change.get("change_type", ""),
+                        form_changes = pos.get("form_changes")
+                        if isinstance(form_changes, list):
+                            for change in form_changes:
+                                change_type = change.get("change_type", "")
+                                append_point({
+                                    "id": f"{change_type}_{idx}",
+                                    "name": change_type,
                                     "category": "形式变化",
                                     "description": change.get("description", ""),
                                     "examples": change.get("rules_examples", []),
                                     "difficulty": "elementary",
                                     "stage": "elementary"
-                                }
-                                morphology_points.append(change_point)
+                                })
+                                idx += 1
         
         return morphology_points
     
     def get_morphology_count(self, stage: str) -> int:
         """获取指定阶段的词法点数量"""
-        stage_mapping = {
-            "小学": "elementary",
-            "初中": "junior_high", 
-            "高中": "high_school"
-        }
-        
-        stage_key = stage_mapping.get(stage, "elementary")
+        stage_key = _STAGE_ZH_TO_KEY.get(stage, "elementary")
         return len(self.morphology_configs.get(stage_key, []))
     
     def get_morphology_points(self, stage: str) -> List[MorphologyPoint]:
         """获取指定阶段的词法点列表"""
-        stage_mapping = {
-            "小学": "elementary",
-            "初中": "junior_high",
-            "高中": "high_school"
-        }
-        
-        stage_key = stage_mapping.get(stage, "elementary")
+        cached = self._points_cache.get(stage)
+        if cached is not None:
+            return list(cached)
+        return self._build_morphology_points(stage)
+    
+    def _build_morphology_points(self, stage: str) -> List[MorphologyPoint]:
+        """根据词法配置构建指定阶段的词法点列表"""
+        stage_key = _STAGE_ZH_TO_KEY.get(stage, "elementary")
         points_data = self.morphology_configs.get(stage_key, [])
         
-        morphology_points = []
-        for point_data in points_data:
-            point = MorphologyPoint(
-                id=point_data.get("id", ""),
-                name=point_data.get("name", ""),
-                category=point_data.get("category", ""),
-                description=point_data.get("description", ""),
-                examples=point_data.get("examples", []),
-                difficulty=point_data.get("difficulty", ""),
-                stage=stage
-            )
-            morphology_points.append(point)
-        
-        return morphology_points
+        return [self._to_morphology_point(point_data, stage) for point_data in points_data]
+    
+    def _to_morphology_point(self, point_data: Dict, stage: str) -> MorphologyPoint:
+        """将词法点字典转换为MorphologyPoint"""
+        return MorphologyPoint(
+            id=point_data.get("id", ""),
+            name=point_data.get("name", ""),
+            category=point_data.get("category", ""),
+            description=point_data.get("description", ""),
+            examples=point_data.get("examples", []),
+            difficulty=point_data.get("difficulty", ""),
+            stage=stage
+        )
     
     def get_morphology_by_category(self, stage: str, category: str) -> List[MorphologyPoint]:
         """根据分类获取词法点"""
-        all_points = self.get_morphology_points(stage)
-        return [point for point in all_points if point.category == category]
+        stage_key = _STAGE_ZH_TO_KEY.get(stage, "elementary")
+        indices = self._by_category.get((stage_key, category), [])
+        
+        cached_points = self._points_cache.get(stage)
+        if cached_points is not None:
+            return [cached_points[idx] for idx in indices]
+        
+        points_data = self.morphology_configs.get(stage_key, [])
+        return [self._to_morphology_point(points_data[idx], stage) for idx in indices]
     
     def get_morphology_statistics(self) -> Dict[str, int]:
         """获取词法统计信息"""
@@ -162,15 +221,35 @@ class MorphologyService:
     
     def search_morphology(self, stage: str, keyword: str) -> List[MorphologyPoint]:
         """搜索词法点"""
-        all_points = self.get_morphology_points(stage)
+        stage_key = _STAGE_ZH_TO_KEY.get(stage, "elementary")
+        points_data = self.morphology_configs.get(stage_key, [])
         keyword_lower = keyword.lower()
         
+        if keyword_lower:
+            # 通过n-gram索引求交得到候选词法点，再做精确的子串校验
+            index = self._search_index.get(stage_key, {})
+            size = min(len(keyword_lower), _SEARCH_GRAM_SIZE)
+            candidates: Optional[Set[int]] = None
+            for start in range(len(keyword_lower) - size + 1):
+                hits = index.get(keyword_lower[start:start + size], set())
+                candidates = hits if candidates is None else candidates & hits
+                if not candidates:
+                    return []
+            hit_indices = sorted(candidates)
+        else:
+            hit_indices = range(len(points_data))
+        
+        cached_points = self._points_cache.get(stage)
         results = []
-        for point in all_points:
-            if (keyword_lower in point.name.lower() or 
-                keyword_lower in point.description.lower() or
-                keyword_lower in point.category.lower()):
-                results.append(point)
+        for idx in hit_indices:
+            point_data = points_data[idx]
+            if (keyword_lower in point_data.get("name", "").lower() or
+                keyword_lower in point_data.get("description", "").lower() or
+                keyword_lower in point_data.get("category", "").lower()):
+                if cached_points is not None:
+                    results.append(cached_points[idx])
+                else:
+                    results.append(self._to_morphology_point(point_data, stage))
         
         return results
     
@@ -186,33 +265,30 @@ class MorphologyService:
     
     def get_detailed_morphology_statistics(self) -> Dict[str, Any]:
         """获取详细的词法统计信息"""
+        return copy.deepcopy(self._detailed_stats)
+    
+    def _build_detailed_statistics(self) -> Dict[str, Any]:
+        """统计各阶段、各分类的词法点数量（词法配置加载后只计算一次）"""
         stats = {
             "total_points": 0,
             "by_stage": {},
             "by_category": {}
         }
+        by_category = Counter()
         
         # 按阶段统计
-        for stage in ["小学", "初中", "高中"]:
-            points = self.get_morphology_points(stage)
+        for stage, points in self._points_cache.items():
+            # 按类别统计
+            categories = Counter(point.category for point in points)
+            by_category.update(categories)
+            
             stats["by_stage"][stage] = {
                 "count": len(points),
-                "categories": {}
+                "categories": dict(categories)
             }
-            
-            # 按类别统计
-            for point in points:
-                category = point.category
-                if category not in stats["by_category"]:
-                    stats["by_category"][category] = 0
-                stats["by_category"][category] += 1
-                
-                if category not in stats["by_stage"][stage]["categories"]:
-                    stats["by_stage"][stage]["categories"][category] = 0
-                stats["by_stage"][stage]["categories"][category] += 1
-            
             stats["total_points"] += len(points)
         
+        stats["by_category"] = dict(by_category)
         return stats
     
     def get_morphology_content(self, stage_key: str, day: int, count: int = 2) -> Dict:
@@ -228,24 +304,17 @@ class MorphologyService:
             Dict: 包含词法学习点的字典
         """
         # 映射阶段键值到中文阶段名
-        stage_mapping = {
-            "elementary": "小学",
-            "junior_high": "初中", 
-            "high_school": "高中"
-        }
-        
-        stage = stage_mapping.get(stage_key, "小学")
+        stage = _STAGE_KEY_TO_ZH.get(stage_key, "小学")
         morphology_points = self.get_morphology_points(stage)
         
         if not morphology_points:
             return {"learning_points": []}
         
-        # 使用天数作为种子，确保相同天数生成相同内容
-        import random
-        random.seed(day * 100)
+        # 使用天数作为种子的局部随机数生成器，确保相同天数生成相同内容且不影响全局随机状态
+        rng = random.Random(day * 100)
         
         # 随机选择指定数量的词法点
-        selected_points = random.sample(morphology_points, min(count, len(morphology_points)))
+        selected_points = rng.sample(morphology_points, min(count, len(morphology_points)))
         
         # 转换为字典格式
         learning_points = []
@@ -15,18 +15,392 @@
 - 支持多种题型（选择题、翻译题、填空题）的提示词生成
 """
 
+import re
 import sys
 import json
+import hashlib
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from functools import lru_cache, cached_property
+from itertools import chain
+from typing import Dict, List, Mapping, Optional, Tuple
 
-# 添加项目根目录到Python路径
+# 添加项目根目录及本模块目录到Python路径（仅在导入时执行一次，避免重复追加）
 project_root = Path(__file__).parent.parent.parent.parent
-sys.path.append(str(project_root))
+for _path in (str(project_root), str(Path(__file__).parent)):
+    if _path not in sys.path:
+        sys.path.append(_path)
 
 from src.shared.ai_framework.unified_ai_client import UnifiedAIClient, AIModel
 
+# 阶段标题行：以"第"开头，含"阶段："及学段名
+_STAGE_HEADER_RE = re.compile(r'^第(?=.*阶段：)(?=.*(?:小学|初中|高中))')
+
+# 占比段落标题：单独一行的"词汇/词法/句法"，或同时含"总占比"的标题行（词汇 > 词法 > 句法 优先）
+_SECTION_RE = re.compile(r'^(?:(词汇|词法|句法)$|(?=.*总占比)(?:(?=.*(词汇))|(?=.*(词法))|(?=.*(句法))))')
+_SECTION_KEYS = {'词汇': 'vocabulary', '词法': 'morphology', '句法': 'syntax'}
+
+# 占比行：标签 + 百分比
+_RATIO_RE = re.compile(r'^(小学词库|小学词法|小学句法|小学|初中|高中)：\s*(\d+)\s*%?$')
+# 标签 -> (固定段落, 学段)；固定段落为None时使用当前段落
+_RATIO_LABELS = {
+    '小学': (None, 'elementary'),
+    '初中': (None, 'junior_high'),
+    '高中': (None, 'high_school'),
+    # 第一阶段的特殊格式
+    '小学词库': ('vocabulary', 'elementary'),
+    '小学词法': ('morphology', 'elementary'),
+    '小学句法': ('syntax', 'elementary'),
+}
+
+# 未知阶段的默认占比（只读）
+_EMPTY_RATIOS = MappingProxyType({
+    section: MappingProxyType({'elementary': 0, 'junior_high': 0, 'high_school': 0})
+    for section in ('vocabulary', 'morphology', 'syntax')
+})
+_EMPTY_STAGE = MappingProxyType({'content': '', 'ratios': _EMPTY_RATIOS})
+
+# stage.md 中的变量名 -> (统计类别, 学段)
+_STAGE_VARIABLES = {
+    'elementary_total_words': ('words', 'elementary'),
+    'middle_school_total_words': ('words', 'junior_high'),
+    'high_school_total_words': ('words', 'high_school'),
+    'elementary_total_grammar': ('syntax', 'elementary'),
+    'middle_school_total_grammar': ('syntax', 'junior_high'),
+    'high_school_total_grammar': ('syntax', 'high_school'),
+    'elementary_total_morphology': ('morphology', 'elementary'),
+    'middle_school_total_morphology': ('morphology', 'junior_high'),
+    'high_school_total_morphology': ('morphology', 'high_school'),
+}
+_STAGE_VARIABLE_RE = re.compile(r'\{(' + '|'.join(map(re.escape, _STAGE_VARIABLES)) + r')\}')
+
+def _extract_words(words: List) -> List[str]:
+    """
+    从单词列表中提取单词文本
+    
+    Args:
+        words (List): 单词字典（含 word 字段）或单词字符串的列表
+        
+    Returns:
+        List[str]: 单词文本列表
+    """
+    if not words:
+        return []
+    # 单词列表通常类型一致，按首个元素的类型走快速路径
+    if isinstance(words[0], dict):
+        try:
+            return [word.get('word', '') for word in words]
+        except AttributeError:
+            pass
+    else:
+        if not any(isinstance(word, dict) for word in words):
+            return [str(word) for word in words]
+    # 混合类型时逐个判断
+    return [word.get('word', '') if isinstance(word, dict) else str(word) for word in words]
+
+def _normalize_items(obj, items_key: str) -> List:
+    """
+    将每日词法/句法数据展开为学习条目列表
+    
+    Args:
+        obj: 字典（可含 learning_points）或列表（元素可含 items_key 或 learning_points）
+        items_key (str): 列表元素中的条目键，如 morphology_items、syntax_items
+        
+    Returns:
+        List: 学习条目列表
+    """
+    if isinstance(obj, dict):
+        # 字典：优先取learning_points，否则将整个字典作为一个条目
+        if 'learning_points' in obj:
+            return list(obj['learning_points'])
+        return [obj]
+    if not isinstance(obj, list):
+        return []
+    
+    items = []
+    for entry in obj:
+        if isinstance(entry, dict):
+            if items_key in entry:
+                items.extend(entry[items_key])
+                continue
+            if 'learning_points' in entry:
+                items.extend(entry['learning_points'])
+                continue
+        items.append(entry)
+    return items
+
+# FSRS模板提示词的整体框架，各段内容由 _build_fsrs_prompt 填充
+_FSRS_TEMPLATE = """你是精通 FSRS 的语言学习策略师。
+
+## 目标与范围
+{objective_scope}
+
+## 输入参数
+{input_params}
+
+## 词类分组映射
+{category_mapping}
+
+## JSON 结构与键名规范
+{json_schema}
+
+## metadata 填充规则
+{metadata_rules}
+
+## FSRS 初始参数计算
+{fsrs_params}
+
+## 时间预算与优先级
+{time_budget}
+
+## 词汇日均分配
+{word_allocation}
+
+## 词法/句法单位与轮转
+{morph_syntax_allocation}
+
+## 新词构成比例
+{pos_composition}
+
+## 建议练习分钟数
+{practice_minutes_rules}
+
+## 示例复习条目占位
+{example_item}
+
+## 边界与校验
+{boundary_checks}
+
+## 实现提示语格式
+{single_line_note}
+
+## card_template格式规范
+{card_template_specification}
+
+## FSRS标准格式要求
+{fsrs_standard_format}
+
+基于以上所有规则，立即生成符合FSRS标准格式要求的JSON对象："""
+
+@lru_cache(maxsize=64)
+def _dumps_pos(pos_items: Tuple) -> str:
+    """将词性分布序列化为紧凑JSON（按 (词性, 数量, 数量类型) 元组缓存，保持原有键顺序）"""
+    return json.dumps({pos: count for pos, count, _ in pos_items}, separators=(',', ':'))
+
+# typed=True：1 与 1.0 在提示词中的写法不同，不能共用缓存
+@lru_cache(maxsize=256, typed=True)
+def _build_fsrs_prompt(total_days: int, daily_minutes: int, pos_items: Tuple,
+                       morphology_total: int, syntax_total: int, stage: str,
+                       learning_efficiency: float, review_efficiency: float,
+                       morphology_time: int, syntax_time: int) -> str:
+    """
+    构建FSRS模板提示词（结果只取决于参数，按参数缓存）
+    
+    Args:
+        pos_items (Tuple): 词性分布的 (词性, 数量, 数量类型) 元组，其余参数同 generate_fsrs_template_prompt
+        
+    Returns:
+        str: 完整的FSRS模板适配AI提示词
+    """
+    # 还原词性分布（保持原有键顺序）并计算总词汇量
+    pos_distribution = {pos: count for pos, count, _ in pos_items}
+    total_vocab = sum(pos_distribution.values())
+    
+    # 构建词性分布JSON字符串
+    pos_data_json = _dumps_pos(pos_items)
+    
+    # 分段式提示词构建
+    segments = {
+        "objective_scope": f"生成一个'宏观 FSRS 学习计划模板'的 JSON 对象，仅给出全周期的平均每日学习量与比例指导；不包含任何具体词条文本或逐日安排；只输出一个完整 JSON，对象以 {{ 开始、以 }} 结束。",
+        
+        "input_params": f"total_study_days={total_days}; daily_learning_minutes={daily_minutes}; total_words={total_vocab}; stage={stage}; pos_distribution={pos_data_json}; total_syntax_units={syntax_total}; total_morphology_units={morphology_total}.",
+        
+        "category_mapping": "core_functional=[noun,verb,adjective]; connectors_relational=[adverb,preposition,conjunction,pronoun,determiner,article,numeral]; auxiliary_supplemental=[interjection,modal,auxiliary,phrase].",
+        
+        "json_schema": "键名全为小写下划线；数值用数字类型；百分比为 0–100 的数值（非小数比例）。必须使用FSRS标准格式字段名：scheduler_config, cards, learning_plan_metadata, daily_targets, word_categories, card_template, review_rating_guide, implementation_notes, generated_at, format_version。字段与FSRS标准格式完全一致。",
+        
+        "metadata_rules": f"estimated_avg_word_rotations_per_cycle= 1 + min({total_days}/1.5,3.0) + (0.5 if {daily_minutes}≥30 else 0)，一位小数；learning_efficiency_estimate={learning_efficiency}；review_efficiency_estimate={review_efficiency}；morphology_practice_time_estimate={morphology_time}；syntax_practice_time_estimate={syntax_time}。",
+        
+        "fsrs_params": f"default_ease ∈[1.8,2.4]，基于{stage}偏低（1.8–2.0）；new_word_first_review_interval_days: {total_days}>20 ⇒ 0.28–0.47，{stage}减0.02；morphology_first_review_interval_days = 词汇间隔*0.9；syntax_first_review_interval_days = 词汇间隔*1.05。",
+        
+        "time_budget": f"{daily_minutes} = 新学({learning_efficiency}m/词) + 复习({review_efficiency}m/词) + 词法练习({morphology_time}m/次) + 句法练习({syntax_time}m/次)；若溢出：先将练习=0，再强制新学:复习=1:1（词数相等），仍溢出则按阶段优先新学微调；总和≤{daily_minutes}。",
+        
+        "word_allocation": f"阶段权重：new_learning=0.7、balanced=0.6、review_focus=0.5；avg_new_words_per_day = min( floor(({daily_minutes}*权重)/(1.6)), ({total_vocab}/{total_days})*1.5 )；avg_review_words_per_day = 同值（1:1）；若 {total_vocab}/{total_days} > 计算值，则允许小数表示；总新词不超过 {total_vocab}，目标可上调至原计算的1.2倍但不得超限。每日新学单词与复习单词要向上取整",
+        
+        "morph_syntax_allocation": f"avg_new_morphology_units_per_day ≈ {morphology_total}/{total_days}，均匀分布，review 同值；avg_new_syntax_units_per_day ≈ {syntax_total}/{total_days}，review 同值；若时间不足优先词汇；轮转：morphology=min(1.5+{total_days}/15*0.2,3.0)，syntax=min(1.2+{total_days}/15*0.15,2.5)；若时间溢出每次各减0.5直至≤{daily_minutes}。每日新学词法与句法单位要向上取整。",
+        
+        "pos_composition": f"按分组汇总词数/{total_vocab}×100，四舍五入两位小数；{stage}对 core_functional +10%（从其他组按比例扣除）；末项补差确保三者和=100%。",
+        
+        "practice_minutes_rules": f"suggested_morphology={morphology_time} if ({daily_minutes}≥15 and 总词预算<20 and 阶段≠review_focus) else 0；suggested_syntax={syntax_time} if ({daily_minutes}≥25 and 总词预算<15) else 0；若总时间>{daily_minutes}，优先减句法练习至0，再减词法练习。",
+        
+        "example_item": "不填实际内容；id/text 为占位；initial_interval_days 与对应首复间隔一致或近似；status 固定为 review。",
+        
+        "boundary_checks": f"禁止 NaN/Infinity/空字符串；百分比 0–100；时间与词数≥0；若 {daily_minutes}<4：所有练习=0，新学=复习=floor({daily_minutes}/2)；若 {total_days}=1：轮转=2.0、间隔=0.09、ease=1.8；单位按库总数/天。",
+        
+        "single_line_note": "单行英文提示，包含：高强度10%缩短、1:1比例、词法句法均匀分配、溢出时先减练习后调轮转。示例：For high-intensity 1:1 ratio, shorten intervals by 10%; cap reviews at new words; allocate morphology/syntax evenly with 2.0 rotations/day; trim practice first if time overflows.",
+        
+        "card_template_specification": """card_template字段必须严格按照以下格式（注意数据类型和默认值）：
+{
+  "id": "PLACEHOLDER_ID",
+  "text": "PLACEHOLDER_TEXT", 
+  "category": "core_functional",
+  "part_of_speech": "noun",
+  "due": "2024-01-01T00:00:00Z",
+  "stability": 1.0,
+  "difficulty": 5.0,
+  "elapsed_days": 0,
+  "scheduled_days": 1440,
+  "reps": 0,
+  "lapses": 0,
+  "state": 1,
+  "last_review": null,
+  "review_logs": []
+}
+关键要求：due必须是ISO时间字符串；stability=1.0，difficulty=5.0（浮点数）；state=1（数字不是字符串）；scheduled_days使用分钟数。""",
+        
+        "fsrs_standard_format": """返回的JSON必须符合FSRS标准格式要求，包含以下必需字段：
+1. scheduler_config: 包含21个FSRS参数的数组、desired_retention(0.9)、learning_steps([1,10])、relearning_steps([10])、maximum_interval(基于ease计算)、enable_fuzzing(true)
+2. cards: 空数组[]
+3. learning_plan_metadata: 包含total_study_days、daily_learning_minutes_target、各种统计数据
+4. daily_targets: 重命名daily_planning_guidelines为daily_targets，包含所有每日目标数据
+5. word_categories: 改为复数形式，字段名加_percentage后缀
+6. card_template: 使用上述card_template_specification的精确格式
+7. review_rating_guide: 1-4评分说明
+8. implementation_notes: 实现说明
+9. generated_at: 生成时间
+10. format_version: "1.0"
+注意：字段名必须与标准FSRS格式完全一致，不能使用自定义命名。"""
+    }
+    
+    # 套用静态模板生成完整提示词
+    return _FSRS_TEMPLATE.format_map(segments)
+
+# 练习句子提示词模板（100%新学单词覆盖策略）
+_SENTENCES_TEMPLATE = """🎯 TASK: Create 10 practice sentences with 100% new vocabulary coverage AND 70%+ review word coverage.
+
+📋 NEW WORDS (MUST USE ALL): {new_words_list}
+📊 NEW WORDS REQUIREMENT: All {new_words_count} new words MUST appear across the 10 sentences.
+
+📖 REVIEW WORDS (MUST USE 70%+): {review_words_list}
+📊 REVIEW WORDS REQUIREMENT: At least {target_review_coverage}/{review_words_count} review words MUST be used across sentences.
+📊 SENTENCE DISTRIBUTION: At least {target_sentences_with_review}/10 sentences MUST contain review words.
+
+🔥 MANDATORY DUAL STRATEGY:
+1. NEW WORDS: Ensure each new word appears at least once:
+   - If 10 new words: 1 word per sentence
+   - If fewer than 10: some words appear multiple times  
+   - If more than 10: multiple words per sentence
+
+2. REVIEW WORDS: Strategically distribute review words:
+   - Prioritize natural integration with new vocabulary
+   - Aim for {target_sentences_with_review}+ sentences containing review words
+   - Use high-frequency review words first
+   - Combine review words with new words in meaningful contexts
+
+💡 INTEGRATION REQUIREMENTS:
+- Level: Elementary ({stage})
+- Grammar focus: 
+{morphology_content}{syntax_content}
+- Natural sentence flow combining new and review vocabulary
+- Contextually appropriate usage of both word types
+
+📝 JSON OUTPUT FORMAT:
+{{
+  "practice_sentences": [
+    {{
+      "sentence": "[English sentence with new word + review word when possible]",
+      "translation": "[Chinese translation]",
+      "morphology_rule": "[Grammar rule description]",
+      "syntactic_structure": "[Sentence structure]",
+      "difficulty": 2.5,
+      "explanation": "[Chinese explanation of vocabulary and grammar usage]"
+    }}
+  ]
+}}
+
+🚨 ENHANCED VERIFICATION CHECKLIST:
+□ All {new_words_count} new words used? 
+□ At least {target_review_coverage}/{review_words_count} review words used?
+□ At least {target_sentences_with_review}/10 sentences contain review words?
+□ Each sentence contains at least one new word?
+□ Review words naturally integrated with new words?
+□ Exactly 10 sentences generated?
+□ JSON format correct?
+
+⚠️ CRITICAL DUAL REQUIREMENTS:
+1. Every new word from the list MUST appear in at least one sentence.
+2. At least 70% of review words MUST be used across all sentences.
+3. At least 40% of sentences MUST contain review words.
+
+RETURN ONLY JSON - NO OTHER TEXT"""
+
+# 基于练习句子生成练习题的提示词模板（占位符：sentences_content、stage）
+_EXERCISES_TEMPLATE = """🎯 TASK: Create 10 practice exercises based on the given practice sentences.
+
+📋 SOURCE SENTENCES:
+{sentences_content}
+
+🔥 MANDATORY REQUIREMENTS:
+- Generate exactly 10 exercises (4 choice + 4 translation + 2 fill-blank)
+- Use vocabulary and structures from the source sentences
+- Ensure all exercises are based on the provided sentences
+- Level: Elementary ({stage})
+
+📝 EXERCISE TYPES:
+1. Multiple Choice (4 exercises): Create questions with 4 options each
+2. Translation (4 exercises): Chinese to English translation
+3. Fill in the Blank (2 exercises): Complete the sentence
+
+📝 JSON OUTPUT FORMAT:
+{{
+  "practice_exercises": [
+    {{
+      "id": 1,
+      "type": "choice",
+      "question": "[Question based on source sentences]",
+      "options": ["option1", "option2", "option3", "option4"],
+      "correct_answer": "correct_option",
+      "morphology_rule": "语法规则说明",
+      "syntactic_structure": "句法结构",
+      "difficulty": 2.5,
+      "explanation": "中文解释"
+    }},
+    {{
+      "id": 2,
+      "type": "translation",
+      "question": "请将以下中文翻译成英文",
+      "chinese_text": "[Chinese sentence based on source]",
+      "english_text": "[English translation from source sentences]",
+      "morphology_rule": "语法规则说明",
+      "syntactic_structure": "句法结构",
+      "difficulty": 2.5,
+      "explanation": "中文解释"
+    }},
+    {{
+      "id": 3,
+      "type": "fill_blank",
+      "question": "请填入适当的单词",
+      "sentence": "[Sentence with ___ from source sentences]",
+      "answer": "[correct word]",
+      "morphology_rule": "语法规则说明",
+      "syntactic_structure": "句法结构",
+      "difficulty": 2.5,
+      "explanation": "中文解释"
+    }}
+  ]
+}}
+
+🚨 VERIFICATION CHECKLIST:
+□ All exercises based on source sentences?
+□ Exactly 10 exercises generated?
+□ 4 choice + 4 translation + 2 fill-blank?
+□ All explanations in Chinese?
+□ JSON format correct?
+
+RETURN ONLY JSON - NO OTHER TEXT"""
+
+
 class EnglishLearningPromptGenerator:
     """
     英语学习计划AI提示词生成器
@@ -49,27 +423,56 @@ class EnglishLearningPromptGenerator:
         Args:
             config_dir (str): 配置文件目录路径，默认为 "src/english/config"
         """
-        import sys
-        from pathlib import Path
-        sys.path.append(str(Path(__file__).parent))
-        
         # 设置配置文件目录
         self.config_dir = Path(config_dir)
         
-        # 初始化服务组件
+        # 提示词翻译缓存：内存缓存 + 磁盘缓存（按中文提示词哈希存储）
+        self._translation_cache: Dict[str, str] = {}
+        self._translation_cache_dir = self.config_dir.parent / ".trans_cache"
+        
+        # 服务组件、统计信息和阶段配置均在首次使用时加载，
+        # 只用到静态提示词的调用方无需承担加载开销
+    
+    @cached_property
+    def word_service(self):
+        """单词服务：获取词汇、词法、句法统计信息"""
         from src.english.services.word_data_service import SimpleWordService
+        return SimpleWordService()
+    
+    @cached_property
+    def word_stats(self) -> Dict:
+        """词汇、词法、句法统计信息"""
+        return self.word_service.get_learning_resource_statistics(show_stats=False)
+    
+    @cached_property
+    def _word_stats_view(self) -> Mapping:
+        """统计信息的只读视图"""
+        return MappingProxyType(self.word_stats)
+    
+    @cached_property
+    def _var_table(self) -> Dict[str, str]:
+        """stage.md 变量替换表：统计数据加载后不再变化，只计算一次"""
+        return {
+            name: str(self.word_stats.get(category, {}).get(level, 0))
+            for name, (category, level) in _STAGE_VARIABLES.items()
+        }
+    
+    @cached_property
+    def vocab_selector(self):
+        """词库选择器：根据学习阶段选择合适的学习资源"""
         from src.english.services.vocabulary_selection_service import VocabSelector
-        
-        # 单词服务：获取词汇、词法、句法统计信息
-        self.word_service = SimpleWordService()
-        self.word_stats = self.word_service.get_learning_resource_statistics(show_stats=False)
-        
-        # 词库选择器：根据学习阶段选择合适的学习资源
-        self.vocab_selector = VocabSelector(self.config_dir)
-        
-        # 加载学习阶段配置
-        self.stage_config = self._load_stage_config()
-        
+        return VocabSelector(self.config_dir)
+    
+    @cached_property
+    def _ai_client(self) -> UnifiedAIClient:
+        """AI客户端（使用智谱GLM模型），首次翻译时创建并在后续调用中复用"""
+        return UnifiedAIClient(default_model=AIModel.GLM_45)
+    
+    @cached_property
+    def stage_config(self) -> Dict:
+        """学习阶段配置信息"""
+        return self._load_stage_config()
+    
     def _load_stage_config(self) -> Dict:
         """
         加载学习阶段配置文件
@@ -99,9 +502,40 @@ class EnglishLearningPromptGenerator:
             print(f"⚠️ 阶段配置文件不存在: {stage_file}")
             return {}
         
-        with open(stage_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        stages = self._parse_stage_config(stage_file.read_text(encoding='utf-8'))
+        return self._normalize_stage_config(stages)
+    
+    def _normalize_stage_config(self, stages: Dict) -> Dict:
+        """
+        统一各阶段配置为 {'content': ..., 'ratios': ...} 结构，便于直接索引
         
+        Args:
+            stages (Dict): 解析或从缓存读取的阶段配置
+            
+        Returns:
+            Dict: 结构统一的阶段配置
+        """
+        normalized = {}
+        for stage, stage_data in stages.items():
+            if isinstance(stage_data, dict):
+                normalized[stage] = {
+                    'content': stage_data.get('content', ''),
+                    'ratios': stage_data.get('ratios', _EMPTY_RATIOS)
+                }
+            else:
+                normalized[stage] = {'content': stage_data, 'ratios': _EMPTY_RATIOS}
+        return normalized
+    
+    def _parse_stage_config(self, content: str) -> Dict:
+        """
+        解析 stage.md 内容
+        
+        Args:
+            content (str): stage.md 文件内容
+            
+        Returns:
+            Dict: 解析后的阶段配置字典，格式同 _load_stage_config
+        """
         stages = {}
         current_stage = None
         current_content = []
@@ -109,11 +543,11 @@ class EnglishLearningPromptGenerator:
         for line in content.split('\n'):
             line = line.strip()
             # 匹配格式：第一阶段：基础巩固 (小学中高年级)
-            if line.startswith('第') and '阶段：' in line and ('小学' in line or '初中' in line or '高中' in line):
+            if _STAGE_HEADER_RE.match(line):
                 if current_stage:
                     # 替换阶段内容中的变量并解析占比信息
-                    processed_content = self._replace_stage_variables('\n'.join(current_content))
-                    stage_ratios = self._parse_stage_ratios('\n'.join(current_content))
+                    processed_content = self._replace_stage_variables(current_content)
+                    stage_ratios = self._parse_stage_ratios(current_content)
                     stages[current_stage] = {
                         'content': processed_content,
                         'ratios': stage_ratios
@@ -125,8 +559,8 @@ class EnglishLearningPromptGenerator:
         
         if current_stage:
             # 替换最后一个阶段的变量并解析占比信息
-            processed_content = self._replace_stage_variables('\n'.join(current_content))
-            stage_ratios = self._parse_stage_ratios('\n'.join(current_content))
+            processed_content = self._replace_stage_variables(current_content)
+            stage_ratios = self._parse_stage_ratios(current_content)
             stages[current_stage] = {
                 'content': processed_content,
                 'ratios': stage_ratios
@@ -134,96 +568,54 @@ class EnglishLearningPromptGenerator:
         
         return stages
     
-    def _replace_stage_variables(self, content: str) -> str:
-        """替换阶段内容中的变量"""
-        # 定义变量映射
-        variables = {
-            "{elementary_total_words}": str(self.word_stats.get("words", {}).get("elementary", 0)),
-            "{middle_school_total_words}": str(self.word_stats.get("words", {}).get("junior_high", 0)),
-            "{high_school_total_words}": str(self.word_stats.get("words", {}).get("high_school", 0)),
-            "{elementary_total_grammar}": str(self.word_stats.get("syntax", {}).get("elementary", 0)),
-            "{middle_school_total_grammar}": str(self.word_stats.get("syntax", {}).get("junior_high", 0)),
-            "{high_school_total_grammar}": str(self.word_stats.get("syntax", {}).get("high_school", 0)),
-            "{elementary_total_morphology}": str(self.word_stats.get("morphology", {}).get("elementary", 0)),
-            "{middle_school_total_morphology}": str(self.word_stats.get("morphology", {}).get("junior_high", 0)),
-            "{high_school_total_morphology}": str(self.word_stats.get("morphology", {}).get("high_school", 0)),
-        }
-        
-        # 替换变量
-        for var, value in variables.items():
-            content = content.replace(var, value)
+    def _replace_stage_variables(self, lines: List[str]) -> str:
+        """
+        替换阶段内容中的变量
         
-        return content
+        Args:
+            lines (List[str]): 阶段内容的各行
+            
+        Returns:
+            str: 替换变量后以换行拼接的阶段内容
+        """
+        # 一次正则扫描完成所有变量替换
+        var_table = self._var_table
+        return _STAGE_VARIABLE_RE.sub(lambda m: var_table[m.group(1)], '\n'.join(lines))
     
-    def _parse_stage_ratios(self, content: str) -> Dict:
-        """解析阶段内容中的占比信息"""
+    def _parse_stage_ratios(self, lines: List[str]) -> Dict:
+        """
+        解析阶段内容中的占比信息
+        
+        Args:
+            lines (List[str]): 阶段内容的各行
+            
+        Returns:
+            Dict: 词汇、词法、句法在各学段的占比
+        """
         ratios = {
             'vocabulary': {'elementary': 0, 'junior_high': 0, 'high_school': 0},
             'morphology': {'elementary': 0, 'junior_high': 0, 'high_school': 0},
             'syntax': {'elementary': 0, 'junior_high': 0, 'high_school': 0}
         }
         
-        lines = content.split('\n')
         current_section = None
         
         for line in lines:
             line = line.strip()
             
             # 识别词汇、词法、句法部分
-            if '词汇' in line and '总占比' in line:
-                current_section = 'vocabulary'
-            elif '词法' in line and '总占比' in line:
-                current_section = 'morphology'
-            elif '句法' in line and '总占比' in line:
-                current_section = 'syntax'
-            elif line == '词汇':
-                current_section = 'vocabulary'
-            elif line == '词法':
-                current_section = 'morphology'
-            elif line == '句法':
-                current_section = 'syntax'
-            elif line.startswith('小学：') and current_section:
-                # 解析小学占比
-                try:
-                    ratio = int(line.replace('小学：', '').replace('%', ''))
-                    ratios[current_section]['elementary'] = ratio
-                except ValueError:
-                    pass
-            elif line.startswith('初中：') and current_section:
-                # 解析初中占比
-                try:
-                    ratio = int(line.replace('初中：', '').replace('%', ''))
-                    ratios[current_section]['junior_high'] = ratio
-                except ValueError:
-                    pass
-            elif line.startswith('高中：') and current_section:
-                # 解析高中占比
-                try:
-                    ratio = int(line.replace('高中：', '').replace('%', ''))
-                    ratios[current_section]['high_school'] = ratio
-                except ValueError:
-                    pass
-            elif line.startswith('小学词库：'):
-                # 处理第一阶段的特殊格式
-                try:
-                    ratio = int(line.replace('小学词库：', '').replace('%', ''))
-                    ratios['vocabulary']['elementary'] = ratio
-                except ValueError:
-                    pass
-            elif line.startswith('小学词法：'):
-                # 处理第一阶段词法
-                try:
-                    ratio = int(line.replace('小学词法：', '').replace('%', ''))
-                    ratios['morphology']['elementary'] = ratio
-                except ValueError:
-                    pass
-            elif line.startswith('小学句法：'):
-                # 处理第一阶段句法
-                try:
-                    ratio = int(line.replace('小学句法：', '').replace('%', ''))
-                    ratios['syntax']['elementary'] = ratio
-                except ValueError:
-                    pass
+            section_match = _SECTION_RE.match(line)
+            if section_match:
+                current_section = _SECTION_KEYS[section_match.group(section_match.lastindex)]
+                continue
+            
+            # 解析占比
+            ratio_match = _RATIO_RE.match(line)
+            if ratio_match:
+                section, level = _RATIO_LABELS[ratio_match.group(1)]
+                section = section or current_section
+                if section:
+                    ratios[section][level] = int(ratio_match.group(2))
         
         return ratios
     
@@ -233,29 +625,15 @@ class EnglishLearningPromptGenerator:
     
     def get_stage_info(self, stage: str) -> str:
         """获取指定阶段的信息"""
-        stage_data = self.stage_config.get(stage, {})
-        if isinstance(stage_data, dict):
-            return stage_data.get('content', '')
-        return stage_data
+        return self.stage_config.get(stage, _EMPTY_STAGE)['content']
     
     def get_stage_ratios(self, stage: str) -> Dict:
         """获取指定阶段的占比信息"""
-        stage_data = self.stage_config.get(stage, {})
-        if isinstance(stage_data, dict):
-            return stage_data.get('ratios', {
-                'vocabulary': {'elementary': 0, 'junior_high': 0, 'high_school': 0},
-                'morphology': {'elementary': 0, 'junior_high': 0, 'high_school': 0},
-                'syntax': {'elementary': 0, 'junior_high': 0, 'high_school': 0}
-            })
-        return {
-            'vocabulary': {'elementary': 0, 'junior_high': 0, 'high_school': 0},
-            'morphology': {'elementary': 0, 'junior_high': 0, 'high_school': 0},
-            'syntax': {'elementary': 0, 'junior_high': 0, 'high_school': 0}
-        }
+        return self.stage_config.get(stage, _EMPTY_STAGE)['ratios']
     
-    def get_word_statistics(self) -> Dict:
-        """获取单词统计信息"""
-        return self.word_stats.copy()
+    def get_word_statistics(self) -> Mapping:
+        """获取单词统计信息（只读视图）"""
+        return self._word_stats_view
     
     
     
@@ -287,163 +665,42 @@ class EnglishLearningPromptGenerator:
         Returns:
             str: 完整的FSRS模板适配AI提示词
         """
-        # 计算总词汇量
-        total_vocab = sum(pos_distribution.values())
-        
-        # 构建词性分布JSON字符串
-        import json
-        pos_data_json = json.dumps(pos_distribution, separators=(',', ':'))
-        
-        # 分段式提示词构建
-        segments = {
-            "objective_scope": f"生成一个'宏观 FSRS 学习计划模板'的 JSON 对象，仅给出全周期的平均每日学习量与比例指导；不包含任何具体词条文本或逐日安排；只输出一个完整 JSON，对象以 {{ 开始、以 }} 结束。",
-            
-            "input_params": f"total_study_days={total_days}; daily_learning_minutes={daily_minutes}; total_words={total_vocab}; stage={stage}; pos_distribution={pos_data_json}; total_syntax_units={syntax_total}; total_morphology_units={morphology_total}.",
-            
-            "category_mapping": "core_functional=[noun,verb,adjective]; connectors_relational=[adverb,preposition,conjunction,pronoun,determiner,article,numeral]; auxiliary_supplemental=[interjection,modal,auxiliary,phrase].",
-            
-            "json_schema": "键名全为小写下划线；数值用数字类型；百分比为 0–100 的数值（非小数比例）。必须使用FSRS标准格式字段名：scheduler_config, cards, learning_plan_metadata, daily_targets, word_categories, card_template, review_rating_guide, implementation_notes, generated_at, format_version。字段与FSRS标准格式完全一致。",
-            
-            "metadata_rules": f"estimated_avg_word_rotations_per_cycle= 1 + min({total_days}/1.5,3.0) + (0.5 if {daily_minutes}≥30 else 0)，一位小数；learning_efficiency_estimate={learning_efficiency}；review_efficiency_estimate={review_efficiency}；morphology_practice_time_estimate={morphology_time}；syntax_practice_time_estimate={syntax_time}。",
-            
-            "fsrs_params": f"default_ease ∈[1.8,2.4]，基于{stage}偏低（1.8–2.0）；new_word_first_review_interval_days: {total_days}>20 ⇒ 0.28–0.47，{stage}减0.02；morphology_first_review_interval_days = 词汇间隔*0.9；syntax_first_review_interval_days = 词汇间隔*1.05。",
-            
-            "time_budget": f"{daily_minutes} = 新学({learning_efficiency}m/词) + 复习({review_efficiency}m/词) + 词法练习({morphology_time}m/次) + 句法练习({syntax_time}m/次)；若溢出：先将练习=0，再强制新学:复习=1:1（词数相等），仍溢出则按阶段优先新学微调；总和≤{daily_minutes}。",
-            
-            "word_allocation": f"阶段权重：new_learning=0.7、balanced=0.6、review_focus=0.5；avg_new_words_per_day = min( floor(({daily_minutes}*权重)/(1.6)), ({total_vocab}/{total_days})*1.5 )；avg_review_words_per_day = 同值（1:1）；若 {total_vocab}/{total_days} > 计算值，则允许小数表示；总新词不超过 {total_vocab}，目标可上调至原计算的1.2倍但不得超限。每日新学单词与复习单词要向上取整",
-            
-            "morph_syntax_allocation": f"avg_new_morphology_units_per_day ≈ {morphology_total}/{total_days}，均匀分布，review 同值；avg_new_syntax_units_per_day ≈ {syntax_total}/{total_days}，review 同值；若时间不足优先词汇；轮转：morphology=min(1.5+{total_days}/15*0.2,3.0)，syntax=min(1.2+{total_days}/15*0.15,2.5)；若时间溢出每次各减0.5直至≤{daily_minutes}。每日新学词法与句法单位要向上取整。",
-            
-            "pos_composition": f"按分组汇总词数/{total_vocab}×100，四舍五入两位小数；{stage}对 core_functional +10%（从其他组按比例扣除）；末项补差确保三者和=100%。",
-            
-            "practice_minutes_rules": f"suggested_morphology={morphology_time} if ({daily_minutes}≥15 and 总词预算<20 and 阶段≠review_focus) else 0；suggested_syntax={syntax_time} if ({daily_minutes}≥25 and 总词预算<15) else 0；若总时间>{daily_minutes}，优先减句法练习至0，再减词法练习。",
-            
-            "example_item": "不填实际内容；id/text 为占位；initial_interval_days 与对应首复间隔一致或近似；status 固定为 review。",
-            
-            "boundary_checks": f"禁止 NaN/Infinity/空字符串；百分比 0–100；时间与词数≥0；若 {daily_minutes}<4：所有练习=0，新学=复习=floor({daily_minutes}/2)；若 {total_days}=1：轮转=2.0、间隔=0.09、ease=1.8；单位按库总数/天。",
-            
-            "single_line_note": "单行英文提示，包含：高强度10%缩短、1:1比例、词法句法均匀分配、溢出时先减练习后调轮转。示例：For high-intensity 1:1 ratio, shorten intervals by 10%; cap reviews at new words; allocate morphology/syntax evenly with 2.0 rotations/day; trim practice first if time overflows.",
-            
-            "card_template_specification": """card_template字段必须严格按照以下格式（注意数据类型和默认值）：
-{
-  "id": "PLACEHOLDER_ID",
-  "text": "PLACEHOLDER_TEXT", 
-  "category": "core_functional",
-  "part_of_speech": "noun",
-  "due": "2024-01-01T00:00:00Z",
-  "stability": 1.0,
-  "difficulty": 5.0,
-  "elapsed_days": 0,
-  "scheduled_days": 1440,
-  "reps": 0,
-  "lapses": 0,
-  "state": 1,
-  "last_review": null,
-  "review_logs": []
-}
-关键要求：due必须是ISO时间字符串；stability=1.0，difficulty=5.0（浮点数）；state=1（数字不是字符串）；scheduled_days使用分钟数。""",
-            
-            "fsrs_standard_format": """返回的JSON必须符合FSRS标准格式要求，包含以下必需字段：
-1. scheduler_config: 包含21个FSRS参数的数组、desired_retention(0.9)、learning_steps([1,10])、relearning_steps([10])、maximum_interval(基于ease计算)、enable_fuzzing(true)
-2. cards: 空数组[]
-3. learning_plan_metadata: 包含total_study_days、daily_learning_minutes_target、各种统计数据
-4. daily_targets: 重命名daily_planning_guidelines为daily_targets，包含所有每日目标数据
-5. word_categories: 改为复数形式，字段名加_percentage后缀
-6. card_template: 使用上述card_template_specification的精确格式
-7. review_rating_guide: 1-4评分说明
-8. implementation_notes: 实现说明
-9. generated_at: 生成时间
-10. format_version: "1.0"
-注意：字段名必须与标准FSRS格式完全一致，不能使用自定义命名。"""
-        }
-        
-        # 构建完整提示词
-        prompt = f"""你是精通 FSRS 的语言学习策略师。
-
-## 目标与范围
-{segments["objective_scope"]}
-
-## 输入参数
-{segments["input_params"]}
-
-## 词类分组映射
-{segments["category_mapping"]}
-
-## JSON 结构与键名规范
-{segments["json_schema"]}
-
-## metadata 填充规则
-{segments["metadata_rules"]}
-
-## FSRS 初始参数计算
-{segments["fsrs_params"]}
-
-## 时间预算与优先级
-{segments["time_budget"]}
-
-## 词汇日均分配
-{segments["word_allocation"]}
-
-## 词法/句法单位与轮转
-{segments["morph_syntax_allocation"]}
-
-## 新词构成比例
-{segments["pos_composition"]}
-
-## 建议练习分钟数
-{segments["practice_minutes_rules"]}
-
-## 示例复习条目占位
-{segments["example_item"]}
-
-## 边界与校验
-{segments["boundary_checks"]}
-
-## 实现提示语格式
-{segments["single_line_note"]}
-
-## card_template格式规范
-{segments["card_template_specification"]}
-
-## FSRS标准格式要求
-{segments["fsrs_standard_format"]}
-
-基于以上所有规则，立即生成符合FSRS标准格式要求的JSON对象："""
-        
-        return prompt
+        # 冻结词性分布为可哈希的元组（带上数量类型，避免 1 与 1.0 命中同一缓存），相同参数直接复用缓存的提示词
+        return _build_fsrs_prompt(
+            total_days, daily_minutes,
+            tuple((pos, count, type(count)) for pos, count in pos_distribution.items()),
+            morphology_total, syntax_total, stage,
+            learning_efficiency, review_efficiency, morphology_time, syntax_time
+        )
     
     def add_ratios_to_learning_plan(self, learning_plan: Dict, stage: str) -> Dict:
         """为学习计划添加比例信息"""
         if not learning_plan or not isinstance(learning_plan, dict):
             return learning_plan
         
-        # 获取阶段占比信息
+        # 获取阶段占比信息，并预先转换为待写入的比例字段
         stage_ratios = self.get_stage_ratios(stage)
-        vocab_ratios = stage_ratios.get('vocabulary', {'elementary': 0, 'junior_high': 0, 'high_school': 0})
-        morphology_ratios = stage_ratios.get('morphology', {'elementary': 0, 'junior_high': 0, 'high_school': 0})
-        syntax_ratios = stage_ratios.get('syntax', {'elementary': 0, 'junior_high': 0, 'high_school': 0})
+        vocab_update, morphology_update, syntax_update = (
+            {f'{level}_ratio': ratios[level] for level in ('elementary', 'junior_high', 'high_school')}
+            for ratios in (stage_ratios.get(section, _EMPTY_RATIOS[section])
+                           for section in ('vocabulary', 'morphology', 'syntax'))
+        )
         
         # 为每个词性添加比例信息
         study_plan = learning_plan.get('study_plan', {})
-        for pos in study_plan:
-            if isinstance(study_plan[pos], dict):
-                study_plan[pos]['elementary_ratio'] = vocab_ratios['elementary']
-                study_plan[pos]['junior_high_ratio'] = vocab_ratios['junior_high']
-                study_plan[pos]['high_school_ratio'] = vocab_ratios['high_school']
+        for pos_entry in study_plan.values():
+            if isinstance(pos_entry, dict):
+                pos_entry.update(vocab_update)
         
         # 为词法添加比例信息
         morphology = learning_plan.get('morphology', {})
         if isinstance(morphology, dict):
-            morphology['elementary_ratio'] = morphology_ratios['elementary']
-            morphology['junior_high_ratio'] = morphology_ratios['junior_high']
-            morphology['high_school_ratio'] = morphology_ratios['high_school']
+            morphology.update(morphology_update)
         
         # 为句法添加比例信息
         syntax = learning_plan.get('syntax', {})
         if isinstance(syntax, dict):
-            syntax['elementary_ratio'] = syntax_ratios['elementary']
-            syntax['junior_high_ratio'] = syntax_ratios['junior_high']
-            syntax['high_school_ratio'] = syntax_ratios['high_school']
+            syntax.update(syntax_update)
         
         return learning_plan
     
@@ -463,165 +720,57 @@ class EnglishLearningPromptGenerator:
             str: 生成的提示词
         """
         # 提取新学单词
-        new_words_list = []
         pos_content = daily_words.get('pos_content', {})
-        for pos, words in pos_content.items():
-            for word_data in words:
-                if isinstance(word_data, dict):
-                    new_words_list.append(word_data.get('word', ''))
-                else:
-                    new_words_list.append(str(word_data))
+        new_words_list = _extract_words(list(chain.from_iterable(pos_content.values())))
         
         # 处理复习词汇
-        review_words_list = []
-        if review_words:
-            for word in review_words:
-                if isinstance(word, dict):
-                    review_words_list.append(word.get('word', ''))
-                else:
-                    review_words_list.append(str(word))
+        review_words_list = _extract_words(review_words) if review_words else []
         
         # 构建词法内容
-        morphology_content = ""
+        morphology_parts = []
         if daily_morphology:
-            morphology_content += "### 今日词法重点：\n"
-            morphology_info = []
-            
-            # 处理字典或列表类型的daily_morphology
-            if isinstance(daily_morphology, dict):
-                # 如果是字典，检查learning_points键
-                if 'learning_points' in daily_morphology:
-                    morphology_info.extend(daily_morphology['learning_points'])
-                else:
-                    # 如果没有learning_points，将整个字典作为一个条目
-                    morphology_info.append(daily_morphology)
-            elif isinstance(daily_morphology, list):
-                # 如果是列表，遍历每个元素
-                for morph in daily_morphology:
-                    if isinstance(morph, dict):
-                        # 检查是否有 morphology_items 或 learning_points
-                        if 'morphology_items' in morph:
-                            morphology_info.extend(morph['morphology_items'])
-                        elif 'learning_points' in morph:
-                            morphology_info.extend(morph['learning_points'])
-                        else:
-                            # 直接使用当前字典
-                            morphology_info.append(morph)
-                    else:
-                        morphology_info.append(morph)
+            morphology_parts.append("### 今日词法重点：\n")
+            morphology_info = _normalize_items(daily_morphology, 'morphology_items')
             
             for morph in morphology_info:
                 name = morph.get('name', morph.get('type', '词法规则'))
                 description = morph.get('description', morph.get('rules', ''))
-                morphology_content += f"- **{name}**: {description}\n"
+                morphology_parts.append(f"- **{name}**: {description}\n")
                 if morph.get('examples'):
-                    morphology_content += f"  - 规则/例句: {'; '.join(morph['examples'][:2])}\n"
+                    examples = '; '.join(morph['examples'][:2])
+                    morphology_parts.append(f"  - 规则/例句: {examples}\n")
                 elif morph.get('rules'):
-                    morphology_content += f"  - 规则/例句: {morph['rules']}\n"
+                    morphology_parts.append(f"  - 规则/例句: {morph['rules']}\n")
+        morphology_content = ''.join(morphology_parts)
         
         # 构建句法内容
-        syntax_content = ""
+        syntax_parts = []
         if daily_syntax:
-            syntax_content += "### 今日句法重点：\n"
-            syntax_info = []
-            
-            # 处理字典或列表类型的daily_syntax
-            if isinstance(daily_syntax, dict):
-                # 如果是字典，检查learning_points键
-                if 'learning_points' in daily_syntax:
-                    syntax_info.extend(daily_syntax['learning_points'])
-                else:
-                    # 如果没有learning_points，将整个字典作为一个条目
-                    syntax_info.append(daily_syntax)
-            elif isinstance(daily_syntax, list):
-                # 如果是列表，遍历每个元素
-                for syntax in daily_syntax:
-                    if isinstance(syntax, dict):
-                        # 检查是否有 syntax_items 或 learning_points
-                        if 'syntax_items' in syntax:
-                            syntax_info.extend(syntax['syntax_items'])
-                        elif 'learning_points' in syntax:
-                            syntax_info.extend(syntax['learning_points'])
-                        else:
-                            # 直接使用当前字典
-                            syntax_info.append(syntax)
-                    else:
-                        syntax_info.append(syntax)
+            syntax_parts.append("### 今日句法重点：\n")
+            syntax_info = _normalize_items(daily_syntax, 'syntax_items')
             
             for syntax in syntax_info:
                 name = syntax.get('name', syntax.get('type', '句法规则'))
                 description = syntax.get('description', syntax.get('structure', ''))
-                syntax_content += f"- **{name}**: {description}\n"
+                syntax_parts.append(f"- **{name}**: {description}\n")
                 if syntax.get('examples'):
-                    syntax_content += f"  - 例句: {'; '.join(syntax['examples'][:2])}\n"
-        
-        # 100%新学单词使用策略
-        new_words_count = len(new_words_list)
+                    examples = '; '.join(syntax['examples'][:2])
+                    syntax_parts.append(f"  - 例句: {examples}\n")
+        syntax_content = ''.join(syntax_parts)
         
-        # 计算复习单词要求
+        # 预先计算模板中的全部插值（无复习单词时复习要求均为0）
         review_words_count = len(review_words_list)
-        target_review_coverage = max(int(review_words_count * 0.7), 1) if review_words_count > 0 else 0
-        target_sentences_with_review = max(int(10 * 0.4), 1) if review_words_count > 0 else 0
-        
-        prompt = f"""🎯 TASK: Create 10 practice sentences with 100% new vocabulary coverage AND 70%+ review word coverage.
-
-📋 NEW WORDS (MUST USE ALL): {new_words_list}
-📊 NEW WORDS REQUIREMENT: All {new_words_count} new words MUST appear across the 10 sentences.
-
-📖 REVIEW WORDS (MUST USE 70%+): {review_words_list}
-📊 REVIEW WORDS REQUIREMENT: At least {target_review_coverage}/{review_words_count} review words MUST be used across sentences.
-📊 SENTENCE DISTRIBUTION: At least {target_sentences_with_review}/10 sentences MUST contain review words.
-
-🔥 MANDATORY DUAL STRATEGY:
-1. NEW WORDS: Ensure each new word appears at least once:
-   - If 10 new words: 1 word per sentence
-   - If fewer than 10: some words appear multiple times  
-   - If more than 10: multiple words per sentence
-
-2. REVIEW WORDS: Strategically distribute review words:
-   - Prioritize natural integration with new vocabulary
-   - Aim for {target_sentences_with_review}+ sentences containing review words
-   - Use high-frequency review words first
-   - Combine review words with new words in meaningful contexts
-
-💡 INTEGRATION REQUIREMENTS:
-- Level: Elementary ({stage})
-- Grammar focus: 
-{morphology_content}{syntax_content}
-- Natural sentence flow combining new and review vocabulary
-- Contextually appropriate usage of both word types
-
-📝 JSON OUTPUT FORMAT:
-{{
-  "practice_sentences": [
-    {{
-      "sentence": "[English sentence with new word + review word when possible]",
-      "translation": "[Chinese translation]",
-      "morphology_rule": "[Grammar rule description]",
-      "syntactic_structure": "[Sentence structure]",
-      "difficulty": 2.5,
-      "explanation": "[Chinese explanation of vocabulary and grammar usage]"
-    }}
-  ]
-}}
-
-🚨 ENHANCED VERIFICATION CHECKLIST:
-□ All {new_words_count} new words used? 
-□ At least {target_review_coverage}/{review_words_count} review words used?
-□ At least {target_sentences_with_review}/10 sentences contain review words?
-□ Each sentence contains at least one new word?
-□ Review words naturally integrated with new words?
-□ Exactly 10 sentences generated?
-□ JSON format correct?
-
-⚠️ CRITICAL DUAL REQUIREMENTS:
-1. Every new word from the list MUST appear in at least one sentence.
-2. At least 70% of review words MUST be used across all sentences.
-3. At least 40% of sentences MUST contain review words.
-
-RETURN ONLY JSON - NO OTHER TEXT"""
-        
-        return prompt
+        return _SENTENCES_TEMPLATE.format_map({
+            'new_words_list': new_words_list,
+            'new_words_count': len(new_words_list),
+            'review_words_list': review_words_list,
+            'review_words_count': review_words_count,
+            'target_review_coverage': review_words_count and max(int(review_words_count * 0.7), 1),
+            'target_sentences_with_review': review_words_count and max(int(10 * 0.4), 1),
+            'stage': stage,
+            'morphology_content': morphology_content,
+            'syntax_content': syntax_content,
+        })
     
     def generate_exercises_from_sentences(self, practice_sentences: list, stage: str) -> str:
         """
@@ -634,78 +783,9 @@ RETURN ONLY JSON - NO OTHER TEXT"""
         Returns:
             str: 生成练习题的提示词
         """
-        # 提取句子中的所有词汇
-        sentences_text = []
-        for sentence in practice_sentences:
-            sentences_text.append(f"- {sentence.get('sentence', '')}")
-        
-        sentences_content = "\n".join(sentences_text)
-        
-        prompt = f"""🎯 TASK: Create 10 practice exercises based on the given practice sentences.
-
-📋 SOURCE SENTENCES:
-{sentences_content}
-
-🔥 MANDATORY REQUIREMENTS:
-- Generate exactly 10 exercises (4 choice + 4 translation + 2 fill-blank)
-- Use vocabulary and structures from the source sentences
-- Ensure all exercises are based on the provided sentences
-- Level: Elementary ({stage})
-
-📝 EXERCISE TYPES:
-1. Multiple Choice (4 exercises): Create questions with 4 options each
-2. Translation (4 exercises): Chinese to English translation
-3. Fill in the Blank (2 exercises): Complete the sentence
-
-📝 JSON OUTPUT FORMAT:
-{{
-  "practice_exercises": [
-    {{
-      "id": 1,
-      "type": "choice",
-      "question": "[Question based on source sentences]",
-      "options": ["option1", "option2", "option3", "option4"],
-      "correct_answer": "correct_option",
-      "morphology_rule": "语法规则说明",
-      "syntactic_structure": "句法结构",
-      "difficulty": 2.5,
-      "explanation": "中文解释"
-    }},
-    {{
-      "id": 2,
-      "type": "translation",
-      "question": "请将以下中文翻译成英文",
-      "chinese_text": "[Chinese sentence based on source]",
-      "english_text": "[English translation from source sentences]",
-      "morphology_rule": "语法规则说明",
-      "syntactic_structure": "句法结构",
-      "difficulty": 2.5,
-      "explanation": "中文解释"
-    }},
-    {{
-      "id": 3,
-      "type": "fill_blank",
-      "question": "请填入适当的单词",
-      "sentence": "[Sentence with ___ from source sentences]",
-      "answer": "[correct word]",
-      "morphology_rule": "语法规则说明",
-      "syntactic_structure": "句法结构",
-      "difficulty": 2.5,
-      "explanation": "中文解释"
-    }}
-  ]
-}}
-
-🚨 VERIFICATION CHECKLIST:
-□ All exercises based on source sentences?
-□ Exactly 10 exercises generated?
-□ 4 choice + 4 translation + 2 fill-blank?
-□ All explanations in Chinese?
-□ JSON format correct?
-
-RETURN ONLY JSON - NO OTHER TEXT"""
-        
-        return prompt
+        # 提取句子文本并套用静态模板
+        sentences_content = "\n".join(f"- {sentence.get('sentence', '')}" for sentence in practice_sentences)
+        return _EXERCISES_TEMPLATE.format(sentences_content=sentences_content, stage=stage)
     
     def translate_prompt_to_english(self, chinese_prompt: str) -> str:
         """
@@ -730,8 +810,12 @@ RETURN ONLY JSON - NO OTHER TEXT"""
         Returns:
             str: 翻译后的英文提示词
         """
-        # 初始化AI客户端（使用智谱GLM模型）
-        ai_client = UnifiedAIClient(default_model=AIModel.GLM_45)
+        # 相同提示词的翻译结果可复用：先查内存缓存，再查磁盘缓存
+        cache_key = hashlib.blake2b(chinese_prompt.encode('utf-8'), digest_size=16).hexdigest()
+        cached = self._load_cached_translation(cache_key)
+        if cached is not None:
+            print("✅ 使用缓存的提示词翻译")
+            return cached
         
         # 构建翻译提示词
         translation_prompt = f"""请将以下中文提示词翻译成英文，保持原有的结构、格式和专业术语的准确性。
@@ -749,7 +833,7 @@ RETURN ONLY JSON - NO OTHER TEXT"""
         try:
             # 调用AI进行翻译
             print("🔄 正在调用智谱GLM模型翻译提示词...")
-            ai_response = ai_client.generate_content(translation_prompt)
+            ai_response = self._ai_client.generate_content(translation_prompt)
             
             # 检查响应类型并提取内容
             if hasattr(ai_response, 'content'):
@@ -760,7 +844,9 @@ RETURN ONLY JSON - NO OTHER TEXT"""
             # 验证翻译结果
             if english_prompt and len(english_prompt.strip()) > 0:
                 print("✅ 提示词翻译完成")
-                return english_prompt.strip()
+                english_prompt = english_prompt.strip()
+                self._save_cached_translation(cache_key, english_prompt)
+                return english_prompt
             else:
                 print("⚠️ 翻译结果为空，返回原始中文提示词")
                 return chinese_prompt
@@ -771,6 +857,46 @@ RETURN ONLY JSON - NO OTHER TEXT"""
             return chinese_prompt
     
     
+    def _load_cached_translation(self, cache_key: str) -> Optional[str]:
+        """
+        读取缓存的翻译结果
+        
+        Args:
+            cache_key (str): 中文提示词的哈希值
+            
+        Returns:
+            Optional[str]: 缓存的英文提示词，未命中时返回None
+        """
+        cached = self._translation_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        cache_file = self._translation_cache_dir / f"{cache_key}.txt"
+        if not cache_file.exists():
+            return None
+        try:
+            cached = cache_file.read_text(encoding='utf-8')
+        except OSError as e:
+            print(f"⚠️ 翻译缓存读取失败: {e}")
+            return None
+        self._translation_cache[cache_key] = cached
+        return cached
+    
+    def _save_cached_translation(self, cache_key: str, english_prompt: str) -> None:
+        """
+        保存翻译结果到内存和磁盘缓存，写入失败不影响使用
+        
+        Args:
+            cache_key (str): 中文提示词的哈希值
+            english_prompt (str): 翻译后的英文提示词
+        """
+        self._translation_cache[cache_key] = english_prompt
+        try:
+            self._translation_cache_dir.mkdir(parents=True, exist_ok=True)
+            (self._translation_cache_dir / f"{cache_key}.txt").write_text(english_prompt, encoding='utf-8')
+        except OSError as e:
+            print(f"⚠️ 翻译缓存写入失败: {e}")
+    
     def generate_practice_exercises_prompt(self, daily_words: Dict, daily_morphology: Dict, daily_syntax: Dict, stage: str, review_words: List[Dict] = None) -> str:
         """
         生成练习题的AI提示词
@@ -807,35 +933,8 @@ RETURN ONLY JSON - NO OTHER TEXT"""
         Returns:
             str: 包含所有必要信息的AI提示词
         """
-        if review_words is None:
-            review_words = []
-        
-        # 收集新学单词信息
-        new_words_info = []
-        for pos, words in daily_words.get('pos_content', {}).items():
-            for word in words:
-                new_words_info.append({
-                    'word': word['word'],
-                    'pos': pos,
-                    'translation': word.get('translation', ''),
-                    'difficulty': word.get('difficulty', 3.0),
-                    'type': 'new'
-                })
-        
-        # 收集复习单词信息
-        review_words_info = []
-        if review_words:
-            for word in review_words:
-                review_words_info.append({
-                    'word': word['word'],
-                    'pos': word.get('part_of_speech', 'unknown'),
-                    'translation': word.get('definition', ''),
-                    'difficulty': word.get('difficulty', 3.0),
-                    'type': 'review'
-                })
-        
-        # 合并所有单词
-        all_words_info = new_words_info + review_words_info
+        # 收集新学单词（提示词中只用到单词文本；复习单词目前不出现在练习题提示词中）
+        new_words_list = [word['word'] for words in daily_words.get('pos_content', {}).values() for word in words]
         
         # 收集词法信息
         morphology_info = []
@@ -844,9 +943,9 @@ RETURN ONLY JSON - NO OTHER TEXT"""
         for item in morph_items:
             morphology_info.append({
                 'name': item.get('name', '未知词法'),
-                'type': item.get('type', item.get('category', 'unknown')),
                 'description': item.get('description', '词法描述'),
-                'rules': item.get('rules', item.get('examples', []))[:3]  # 只取前3个规则/例句
+                # 只取前3个规则/例句，没有规则时使用例句
+                'rules': (item['rules'] if 'rules' in item else item.get('examples', []))[:3]
             })
         
         # 收集句法信息
@@ -856,36 +955,34 @@ RETURN ONLY JSON - NO OTHER TEXT"""
         for item in syntax_items:
             syntax_info.append({
                 'name': item.get('name', '未知句法'),
-                'type': item.get('type', item.get('category', 'unknown')),
                 'description': item.get('description', '句法描述'),
-                'structure': item.get('structure', item.get('description', '')),
                 'examples': item.get('examples', [])[:2]  # 只取前2个例句
             })
         
-        # 构建新学单词和复习单词列表
-        new_words_list = [word['word'] for word in new_words_info]
-        review_words_list = [word['word'] for word in review_words_info] if review_words_info else []
-        
         # 构建词法内容
-        morphology_content = ""
+        morphology_parts = []
         if morphology_info:
-            morphology_content = "\n### 今日词法重点：\n"
+            morphology_parts.append("\n### 今日词法重点：\n")
             for morph in morphology_info:
-                morphology_content += f"- **{morph['name']}**: {morph['description']}\n"
+                morphology_parts.append(f"- **{morph['name']}**: {morph['description']}\n")
                 if morph.get('rules'):
-                    morphology_content += f"  - 规则/例句: {'; '.join(morph['rules'][:3])}\n"
+                    rules = '; '.join(morph['rules'][:3])
+                    morphology_parts.append(f"  - 规则/例句: {rules}\n")
+        morphology_content = ''.join(morphology_parts)
         
         # 构建句法内容
-        syntax_content = ""
+        syntax_parts = []
         if syntax_info:
-            syntax_content = "\n### 今日句法重点：\n"
+            syntax_parts.append("\n### 今日句法重点：\n")
             for syntax in syntax_info:
-                syntax_content += f"- **{syntax['name']}**: {syntax['description']}\n"
+                syntax_parts.append(f"- **{syntax['name']}**: {syntax['description']}\n")
                 if syntax.get('examples'):
-                    syntax_content += f"  - 例句: {'; '.join(syntax['examples'][:2])}\n"
+                    examples = '; '.join(syntax['examples'][:2])
+                    syntax_parts.append(f"  - 例句: {examples}\n")
+        syntax_content = ''.join(syntax_parts)
         
         # 极端优化：逐词指定策略
-        new_words_str = str(new_words_list).replace("'", '"')
+        new_words_str = json.dumps(new_words_list, ensure_ascii=False)
         
         prompt = f"""TASK: Create exactly 10 English exercises using ALL specified vocabulary words.
 
@@ -953,7 +1050,7 @@ JSON FORMAT (EXACT STRUCTURE):
 }}
 
 VERIFICATION CHECKLIST:
-□ All {len(eval(new_words_str))} vocabulary words used?
+□ All {len(new_words_list)} vocabulary words used?
 □ Exactly 10 exercises created?
 □ JSON format correct?
 □ All explanations in Chinese?
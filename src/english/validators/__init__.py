@@ -2,8 +2,8 @@
 验证器模块
 """
 
-from .english_exercise_validator import EnglishExerciseValidator
-from .english_sentence_validator import EnglishSentenceValidator
+from .exercise_content_validator import EnglishExerciseValidator
+from .sentence_content_validator import EnglishSentenceValidator
 
 __all__ = [
     "EnglishExerciseValidator",
@@ -7,7 +7,9 @@
 
 import re
 import random
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
 # 添加共享框架路径
@@ -16,6 +18,191 @@ import os
 
 from src.shared.learning_framework.validation.base_exercise_validator import BaseExerciseValidator, ValidationRule
 
+# 英语特定的不可数名词
+_UNCOUNTABLE_NOUNS = frozenset({
+    'water', 'milk', 'juice', 'coffee', 'tea', 'oil', 'air', 
+    'music', 'information', 'news', 'advice', 'money', 'time',
+    'weather', 'homework', 'work', 'furniture', 'equipment',
+    'bread', 'rice', 'sugar', 'salt', 'flour', 'meat', 'fish',
+    'cheese', 'butter', 'honey', 'jam', 'soup', 'salad'
+})
+
+# 英语特定的不规则动词（只读）
+_IRREGULAR_VERBS = MappingProxyType({
+    'go': MappingProxyType({'past': 'went', 'past_participle': 'gone', 'third_person': 'goes'}),
+    'have': MappingProxyType({'past': 'had', 'past_participle': 'had', 'third_person': 'has'}),
+    'do': MappingProxyType({'past': 'did', 'past_participle': 'done', 'third_person': 'does'}),
+    'make': MappingProxyType({'past': 'made', 'past_participle': 'made', 'third_person': 'makes'}),
+    'take': MappingProxyType({'past': 'took', 'past_participle': 'taken', 'third_person': 'takes'}),
+    'see': MappingProxyType({'past': 'saw', 'past_participle': 'seen', 'third_person': 'sees'}),
+    'come': MappingProxyType({'past': 'came', 'past_participle': 'come', 'third_person': 'comes'}),
+    'give': MappingProxyType({'past': 'gave', 'past_participle': 'given', 'third_person': 'gives'}),
+    'write': MappingProxyType({'past': 'wrote', 'past_participle': 'written', 'third_person': 'writes'}),
+    'read': MappingProxyType({'past': 'read', 'past_participle': 'read', 'third_person': 'reads'}),
+    'speak': MappingProxyType({'past': 'spoke', 'past_participle': 'spoken', 'third_person': 'speaks'}),
+    'break': MappingProxyType({'past': 'broke', 'past_participle': 'broken', 'third_person': 'breaks'}),
+    'choose': MappingProxyType({'past': 'chose', 'past_participle': 'chosen', 'third_person': 'chooses'}),
+    'drive': MappingProxyType({'past': 'drove', 'past_participle': 'driven', 'third_person': 'drives'}),
+    'eat': MappingProxyType({'past': 'ate', 'past_participle': 'eaten', 'third_person': 'eats'}),
+    'fall': MappingProxyType({'past': 'fell', 'past_participle': 'fallen', 'third_person': 'falls'}),
+    'feel': MappingProxyType({'past': 'felt', 'past_participle': 'felt', 'third_person': 'feels'}),
+    'find': MappingProxyType({'past': 'found', 'past_participle': 'found', 'third_person': 'finds'}),
+    'get': MappingProxyType({'past': 'got', 'past_participle': 'gotten', 'third_person': 'gets'}),
+    'know': MappingProxyType({'past': 'knew', 'past_participle': 'known', 'third_person': 'knows'}),
+})
+
+# 不定冠词a及其后的单词（前瞻捕获，连续的"a a water"也能逐个检查）
+_A_FOLLOWED_WORD_RE = re.compile(r'\ba\s+(?=(\w+))', re.IGNORECASE)
+
+# 冠词a/an误用模式
+_A_BEFORE_VOWEL_RE = re.compile(r'\ba\s+[aeiouAEIOU]', re.IGNORECASE)
+_AN_BEFORE_CONSONANT_RE = re.compile(r'\ban\s+[bcdfghjklmnpqrstvwxyzBCDFGHJKLMNPQRSTVWXYZ]', re.IGNORECASE)
+
+# 时态标志词（前后不能紧跟英文字母，避免dragon中的ago等误判；
+# 不用\b，因为Unicode下汉字也算单词字符，紧挨中文的标志词会匹配不到）
+_PAST_TIME_RE = re.compile(r'(?<![A-Za-z])(?:yesterday|last|ago|before|then)(?![A-Za-z])', re.IGNORECASE)
+_PROGRESSIVE_TIME_RE = re.compile(r'(?<![A-Za-z])(?:now|at the moment|currently|right now)(?![A-Za-z])', re.IGNORECASE)
+
+# 英语语法验证规则（规则在导入时编译一次，各验证器实例共享）
+_VALIDATION_RULES = (
+    ValidationRule(
+        name="uncountable_noun_article",
+        pattern=r'\ba\s+(water|milk|air|music|information|news|advice|money|time|weather|homework|work|furniture|equipment|bread|rice|sugar|salt|flour|meat|fish|cheese|butter|honey|jam|soup|salad)\b',
+        error_message="不可数名词不能使用不定冠词a",
+        suggestion="使用some或直接使用名词，如：some water, music",
+        weight=2.0
+    ),
+    ValidationRule(
+        name="i_am_adjective",
+        pattern=r'\bI\s+am\s+(nice|good|bad|happy|sad|tired|hungry|thirsty)\s*[^a-zA-Z]',
+        error_message="I am + 形容词的表达不够自然",
+        suggestion="使用更具体的表达，如：I feel tired, I look happy",
+        weight=1.5
+    ),
+    ValidationRule(
+        name="i_like_adjective",
+        pattern=r'\bI\s+like\s+(nice|good|bad|happy|sad|big|small|tall|short)\s*[^a-zA-Z]',
+        error_message="不能直接说I like + 形容词",
+        suggestion="使用名词形式，如：I like nice things, I like big houses",
+        weight=2.0
+    ),
+    ValidationRule(
+        name="pronoun_article",
+        pattern=r'\bThis\s+is\s+a\s+(they|we|you|I|he|she|it)\b',
+        error_message="代词前不能使用冠词",
+        suggestion="直接使用代词，如：This is he, This is she",
+        weight=2.5
+    ),
+    ValidationRule(
+        name="plural_subject_verb",
+        pattern=r'\b(cat|dog|book|table|student|teacher|car|house)s\s+is\b',
+        error_message="复数名词应该用are而不是is",
+        suggestion="使用are，如：The cats are sleeping",
+        weight=2.0
+    ),
+    ValidationRule(
+        name="third_person_singular",
+        pattern=r'\b(He|She|It)\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s',
+        error_message="第三人称单数后动词应该加-s或变形",
+        suggestion="使用第三人称单数形式，如：He works, She studies",
+        weight=2.0
+    ),
+    ValidationRule(
+        name="there_are_verb",
+        pattern=r'\bThere\s+are\s+many\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s+here\b',
+        error_message="动词不能直接用在'There are many _____ here'句型中",
+        suggestion="使用名词形式，如：There are many students here",
+        weight=2.0
+    ),
+    ValidationRule(
+        name="there_are_adjective",
+        pattern=r'\bThere\s+are\s+many\s+(nice|good|bad|happy|sad|big|small|tall|short)\s+here\b',
+        error_message="形容词不能直接用在'There are many _____ here'句型中",
+        suggestion="使用名词形式，如：There are many nice books here",
+        weight=2.0
+    ),
+    ValidationRule(
+        name="double_negative",
+        pattern=r'\b(doesn\'t|don\'t|won\'t|can\'t|shouldn\'t|wouldn\'t)\s+\w+\s+(no|not|never|nothing|nobody|nowhere)\b',
+        error_message="英语中不能使用双重否定",
+        suggestion="使用单重否定，如：I don't have any money",
+        weight=2.5
+    ),
+    ValidationRule(
+        name="incomplete_sentence",
+        pattern=r'^[A-Z][^.!?]*$',
+        error_message="句子不完整，缺少标点符号",
+        suggestion="添加适当的标点符号",
+        weight=1.0
+    ),
+)
+
+
+@lru_cache(maxsize=4096)
+def _tense_consistency_issues(question: str, answer: str, topic: str) -> Tuple[Tuple[str, ...], Tuple[str, ...], float]:
+    """
+    检查时态一致性（纯函数，按参数缓存）
+    
+    Returns:
+        Tuple: (问题元组, 建议元组, 扣分)
+    """
+    issues = []
+    suggestions = []
+    penalty = 0.0
+    
+    # 根据语法主题检查时态一致性
+    if "过去时" in topic:
+        # 检查过去时标志词
+        if not _PAST_TIME_RE.search(question) and not _PAST_TIME_RE.search(answer):
+            issues.append("过去时题目缺少时间标志词")
+            suggestions.append("添加yesterday, last week等时间状语")
+            penalty += 1.0
+    
+    elif "进行时" in topic:
+        # 检查进行时标志词
+        if not _PROGRESSIVE_TIME_RE.search(question) and not _PROGRESSIVE_TIME_RE.search(answer):
+            issues.append("进行时题目缺少时间标志词")
+            suggestions.append("添加now, at the moment等时间状语")
+            penalty += 1.0
+    
+    return tuple(issues), tuple(suggestions), penalty
+
+
+@lru_cache(maxsize=4096)
+def _article_usage_issues(question: str, answer: str) -> Tuple[Tuple[str, ...], Tuple[str, ...], float]:
+    """
+    检查冠词a/an的使用（纯函数，按参数缓存）
+    
+    Returns:
+        Tuple: (问题元组, 建议元组, 扣分)
+    """
+    issues = []
+    suggestions = []
+    penalty = 0.0
+    
+    # 检查a/an的使用
+    if _A_BEFORE_VOWEL_RE.search(question):
+        issues.append("a后跟元音音素开头的词，应使用an")
+        suggestions.append("检查冠词a/an的使用规则")
+        penalty += 1.5
+    
+    if _AN_BEFORE_CONSONANT_RE.search(question):
+        issues.append("an后跟辅音音素开头的词，应使用a")
+        suggestions.append("检查冠词a/an的使用规则")
+        penalty += 1.5
+    
+    if _A_BEFORE_VOWEL_RE.search(answer):
+        issues.append("答案中a后跟元音音素开头的词，应使用an")
+        suggestions.append("检查冠词a/an的使用规则")
+        penalty += 1.5
+    
+    if _AN_BEFORE_CONSONANT_RE.search(answer):
+        issues.append("答案中an后跟辅音音素开头的词，应使用a")
+        suggestions.append("检查冠词a/an的使用规则")
+        penalty += 1.5
+    
+    return tuple(issues), tuple(suggestions), penalty
+
 
 class EnglishExerciseValidator(BaseExerciseValidator):
     """英语练习题验证器"""
@@ -23,113 +210,13 @@ class EnglishExerciseValidator(BaseExerciseValidator):
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__("english", config)
         
-        # 英语特定的不可数名词
-        self.uncountable_nouns = {
-            'water', 'milk', 'juice', 'coffee', 'tea', 'oil', 'air', 
-            'music', 'information', 'news', 'advice', 'money', 'time',
-            'weather', 'homework', 'work', 'furniture', 'equipment',
-            'bread', 'rice', 'sugar', 'salt', 'flour', 'meat', 'fish',
-            'cheese', 'butter', 'honey', 'jam', 'soup', 'salad'
-        }
-        
-        # 英语特定的不规则动词
-        self.irregular_verbs = {
-            'go': {'past': 'went', 'past_participle': 'gone', 'third_person': 'goes'},
-            'have': {'past': 'had', 'past_participle': 'had', 'third_person': 'has'},
-            'do': {'past': 'did', 'past_participle': 'done', 'third_person': 'does'},
-            'make': {'past': 'made', 'past_participle': 'made', 'third_person': 'makes'},
-            'take': {'past': 'took', 'past_participle': 'taken', 'third_person': 'takes'},
-            'see': {'past': 'saw', 'past_participle': 'seen', 'third_person': 'sees'},
-            'come': {'past': 'came', 'past_participle': 'come', 'third_person': 'comes'},
-            'give': {'past': 'gave', 'past_participle': 'given', 'third_person': 'gives'},
-            'write': {'past': 'wrote', 'past_participle': 'written', 'third_person': 'writes'},
-            'read': {'past': 'read', 'past_participle': 'read', 'third_person': 'reads'},
-            'speak': {'past': 'spoke', 'past_participle': 'spoken', 'third_person': 'speaks'},
-            'break': {'past': 'broke', 'past_participle': 'broken', 'third_person': 'breaks'},
-            'choose': {'past': 'chose', 'past_participle': 'chosen', 'third_person': 'chooses'},
-            'drive': {'past': 'drove', 'past_participle': 'driven', 'third_person': 'drives'},
-            'eat': {'past': 'ate', 'past_participle': 'eaten', 'third_person': 'eats'},
-            'fall': {'past': 'fell', 'past_participle': 'fallen', 'third_person': 'falls'},
-            'feel': {'past': 'felt', 'past_participle': 'felt', 'third_person': 'feels'},
-            'find': {'past': 'found', 'past_participle': 'found', 'third_person': 'finds'},
-            'get': {'past': 'got', 'past_participle': 'gotten', 'third_person': 'gets'},
-            'know': {'past': 'knew', 'past_participle': 'known', 'third_person': 'knows'},
-        }
+        # 英语特定的不可数名词和不规则动词（模块级只读常量，各实例共享）
+        self.uncountable_nouns = _UNCOUNTABLE_NOUNS
+        self.irregular_verbs = _IRREGULAR_VERBS
     
     def _init_validation_rules(self):
         """初始化学科特定的验证规则"""
-        self.validation_rules = [
-            ValidationRule(
-                name="uncountable_noun_article",
-                pattern=r'\ba\s+(water|milk|air|music|information|news|advice|money|time|weather|homework|work|furniture|equipment|bread|rice|sugar|salt|flour|meat|fish|cheese|butter|honey|jam|soup|salad)\b',
-                error_message="不可数名词不能使用不定冠词a",
-                suggestion="使用some或直接使用名词，如：some water, music",
-                weight=2.0
-            ),
-            ValidationRule(
-                name="i_am_adjective",
-                pattern=r'\bI\s+am\s+(nice|good|bad|happy|sad|tired|hungry|thirsty)\s*[^a-zA-Z]',
-                error_message="I am + 形容词的表达不够自然",
-                suggestion="使用更具体的表达，如：I feel tired, I look happy",
-                weight=1.5
-            ),
-            ValidationRule(
-                name="i_like_adjective",
-                pattern=r'\bI\s+like\s+(nice|good|bad|happy|sad|big|small|tall|short)\s*[^a-zA-Z]',
-                error_message="不能直接说I like + 形容词",
-                suggestion="使用名词形式，如：I like nice things, I like big houses",
-                weight=2.0
-            ),
-            ValidationRule(
-                name="pronoun_article",
-                pattern=r'\bThis\s+is\s+a\s+(they|we|you|I|he|she|it)\b',
-                error_message="代词前不能使用冠词",
-                suggestion="直接使用代词，如：This is he, This is she",
-                weight=2.5
-            ),
-            ValidationRule(
-                name="plural_subject_verb",
-                pattern=r'\b(cat|dog|book|table|student|teacher|car|house)s\s+is\b',
-                error_message="复数名词应该用are而不是is",
-                suggestion="使用are，如：The cats are sleeping",
-                weight=2.0
-            ),
-            ValidationRule(
-                name="third_person_singular",
-                pattern=r'\b(He|She|It)\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s',
-                error_message="第三人称单数后动词应该加-s或变形",
-                suggestion="使用第三人称单数形式，如：He works, She studies",
-                weight=2.0
-            ),
-            ValidationRule(
-                name="there_are_verb",
-                pattern=r'\bThere\s+are\s+many\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s+here\b',
-                error_message="动词不能直接用在'There are many _____ here'句型中",
-                suggestion="使用名词形式，如：There are many students here",
-                weight=2.0
-            ),
-            ValidationRule(
-                name="there_are_adjective",
-                pattern=r'\bThere\s+are\s+many\s+(nice|good|bad|happy|sad|big|small|tall|short)\s+here\b',
-                error_message="形容词不能直接用在'There are many _____ here'句型中",
-                suggestion="使用名词形式，如：There are many nice books here",
-                weight=2.0
-            ),
-            ValidationRule(
-                name="double_negative",
-                pattern=r'\b(doesn\'t|don\'t|won\'t|can\'t|shouldn\'t|wouldn\'t)\s+\w+\s+(no|not|never|nothing|nobody|nowhere)\b',
-                error_message="英语中不能使用双重否定",
-                suggestion="使用单重否定，如：I don't have any money",
-                weight=2.5
-            ),
-            ValidationRule(
-                name="incomplete_sentence",
-                pattern=r'^[A-Z][^.!?]*$',
-                error_message="句子不完整，缺少标点符号",
-                suggestion="添加适当的标点符号",
-                weight=1.0
-            )
-        ]
+        self.validation_rules = list(_VALIDATION_RULES)
     
     def _init_hint_templates(self):
         """初始化学科特定的提示模板"""
@@ -183,18 +270,9 @@ class EnglishExerciseValidator(BaseExerciseValidator):
         }
     
     def _init_error_patterns(self):
-        """初始化学科特定的错误模式"""
+        """初始化学科特定的错误模式（复用验证规则的预编译正则）"""
         self.error_patterns = [
-            (r'\ba\s+(water|milk|air|music|information|news|advice|money|time|weather|homework|work|furniture|equipment|bread|rice|sugar|salt|flour|meat|fish|cheese|butter|honey|jam|soup|salad)\b', '不可数名词不能使用不定冠词a', 2.0),
-            (r'\bI\s+am\s+(nice|good|bad|happy|sad|tired|hungry|thirsty)\s*[^a-zA-Z]', 'I am + 形容词的表达不够自然', 1.5),
-            (r'\bI\s+like\s+(nice|good|bad|happy|sad|big|small|tall|short)\s*[^a-zA-Z]', '不能直接说I like + 形容词', 2.0),
-            (r'\bThis\s+is\s+a\s+(they|we|you|I|he|she|it)\b', '代词前不能使用冠词', 2.5),
-            (r'\b(cat|dog|book|table|student|teacher|car|house)s\s+is\b', '复数名词应该用are而不是is', 2.0),
-            (r'\b(He|She|It)\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s', '第三人称单数后动词应该加-s或变形', 2.0),
-            (r'\bThere\s+are\s+many\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s+here\b', '动词不能直接用在"There are many _____ here"句型中', 2.0),
-            (r'\bThere\s+are\s+many\s+(nice|good|bad|happy|sad|big|small|tall|short)\s+here\b', '形容词不能直接用在"There are many _____ here"句型中，需要搭配名词', 2.0),
-            (r'\b(doesn\'t|don\'t|won\'t|can\'t|shouldn\'t|wouldn\'t)\s+\w+\s+(no|not|never|nothing|nobody|nowhere)\b', '英语中不能使用双重否定', 2.5),
-            (r'^[A-Z][^.!?]*$', '句子不完整，缺少标点符号', 1.0)
+            (rule.compiled, rule.error_message, rule.weight) for rule in self.validation_rules
         ]
     
     def _validate_subject_specific(self, exercise: Dict[str, Any]) -> Dict[str, List[str]]:
@@ -209,12 +287,12 @@ class EnglishExerciseValidator(BaseExerciseValidator):
         
         # 检查英语特定的语法规则
         for rule in self.validation_rules:
-            if re.search(rule.pattern, question, re.IGNORECASE):
+            if rule.compiled.search(question):
                 issues.append(f"语法错误: {rule.error_message}")
                 suggestions.append(rule.suggestion)
                 penalty += rule.weight
             
-            if re.search(rule.pattern, answer, re.IGNORECASE):
+            if rule.compiled.search(answer):
                 issues.append(f"答案语法错误: {rule.error_message}")
                 suggestions.append(rule.suggestion)
                 penalty += rule.weight
@@ -245,81 +323,37 @@ class EnglishExerciseValidator(BaseExerciseValidator):
         suggestions = []
         penalty = 0.0
         
-        # 检查问题中的不可数名词
-        for noun in self.uncountable_nouns:
-            pattern = rf'\ba\s+{noun}\b'
-            if re.search(pattern, question, re.IGNORECASE):
-                issues.append(f"不可数名词'{noun}'不能使用不定冠词a")
-                suggestions.append(f"使用some {noun}或直接使用{noun}")
-                penalty += 2.0
-            
-            if re.search(pattern, answer, re.IGNORECASE):
-                issues.append(f"答案中不可数名词'{noun}'不能使用不定冠词a")
-                suggestions.append(f"使用some {noun}或直接使用{noun}")
-                penalty += 2.0
+        # 检查问题中的不可数名词（同一名词只报告一次）
+        for noun in self._find_uncountable_nouns(question):
+            issues.append(f"不可数名词'{noun}'不能使用不定冠词a")
+            suggestions.append(f"使用some {noun}或直接使用{noun}")
+            penalty += 2.0
+        
+        for noun in self._find_uncountable_nouns(answer):
+            issues.append(f"答案中不可数名词'{noun}'不能使用不定冠词a")
+            suggestions.append(f"使用some {noun}或直接使用{noun}")
+            penalty += 2.0
         
         return {'issues': issues, 'suggestions': suggestions, 'penalty': penalty}
     
+    def _find_uncountable_nouns(self, text: str) -> List[str]:
+        """找出文本中前面使用了不定冠词a的不可数名词（按出现顺序去重）"""
+        nouns = []
+        for match in _A_FOLLOWED_WORD_RE.finditer(text):
+            word = match.group(1).lower()
+            if word in self.uncountable_nouns and word not in nouns:
+                nouns.append(word)
+        return nouns
+    
     def _check_tense_consistency(self, question: str, answer: str, topic: str) -> Dict[str, Any]:
         """检查时态一致性"""
-        issues = []
-        suggestions = []
-        penalty = 0.0
-        
-        # 根据语法主题检查时态一致性
-        if "过去时" in topic:
-            # 检查过去时标志词
-            past_time_words = ['yesterday', 'last', 'ago', 'before', 'then']
-            has_past_time = any(word in question.lower() for word in past_time_words)
-            
-            if not has_past_time and not any(word in answer.lower() for word in past_time_words):
-                issues.append("过去时题目缺少时间标志词")
-                suggestions.append("添加yesterday, last week等时间状语")
-                penalty += 1.0
-        
-        elif "进行时" in topic:
-            # 检查进行时标志词
-            progressive_time_words = ['now', 'at the moment', 'currently', 'right now']
-            has_progressive_time = any(word in question.lower() for word in progressive_time_words)
-            
-            if not has_progressive_time and not any(word in answer.lower() for word in progressive_time_words):
-                issues.append("进行时题目缺少时间标志词")
-                suggestions.append("添加now, at the moment等时间状语")
-                penalty += 1.0
-        
-        return {'issues': issues, 'suggestions': suggestions, 'penalty': penalty}
+        issues, suggestions, penalty = _tense_consistency_issues(question, answer, topic)
+        return {'issues': list(issues), 'suggestions': list(suggestions), 'penalty': penalty}
     
     def _check_article_usage(self, question: str, answer: str) -> Dict[str, Any]:
         """检查冠词使用"""
-        issues = []
-        suggestions = []
-        penalty = 0.0
-        
-        # 检查a/an的使用
-        a_pattern = r'\ba\s+[aeiouAEIOU]'
-        an_pattern = r'\ban\s+[bcdfghjklmnpqrstvwxyzBCDFGHJKLMNPQRSTVWXYZ]'
-        
-        if re.search(a_pattern, question, re.IGNORECASE):
-            issues.append("a后跟元音音素开头的词，应使用an")
-            suggestions.append("检查冠词a/an的使用规则")
-            penalty += 1.5
-        
-        if re.search(an_pattern, question, re.IGNORECASE):
-            issues.append("an后跟辅音音素开头的词，应使用a")
-            suggestions.append("检查冠词a/an的使用规则")
-            penalty += 1.5
-        
-        if re.search(a_pattern, answer, re.IGNORECASE):
-            issues.append("答案中a后跟元音音素开头的词，应使用an")
-            suggestions.append("检查冠词a/an的使用规则")
-            penalty += 1.5
-        
-        if re.search(an_pattern, answer, re.IGNORECASE):
-            issues.append("答案中an后跟辅音音素开头的词，应使用a")
-            suggestions.append("检查冠词a/an的使用规则")
-            penalty += 1.5
-        
-        return {'issues': issues, 'suggestions': suggestions, 'penalty': penalty}
+        issues, suggestions, penalty = _article_usage_issues(question, answer)
+        return {'issues': list(issues), 'suggestions': list(suggestions), 'penalty': penalty}
     
     def _generate_hint(self, exercise: Dict[str, Any]) -> str:
         """生成英语特定的提示"""
@@ -327,12 +361,9 @@ class EnglishExerciseValidator(BaseExerciseValidator):
         difficulty = exercise.get('difficulty', 'medium')
         
         # 从英语特定的提示模板中获取
-        if topic in self.hint_templates:
-            topic_hints = self.hint_templates[topic]
-            if difficulty in topic_hints:
-                return topic_hints[difficulty]
-            elif 'general' in topic_hints:
-                return topic_hints['general']
+        hint = self._lookup_hint(topic, difficulty)
+        if hint is not None:
+            return hint
         
         # 默认英语提示
         return "请仔细阅读题目，注意英语语法规则和词汇用法。"
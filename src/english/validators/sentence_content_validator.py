@@ -6,16 +6,496 @@
 """
 
 import re
-import random
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
-
-# 添加共享框架路径
-import sys
-import os
+import weakref
+from itertools import count
+from types import MappingProxyType
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Pattern, Tuple
 
 from src.shared.learning_framework.validation.base_sentence_validator import BaseSentenceValidator, SentenceTemplate, ValidationLevel
 
+# 优先使用线性时间的RE2引擎（可选依赖 google-re2），未安装时回退到标准库re
+try:
+    import re2 as _regex_engine
+except ImportError:
+    _regex_engine = re
+
+
+def _compile(pattern: str):
+    """
+    用当前引擎编译正则
+    
+    RE2中\\b、\\w、\\s只认ASCII字符，标准库re默认按Unicode处理（汉字算单词字符），
+    回退到re时加上re.ASCII，保证两种引擎的匹配结果一致
+    """
+    if _regex_engine is re:
+        return re.compile(pattern, re.ASCII)
+    return _regex_engine.compile(pattern)
+
+
+def _compile_ci(pattern: str):
+    """编译忽略大小写的正则（RE2不接受re的flags参数，统一用内联(?i)）"""
+    return _compile(f'(?i){pattern}')
+
+
+def _compile_lowered(pattern: str):
+    """
+    编译用于匹配小写化句子的正则：模式转为小写后不再需要忽略大小写，省去逐字符的大小写折叠
+    
+    Args:
+        pattern: 原始（忽略大小写语义的）模式
+        
+    Returns:
+        编译后的正则；模式含\\S、\\B等大写转义时不能直接转小写，仍按忽略大小写编译
+    """
+    if re.search(r'\\[A-Z]', pattern):
+        return _compile_ci(pattern)
+    return _compile(pattern.lower())
+
+
+# 冠词检查：(正则, 问题, 建议, 扣分)，与验证规则合并到同一次扫描中（匹配小写化的句子）
+_ARTICLE_CHECKS = (
+    (_compile_lowered(r'\ba\s+[aeiouAEIOU]'), "a后跟元音音素开头的词，应使用an", "检查冠词a/an的使用规则", 1.5),
+    (_compile_lowered(r'\ban\s+[bcdfghjklmnpqrstvwxyzBCDFGHJKLMNPQRSTVWXYZ]'), "an后跟辅音音素开头的词，应使用a", "检查冠词a/an的使用规则", 1.5),
+)
+
+# 时态标志词（按整词匹配，避免dragon中的ago、strengthen中的then等误判；
+# 撇号不算单词的一部分，yesterday's、now's 仍能识别出标志词）
+_WORD_RE = re.compile(r"[a-z]+")
+_PAST_MARKERS = frozenset({'yesterday', 'last', 'ago', 'before', 'then'})
+_PROGRESSIVE_MARKERS = frozenset({'now', 'currently'})  # right now 已被 now 覆盖
+_PROGRESSIVE_PHRASES = (' at the moment ',)
+
+# 英语特定的不规则动词（只读）
+_IRREGULAR_VERBS = MappingProxyType({
+    'go': MappingProxyType({'past': 'went', 'past_participle': 'gone', 'third_person': 'goes'}),
+    'have': MappingProxyType({'past': 'had', 'past_participle': 'had', 'third_person': 'has'}),
+    'do': MappingProxyType({'past': 'did', 'past_participle': 'done', 'third_person': 'does'}),
+    'make': MappingProxyType({'past': 'made', 'past_participle': 'made', 'third_person': 'makes'}),
+    'take': MappingProxyType({'past': 'took', 'past_participle': 'taken', 'third_person': 'takes'}),
+    'see': MappingProxyType({'past': 'saw', 'past_participle': 'seen', 'third_person': 'sees'}),
+    'come': MappingProxyType({'past': 'came', 'past_participle': 'come', 'third_person': 'comes'}),
+    'give': MappingProxyType({'past': 'gave', 'past_participle': 'given', 'third_person': 'gives'}),
+    'write': MappingProxyType({'past': 'wrote', 'past_participle': 'written', 'third_person': 'writes'}),
+    'read': MappingProxyType({'past': 'read', 'past_participle': 'read', 'third_person': 'reads'}),
+    'speak': MappingProxyType({'past': 'spoke', 'past_participle': 'spoken', 'third_person': 'speaks'}),
+    'break': MappingProxyType({'past': 'broke', 'past_participle': 'broken', 'third_person': 'breaks'}),
+    'choose': MappingProxyType({'past': 'chose', 'past_participle': 'chosen', 'third_person': 'chooses'}),
+    'drive': MappingProxyType({'past': 'drove', 'past_participle': 'driven', 'third_person': 'drives'}),
+    'eat': MappingProxyType({'past': 'ate', 'past_participle': 'eaten', 'third_person': 'eats'}),
+    'fall': MappingProxyType({'past': 'fell', 'past_participle': 'fallen', 'third_person': 'falls'}),
+    'feel': MappingProxyType({'past': 'felt', 'past_participle': 'felt', 'third_person': 'feels'}),
+    'find': MappingProxyType({'past': 'found', 'past_participle': 'found', 'third_person': 'finds'}),
+    'get': MappingProxyType({'past': 'got', 'past_participle': 'gotten', 'third_person': 'gets'}),
+    'know': MappingProxyType({'past': 'knew', 'past_participle': 'known', 'third_person': 'knows'}),
+})
+
+# 英语特定的不可数名词
+_UNCOUNTABLE_NOUNS = frozenset({
+    'water', 'milk', 'juice', 'coffee', 'tea', 'oil', 'air', 
+    'music', 'information', 'news', 'advice', 'money', 'time',
+    'weather', 'homework', 'work', 'furniture', 'equipment',
+    'bread', 'rice', 'sugar', 'salt', 'flour', 'meat', 'fish',
+    'cheese', 'butter', 'honey', 'jam', 'soup', 'salad'
+})
+
+# 所有不可数名词合并为一个"a + 名词"的交替正则
+_UNCOUNTABLE_RE = _compile_ci(
+    r'\ba\s+(' + '|'.join(re.escape(noun) for noun in sorted(_UNCOUNTABLE_NOUNS, key=len, reverse=True)) + r')\b'
+)
+
+# 英语句子模板（各实例共享模板对象）
+_TEMPLATES = {
+    "一般现在时": [
+        SentenceTemplate(
+            pattern="I {verb} every day.",
+            chinese_pattern="我每天{verb_cn}。",
+            word_types=["verb"],
+            grammar_topics=["一般现在时-基础用法"],
+            difficulty="easy",
+            examples=[{"verb": "work", "verb_cn": "工作"}],
+            validation_rules=["verb_form", "tense_consistency"]
+        ),
+        SentenceTemplate(
+            pattern="He {verb_3rd} {noun} every morning.",
+            chinese_pattern="他每天早上{verb_cn}{noun_cn}。",
+            word_types=["verb", "noun"],
+            grammar_topics=["一般现在时-第三人称单数"],
+            difficulty="easy",
+            examples=[{"verb": "reads", "verb_cn": "读", "noun": "books", "noun_cn": "书"}],
+            validation_rules=["third_person_singular", "verb_form"]
+        ),
+        SentenceTemplate(
+            pattern="This is a {adjective} {noun}.",
+            chinese_pattern="这是一个{adjective_cn}的{noun_cn}。",
+            word_types=["adjective", "noun"],
+            grammar_topics=["一般现在时-基础用法"],
+            difficulty="easy",
+            examples=[{"adjective": "nice", "adjective_cn": "好", "noun": "book", "noun_cn": "书"}],
+            validation_rules=["article_usage", "adjective_noun_order"]
+        )
+    ],
+    "名词单复数": [
+        SentenceTemplate(
+            pattern="I have two {noun_plural}.",
+            chinese_pattern="我有两个{noun_cn}。",
+            word_types=["noun"],
+            grammar_topics=["名词单复数-基础规则"],
+            difficulty="easy",
+            examples=[{"noun_plural": "books", "noun_cn": "书"}],
+            validation_rules=["plural_form", "countable_noun"]
+        ),
+        SentenceTemplate(
+            pattern="There are many {noun_plural} in the {place}.",
+            chinese_pattern="{place_cn}里有很多{noun_cn}。",
+            word_types=["noun", "noun"],
+            grammar_topics=["名词单复数-基础规则"],
+            difficulty="medium",
+            examples=[{"noun_plural": "students", "noun_cn": "学生", "place": "school", "place_cn": "学校"}],
+            validation_rules=["plural_form", "there_be_structure"]
+        )
+    ],
+    "一般过去时": [
+        SentenceTemplate(
+            pattern="I {verb_past} yesterday.",
+            chinese_pattern="我昨天{verb_cn}了。",
+            word_types=["verb"],
+            grammar_topics=["一般过去时-基础用法"],
+            difficulty="easy",
+            examples=[{"verb_past": "worked", "verb_cn": "工作"}],
+            validation_rules=["past_tense", "time_marker"]
+        ),
+        SentenceTemplate(
+            pattern="We {verb_past} {noun} last week.",
+            chinese_pattern="我们上周{verb_cn}了{noun_cn}。",
+            word_types=["verb", "noun"],
+            grammar_topics=["一般过去时-基础用法"],
+            difficulty="medium",
+            examples=[{"verb_past": "saw", "verb_cn": "看见", "noun": "movies", "noun_cn": "电影"}],
+            validation_rules=["past_tense", "time_marker"]
+        )
+    ],
+    "现在进行时": [
+        SentenceTemplate(
+            pattern="I am {verb_ing} now.",
+            chinese_pattern="我现在正在{verb_cn}。",
+            word_types=["verb"],
+            grammar_topics=["现在进行时-基础用法"],
+            difficulty="easy",
+            examples=[{"verb_ing": "working", "verb_cn": "工作"}],
+            validation_rules=["present_continuous", "ing_form"]
+        ),
+        SentenceTemplate(
+            pattern="She is {verb_ing} {noun} in the {place}.",
+            chinese_pattern="她正在{place_cn}里{verb_cn}{noun_cn}。",
+            word_types=["verb", "noun", "noun"],
+            grammar_topics=["现在进行时-基础用法"],
+            difficulty="medium",
+            examples=[{"verb_ing": "reading", "verb_cn": "读", "noun": "books", "noun_cn": "书", "place": "library", "place_cn": "图书馆"}],
+            validation_rules=["present_continuous", "ing_form", "preposition_usage"]
+        )
+    ],
+    "现在完成时": [
+        SentenceTemplate(
+            pattern="I have {verb_past_participle} {noun}.",
+            chinese_pattern="我已经{verb_cn}了{noun_cn}。",
+            word_types=["verb", "noun"],
+            grammar_topics=["现在完成时-基础用法"],
+            difficulty="medium",
+            examples=[{"verb_past_participle": "finished", "verb_cn": "完成", "noun": "homework", "noun_cn": "作业"}],
+            validation_rules=["present_perfect", "past_participle"]
+        ),
+        SentenceTemplate(
+            pattern="She has {verb_past_participle} to {place}.",
+            chinese_pattern="她已经去过{place_cn}了。",
+            word_types=["verb", "noun"],
+            grammar_topics=["现在完成时-基础用法"],
+            difficulty="medium",
+            examples=[{"verb_past_participle": "been", "verb_cn": "去", "place": "London", "place_cn": "伦敦"}],
+            validation_rules=["present_perfect", "past_participle", "preposition_usage"]
+        )
+    ],
+    "被动语态": [
+        SentenceTemplate(
+            pattern="The {noun} is {verb_past_participle} by {agent}.",
+            chinese_pattern="{noun_cn}被{agent_cn}{verb_cn}了。",
+            word_types=["noun", "verb", "noun"],
+            grammar_topics=["被动语态-基础用法"],
+            difficulty="advanced",
+            examples=[{"noun": "book", "noun_cn": "书", "verb_past_participle": "written", "verb_cn": "写", "agent": "Shakespeare", "agent_cn": "莎士比亚"}],
+            validation_rules=["passive_voice", "past_participle", "by_phrase"]
+        )
+    ],
+    "情态动词": [
+        SentenceTemplate(
+            pattern="I {modal_verb} {verb} {noun}.",
+            chinese_pattern="我{modal_verb_cn}{verb_cn}{noun_cn}。",
+            word_types=["verb", "verb", "noun"],
+            grammar_topics=["情态动词-基础用法"],
+            difficulty="medium",
+            examples=[{"modal_verb": "can", "modal_verb_cn": "能", "verb": "speak", "verb_cn": "说", "noun": "English", "noun_cn": "英语"}],
+            validation_rules=["modal_verb", "base_verb_form"]
+        )
+    ]
+}
+
+# 英语语法验证规则（原始模式）
+_VALIDATION_PATTERNS = {
+    "verb_form": [
+        r'\b(He|She|It)\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s',
+        r'\bI\s+(works|studies|goes|plays|runs|jumps|dances|sings|reads|writes|eats|drinks|sleeps|thinks)\s'
+    ],
+    "tense_consistency": [
+        r'\b(yesterday|last|ago|before|then)\s+\w+\s+(will|can|may|must)\b',
+        r'\b(now|at the moment|currently)\s+\w+\s+(went|saw|did|had)\b'
+    ],
+    "third_person_singular": [
+        r'\b(He|She|It)\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s'
+    ],
+    "article_usage": [
+        r'\ba\s+[aeiouAEIOU]',
+        r'\ban\s+[bcdfghjklmnpqrstvwxyzBCDFGHJKLMNPQRSTVWXYZ]',
+        r'\ba\s+(water|milk|air|music|information|news|advice|money|time|weather|homework|work|furniture|equipment)'
+    ],
+    "adjective_noun_order": [
+        r'\b(nice|good|bad|big|small|tall|short)\s+(I|you|he|she|it|we|they)\b'
+    ],
+    "plural_form": [
+        r'\b(cat|dog|book|table|student|teacher|car|house)s\s+is\b',
+        r'\b(man|woman|child|person)s\s+is\b'
+    ],
+    "countable_noun": [
+        r'\ba\s+(water|milk|air|music|information|news|advice|money|time|weather|homework|work|furniture|equipment)'
+    ],
+    "there_be_structure": [
+        r'\bThere\s+are\s+many\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s+here\b',
+        r'\bThere\s+are\s+many\s+(nice|good|bad|happy|sad|big|small|tall|short)\s+here\b'
+    ],
+    "past_tense": [
+        r'\bI\s+(go|see|do|have|make|take|come|give|write|read|speak|break|choose|drive|eat|fall|feel|find|get|know)\s',
+        r'\b(He|She|It)\s+(go|see|do|have|make|take|come|give|write|read|speak|break|choose|drive|eat|fall|feel|find|get|know)\s'
+    ],
+    "time_marker": [
+        r'\b(yesterday|last|ago|before|then)\b'
+    ],
+    "present_continuous": [
+        r'\b(am|is|are)\s+\w+ing\b'
+    ],
+    "ing_form": [
+        r'\b(am|is|are)\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s'
+    ],
+    "preposition_usage": [
+        r'\bin\s+the\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\b'
+    ],
+    "present_perfect": [
+        r'\b(have|has)\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s'
+    ],
+    "past_participle": [
+        r'\b(have|has)\s+(go|see|do|have|make|take|come|give|write|read|speak|break|choose|drive|eat|fall|feel|find|get|know)\s'
+    ],
+    "passive_voice": [
+        r'\b(am|is|are|was|were)\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s'
+    ],
+    "by_phrase": [
+        r'\bby\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\b'
+    ],
+    "modal_verb": [
+        r'\b(can|could|may|might|must|should|would|will)\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s'
+    ],
+    "base_verb_form": [
+        r'\b(can|could|may|might|must|should|would|will)\s+(works|studies|goes|plays|runs|jumps|dances|sings|reads|writes|eats|drinks|sleeps|thinks)\s'
+    ]
+}
+
+# 预编译的验证规则（导入时编译一次，各验证器实例共享；匹配小写化的句子）
+_VALIDATION_RULES = MappingProxyType({
+    rule_name: tuple(_compile_lowered(pattern) for pattern in patterns)
+    for rule_name, patterns in _VALIDATION_PATTERNS.items()
+})
+
+# 验证规则的 (错误信息, 建议, 扣分)
+_RULE_META = {
+    "verb_form": ("动词形式错误", "检查动词形式是否正确", 2.0),
+    "tense_consistency": ("时态不一致", "确保时态一致", 2.5),
+    "third_person_singular": ("第三人称单数形式错误", "第三人称单数动词要加-s或变形", 2.0),
+    "article_usage": ("冠词使用错误", "检查冠词a/an的使用规则", 1.5),
+    "adjective_noun_order": ("形容词和名词顺序错误", "形容词通常放在名词前面", 1.0),
+    "plural_form": ("复数形式错误", "检查复数形式是否正确", 2.0),
+    "countable_noun": ("可数名词使用错误", "注意可数名词和不可数名词的区别", 2.0),
+    "there_be_structure": ("There be句型结构错误", "There be句型中be动词要与后面的名词保持一致", 2.0),
+    "past_tense": ("过去时形式错误", "使用正确的过去时形式", 2.0),
+    "time_marker": ("时间标志词缺失", "添加适当的时间标志词", 1.0),
+    "present_continuous": ("现在进行时形式错误", "现在进行时 = be + 动词-ing", 2.0),
+    "ing_form": ("动词-ing形式错误", "动词-ing形式变化规则", 2.0),
+    "preposition_usage": ("介词使用错误", "检查介词的使用", 1.5),
+    "present_perfect": ("现在完成时形式错误", "现在完成时 = have/has + 过去分词", 2.0),
+    "past_participle": ("过去分词形式错误", "使用正确的过去分词形式", 2.0),
+    "passive_voice": ("被动语态形式错误", "被动语态 = be + 过去分词", 2.5),
+    "by_phrase": ("by短语使用错误", "被动语态可以用by引出动作执行者", 1.5),
+    "modal_verb": ("情态动词使用错误", "情态动词 + 动词原形", 2.0),
+    "base_verb_form": ("动词原形使用错误", "情态动词后使用动词原形", 2.0)
+}
+_DEFAULT_RULE_META = ("语法错误", "请检查语法", 1.0)
+
+
+def _build_checks(validation_rules) -> List[Tuple[Pattern, Tuple[Tuple[str, str, float], ...]]]:
+    """
+    合并验证规则和冠词检查，相同的正则只保留一份
+    
+    Args:
+        validation_rules: 规则名到已编译正则列表的映射
+        
+    Returns:
+        List: (正则, ((问题, 建议, 扣分), ...)) 列表，正则命中时报告其下所有问题
+    """
+    checks = {}
+    for rule_name, patterns in validation_rules.items():
+        error_msg, suggestion, penalty = _RULE_META.get(rule_name, _DEFAULT_RULE_META)
+        entry = (f"语法错误: {error_msg}", suggestion, penalty)
+        for pattern in patterns:
+            checks.setdefault(pattern.pattern, (pattern, []))[1].append(entry)
+    
+    for pattern, issue, suggestion, penalty in _ARTICLE_CHECKS:
+        checks.setdefault(pattern.pattern, (pattern, []))[1].append((issue, suggestion, penalty))
+    
+    return [(pattern, tuple(entries)) for pattern, entries in checks.values()]
+
+
+# 默认规则合并后的检查列表（未添加自定义规则的实例共享）
+_DEFAULT_CHECKS = tuple(_build_checks(_VALIDATION_RULES))
+
+# 规则集登记表：规则版本号 -> (检查列表, 问题数上限, 扣分上限)
+# 验证结果缓存以版本号为键，不持有验证器实例；规则变化时换用新版本号，旧结果自然失效。
+# 添加过自定义规则的实例被回收或再次添加规则时，其版本从登记表移除
+_RULE_SETS: Dict[int, Tuple[tuple, Optional[int], Optional[float]]] = {}
+_rules_versions = count()
+
+
+def _order_checks(checks, max_issues: Optional[int], penalty_cap: Optional[float]) -> tuple:
+    """配置了提前结束条件时，按扣分从高到低排列检查，尽早达到上限；否则保持原顺序"""
+    if max_issues is None and penalty_cap is None:
+        return tuple(checks)
+    return tuple(sorted(checks, key=lambda check: -sum(entry[2] for entry in check[1])))
+
+
+def _register_rule_set(checks, max_issues: Optional[int], penalty_cap: Optional[float]) -> int:
+    """
+    登记一组规则，返回新的规则版本号
+    
+    Args:
+        checks: 合并后的检查列表
+        max_issues: 问题数上限
+        penalty_cap: 扣分上限
+        
+    Returns:
+        int: 规则版本号
+    """
+    rules_version = next(_rules_versions)
+    _RULE_SETS[rules_version] = (_order_checks(checks, max_issues, penalty_cap), max_issues, penalty_cap)
+    return rules_version
+
+
+@lru_cache(maxsize=None)
+def _default_rules_version(max_issues: Optional[int], penalty_cap: Optional[float]) -> int:
+    """默认规则的版本号（提前结束条件相同的实例共享同一版本和缓存结果）"""
+    return _register_rule_set(_DEFAULT_CHECKS, max_issues, penalty_cap)
+
+
+def _limit_reached(max_issues: Optional[int], penalty_cap: Optional[float],
+                   issue_count: int, penalty: float) -> bool:
+    """是否已达到配置的问题数或扣分上限"""
+    return ((max_issues is not None and issue_count >= max_issues)
+            or (penalty_cap is not None and penalty >= penalty_cap))
+
+
+def _check_uncountable_nouns(sentence: str, issues: List[str], suggestions: List[str]) -> float:
+    """
+    检查不可数名词使用，问题和建议直接追加到传入的列表
+    
+    Args:
+        sentence: 句子
+        issues: 问题列表
+        suggestions: 建议列表
+        
+    Returns:
+        float: 扣分
+    """
+    penalty = 0.0
+    
+    # 一次扫描找出所有命中的名词（按出现顺序去重）
+    nouns = dict.fromkeys(match.group(1).lower() for match in _UNCOUNTABLE_RE.finditer(sentence))
+    for noun in nouns:
+        issues.append(f"不可数名词'{noun}'不能使用不定冠词a")
+        suggestions.append(f"使用some {noun}或直接使用{noun}")
+        penalty += 2.0
+    
+    return penalty
+
+
+def _check_tense_consistency(sentence: str, grammar_topic: str,
+                             issues: List[str], suggestions: List[str]) -> float:
+    """
+    检查时态一致性，问题和建议直接追加到传入的列表
+    
+    Args:
+        sentence: 句子
+        grammar_topic: 语法主题
+        issues: 问题列表
+        suggestions: 建议列表
+        
+    Returns:
+        float: 扣分
+    """
+    penalty = 0.0
+    
+    if "过去时" in grammar_topic:
+        tokens = _WORD_RE.findall(sentence.lower())
+        has_past_time = not _PAST_MARKERS.isdisjoint(tokens)
+        
+        if not has_past_time:
+            issues.append("过去时句子缺少时间标志词")
+            suggestions.append("添加yesterday, last week等时间状语")
+            penalty += 1.0
+    
+    elif "进行时" in grammar_topic:
+        tokens = _WORD_RE.findall(sentence.lower())
+        joined = f" {' '.join(tokens)} "
+        has_progressive_time = (not _PROGRESSIVE_MARKERS.isdisjoint(tokens)
+                                or any(phrase in joined for phrase in _PROGRESSIVE_PHRASES))
+        
+        if not has_progressive_time:
+            issues.append("进行时句子缺少时间标志词")
+            suggestions.append("添加now, at the moment等时间状语")
+            penalty += 1.0
+    
+    return penalty
+
+
+# 英语错误模式：(模式, 错误信息, 扣分)
+_ERROR_PATTERN_SOURCES = (
+    (r'\ba\s+(water|milk|air|music|information|news|advice|money|time|weather|homework|work|furniture|equipment|bread|rice|sugar|salt|flour|meat|fish|cheese|butter|honey|jam|soup|salad)\b', '不可数名词不能使用不定冠词a', 2.0),
+    (r'\bI\s+am\s+(nice|good|bad|happy|sad|tired|hungry|thirsty)\s*[^a-zA-Z]', 'I am + 形容词的表达不够自然', 1.5),
+    (r'\bI\s+like\s+(nice|good|bad|happy|sad|big|small|tall|short)\s*[^a-zA-Z]', '不能直接说I like + 形容词', 2.0),
+    (r'\bThis\s+is\s+a\s+(they|we|you|I|he|she|it)\b', '代词前不能使用冠词', 2.5),
+    (r'\b(cat|dog|book|table|student|teacher|car|house)s\s+is\b', '复数名词应该用are而不是is', 2.0),
+    (r'\b(He|She|It)\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s', '第三人称单数后动词应该加-s或变形', 2.0),
+    (r'\bThere\s+are\s+many\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s+here\b', '动词不能直接用在"There are many _____ here"句型中', 2.0),
+    (r'\bThere\s+are\s+many\s+(nice|good|bad|happy|sad|big|small|tall|short)\s+here\b', '形容词不能直接用在"There are many _____ here"句型中，需要搭配名词', 2.0),
+    (r'\b(doesn\'t|don\'t|won\'t|can\'t|shouldn\'t|wouldn\'t)\s+\w+\s+(no|not|never|nothing|nobody|nowhere)\b', '英语中不能使用双重否定', 2.5),
+    (r'^[A-Z][^.!?]*$', '句子不完整，缺少标点符号', 1.0),
+    (r'\ba\s+[aeiouAEIOU]', 'a后跟元音音素开头的词，应使用an', 1.5),
+    (r'\ban\s+[bcdfghjklmnpqrstvwxyzBCDFGHJKLMNPQRSTVWXYZ]', 'an后跟辅音音素开头的词，应使用a', 1.5),
+    (r'\b(am|is|are)\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s', '现在进行时动词应该加-ing', 2.0),
+    (r'\b(have|has)\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s', '现在完成时动词应该用过去分词', 2.0),
+    (r'\b(can|could|may|might|must|should|would|will)\s+(works|studies|goes|plays|runs|jumps|dances|sings|reads|writes|eats|drinks|sleeps|thinks)\s', '情态动词后应该用动词原形', 2.0)
+)
+
+# 预编译的错误模式（导入时编译一次，各验证器实例共享）
+_ERROR_PATTERNS = tuple(
+    (_compile_ci(pattern), error_msg, weight)
+    for pattern, error_msg, weight in _ERROR_PATTERN_SOURCES
+)
+
 
 class EnglishSentenceValidator(BaseSentenceValidator):
     """英语句子验证器"""
@@ -23,434 +503,87 @@ class EnglishSentenceValidator(BaseSentenceValidator):
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__("english", config)
         
-        # 英语特定的不规则动词
-        self.irregular_verbs = {
-            'go': {'past': 'went', 'past_participle': 'gone', 'third_person': 'goes'},
-            'have': {'past': 'had', 'past_participle': 'had', 'third_person': 'has'},
-            'do': {'past': 'did', 'past_participle': 'done', 'third_person': 'does'},
-            'make': {'past': 'made', 'past_participle': 'made', 'third_person': 'makes'},
-            'take': {'past': 'took', 'past_participle': 'taken', 'third_person': 'takes'},
-            'see': {'past': 'saw', 'past_participle': 'seen', 'third_person': 'sees'},
-            'come': {'past': 'came', 'past_participle': 'come', 'third_person': 'comes'},
-            'give': {'past': 'gave', 'past_participle': 'given', 'third_person': 'gives'},
-            'write': {'past': 'wrote', 'past_participle': 'written', 'third_person': 'writes'},
-            'read': {'past': 'read', 'past_participle': 'read', 'third_person': 'reads'},
-            'speak': {'past': 'spoke', 'past_participle': 'spoken', 'third_person': 'speaks'},
-            'break': {'past': 'broke', 'past_participle': 'broken', 'third_person': 'breaks'},
-            'choose': {'past': 'chose', 'past_participle': 'chosen', 'third_person': 'chooses'},
-            'drive': {'past': 'drove', 'past_participle': 'driven', 'third_person': 'drives'},
-            'eat': {'past': 'ate', 'past_participle': 'eaten', 'third_person': 'eats'},
-            'fall': {'past': 'fell', 'past_participle': 'fallen', 'third_person': 'falls'},
-            'feel': {'past': 'felt', 'past_participle': 'felt', 'third_person': 'feels'},
-            'find': {'past': 'found', 'past_participle': 'found', 'third_person': 'finds'},
-            'get': {'past': 'got', 'past_participle': 'gotten', 'third_person': 'gets'},
-            'know': {'past': 'knew', 'past_participle': 'known', 'third_person': 'knows'},
-        }
-        
-        # 英语特定的不可数名词
-        self.uncountable_nouns = {
-            'water', 'milk', 'juice', 'coffee', 'tea', 'oil', 'air', 
-            'music', 'information', 'news', 'advice', 'money', 'time',
-            'weather', 'homework', 'work', 'furniture', 'equipment',
-            'bread', 'rice', 'sugar', 'salt', 'flour', 'meat', 'fish',
-            'cheese', 'butter', 'honey', 'jam', 'soup', 'salad'
-        }
+        # 英语特定的不规则动词和不可数名词（模块级只读常量，各实例共享）
+        self.irregular_verbs = _IRREGULAR_VERBS
+        self.uncountable_nouns = _UNCOUNTABLE_NOUNS
     
     def _init_templates(self):
         """初始化学科特定的模板"""
-        self.templates = {
-            "一般现在时": [
-                SentenceTemplate(
-                    pattern="I {verb} every day.",
-                    chinese_pattern="我每天{verb_cn}。",
-                    word_types=["verb"],
-                    grammar_topics=["一般现在时-基础用法"],
-                    difficulty="easy",
-                    examples=[{"verb": "work", "verb_cn": "工作"}],
-                    validation_rules=["verb_form", "tense_consistency"]
-                ),
-                SentenceTemplate(
-                    pattern="He {verb_3rd} {noun} every morning.",
-                    chinese_pattern="他每天早上{verb_cn}{noun_cn}。",
-                    word_types=["verb", "noun"],
-                    grammar_topics=["一般现在时-第三人称单数"],
-                    difficulty="easy",
-                    examples=[{"verb": "reads", "verb_cn": "读", "noun": "books", "noun_cn": "书"}],
-                    validation_rules=["third_person_singular", "verb_form"]
-                ),
-                SentenceTemplate(
-                    pattern="This is a {adjective} {noun}.",
-                    chinese_pattern="这是一个{adjective_cn}的{noun_cn}。",
-                    word_types=["adjective", "noun"],
-                    grammar_topics=["一般现在时-基础用法"],
-                    difficulty="easy",
-                    examples=[{"adjective": "nice", "adjective_cn": "好", "noun": "book", "noun_cn": "书"}],
-                    validation_rules=["article_usage", "adjective_noun_order"]
-                )
-            ],
-            "名词单复数": [
-                SentenceTemplate(
-                    pattern="I have two {noun_plural}.",
-                    chinese_pattern="我有两个{noun_cn}。",
-                    word_types=["noun"],
-                    grammar_topics=["名词单复数-基础规则"],
-                    difficulty="easy",
-                    examples=[{"noun_plural": "books", "noun_cn": "书"}],
-                    validation_rules=["plural_form", "countable_noun"]
-                ),
-                SentenceTemplate(
-                    pattern="There are many {noun_plural} in the {place}.",
-                    chinese_pattern="{place_cn}里有很多{noun_cn}。",
-                    word_types=["noun", "noun"],
-                    grammar_topics=["名词单复数-基础规则"],
-                    difficulty="medium",
-                    examples=[{"noun_plural": "students", "noun_cn": "学生", "place": "school", "place_cn": "学校"}],
-                    validation_rules=["plural_form", "there_be_structure"]
-                )
-            ],
-            "一般过去时": [
-                SentenceTemplate(
-                    pattern="I {verb_past} yesterday.",
-                    chinese_pattern="我昨天{verb_cn}了。",
-                    word_types=["verb"],
-                    grammar_topics=["一般过去时-基础用法"],
-                    difficulty="easy",
-                    examples=[{"verb_past": "worked", "verb_cn": "工作"}],
-                    validation_rules=["past_tense", "time_marker"]
-                ),
-                SentenceTemplate(
-                    pattern="We {verb_past} {noun} last week.",
-                    chinese_pattern="我们上周{verb_cn}了{noun_cn}。",
-                    word_types=["verb", "noun"],
-                    grammar_topics=["一般过去时-基础用法"],
-                    difficulty="medium",
-                    examples=[{"verb_past": "saw", "verb_cn": "看见", "noun": "movies", "noun_cn": "电影"}],
-                    validation_rules=["past_tense", "time_marker"]
-                )
-            ],
-            "现在进行时": [
-                SentenceTemplate(
-                    pattern="I am {verb_ing} now.",
-                    chinese_pattern="我现在正在{verb_cn}。",
-                    word_types=["verb"],
-                    grammar_topics=["现在进行时-基础用法"],
-                    difficulty="easy",
-                    examples=[{"verb_ing": "working", "verb_cn": "工作"}],
-                    validation_rules=["present_continuous", "ing_form"]
-                ),
-                SentenceTemplate(
-                    pattern="She is {verb_ing} {noun} in the {place}.",
-                    chinese_pattern="她正在{place_cn}里{verb_cn}{noun_cn}。",
-                    word_types=["verb", "noun", "noun"],
-                    grammar_topics=["现在进行时-基础用法"],
-                    difficulty="medium",
-                    examples=[{"verb_ing": "reading", "verb_cn": "读", "noun": "books", "noun_cn": "书", "place": "library", "place_cn": "图书馆"}],
-                    validation_rules=["present_continuous", "ing_form", "preposition_usage"]
-                )
-            ],
-            "现在完成时": [
-                SentenceTemplate(
-                    pattern="I have {verb_past_participle} {noun}.",
-                    chinese_pattern="我已经{verb_cn}了{noun_cn}。",
-                    word_types=["verb", "noun"],
-                    grammar_topics=["现在完成时-基础用法"],
-                    difficulty="medium",
-                    examples=[{"verb_past_participle": "finished", "verb_cn": "完成", "noun": "homework", "noun_cn": "作业"}],
-                    validation_rules=["present_perfect", "past_participle"]
-                ),
-                SentenceTemplate(
-                    pattern="She has {verb_past_participle} to {place}.",
-                    chinese_pattern="她已经去过{place_cn}了。",
-                    word_types=["verb", "noun"],
-                    grammar_topics=["现在完成时-基础用法"],
-                    difficulty="medium",
-                    examples=[{"verb_past_participle": "been", "verb_cn": "去", "place": "London", "place_cn": "伦敦"}],
-                    validation_rules=["present_perfect", "past_participle", "preposition_usage"]
-                )
-            ],
-            "被动语态": [
-                SentenceTemplate(
-                    pattern="The {noun} is {verb_past_participle} by {agent}.",
-                    chinese_pattern="{noun_cn}被{agent_cn}{verb_cn}了。",
-                    word_types=["noun", "verb", "noun"],
-                    grammar_topics=["被动语态-基础用法"],
-                    difficulty="advanced",
-                    examples=[{"noun": "book", "noun_cn": "书", "verb_past_participle": "written", "verb_cn": "写", "agent": "Shakespeare", "agent_cn": "莎士比亚"}],
-                    validation_rules=["passive_voice", "past_participle", "by_phrase"]
-                )
-            ],
-            "情态动词": [
-                SentenceTemplate(
-                    pattern="I {modal_verb} {verb} {noun}.",
-                    chinese_pattern="我{modal_verb_cn}{verb_cn}{noun_cn}。",
-                    word_types=["verb", "verb", "noun"],
-                    grammar_topics=["情态动词-基础用法"],
-                    difficulty="medium",
-                    examples=[{"modal_verb": "can", "modal_verb_cn": "能", "verb": "speak", "verb_cn": "说", "noun": "English", "noun_cn": "英语"}],
-                    validation_rules=["modal_verb", "base_verb_form"]
-                )
-            ]
-        }
+        # 按主题复制列表，add_template 不会改动共享模板
+        self.templates = {topic: list(templates) for topic, templates in _TEMPLATES.items()}
     
     def _init_validation_rules(self):
         """初始化学科特定的验证规则"""
-        self.validation_rules = {
-            "verb_form": [
-                r'\b(He|She|It)\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s',
-                r'\bI\s+(works|studies|goes|plays|runs|jumps|dances|sings|reads|writes|eats|drinks|sleeps|thinks)\s'
-            ],
-            "tense_consistency": [
-                r'\b(yesterday|last|ago|before|then)\s+\w+\s+(will|can|may|must)\b',
-                r'\b(now|at the moment|currently)\s+\w+\s+(went|saw|did|had)\b'
-            ],
-            "third_person_singular": [
-                r'\b(He|She|It)\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s'
-            ],
-            "article_usage": [
-                r'\ba\s+[aeiouAEIOU]',
-                r'\ban\s+[bcdfghjklmnpqrstvwxyzBCDFGHJKLMNPQRSTVWXYZ]',
-                r'\ba\s+(water|milk|air|music|information|news|advice|money|time|weather|homework|work|furniture|equipment)'
-            ],
-            "adjective_noun_order": [
-                r'\b(nice|good|bad|big|small|tall|short)\s+(I|you|he|she|it|we|they)\b'
-            ],
-            "plural_form": [
-                r'\b(cat|dog|book|table|student|teacher|car|house)s\s+is\b',
-                r'\b(man|woman|child|person)s\s+is\b'
-            ],
-            "countable_noun": [
-                r'\ba\s+(water|milk|air|music|information|news|advice|money|time|weather|homework|work|furniture|equipment)'
-            ],
-            "there_be_structure": [
-                r'\bThere\s+are\s+many\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s+here\b',
-                r'\bThere\s+are\s+many\s+(nice|good|bad|happy|sad|big|small|tall|short)\s+here\b'
-            ],
-            "past_tense": [
-                r'\bI\s+(go|see|do|have|make|take|come|give|write|read|speak|break|choose|drive|eat|fall|feel|find|get|know)\s',
-                r'\b(He|She|It)\s+(go|see|do|have|make|take|come|give|write|read|speak|break|choose|drive|eat|fall|feel|find|get|know)\s'
-            ],
-            "time_marker": [
-                r'\b(yesterday|last|ago|before|then)\b'
-            ],
-            "present_continuous": [
-                r'\b(am|is|are)\s+\w+ing\b'
-            ],
-            "ing_form": [
-                r'\b(am|is|are)\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s'
-            ],
-            "preposition_usage": [
-                r'\bin\s+the\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\b'
-            ],
-            "present_perfect": [
-                r'\b(have|has)\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s'
-            ],
-            "past_participle": [
-                r'\b(have|has)\s+(go|see|do|have|make|take|come|give|write|read|speak|break|choose|drive|eat|fall|feel|find|get|know)\s'
-            ],
-            "passive_voice": [
-                r'\b(am|is|are|was|were)\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s'
-            ],
-            "by_phrase": [
-                r'\bby\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\b'
-            ],
-            "modal_verb": [
-                r'\b(can|could|may|might|must|should|would|will)\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s'
-            ],
-            "base_verb_form": [
-                r'\b(can|could|may|might|must|should|would|will)\s+(works|studies|goes|plays|runs|jumps|dances|sings|reads|writes|eats|drinks|sleeps|thinks)\s'
-            ]
-        }
+        self.validation_rules = dict(_VALIDATION_RULES)
+        
+        # 可选的提前结束条件：问题数达到 max_issues 或扣分达到 penalty_cap 后不再继续检查
+        self._max_issues = self.config.get('max_issues')
+        self._penalty_cap = self.config.get('penalty_cap')
+        self._rules_version = _default_rules_version(self._max_issues, self._penalty_cap)
+        self._rules_finalizer = None
+    
+    def add_validation_rule(self, rule_name: str, patterns: List[str]):
+        """添加验证规则，并以新的规则版本登记合并后的检查列表（规则在小写化的句子上匹配，字符串模式按忽略大小写编译）"""
+        patterns = [_compile_ci(pattern) if isinstance(pattern, str) else pattern for pattern in patterns]
+        super().add_validation_rule(rule_name, patterns)
+        
+        # 移除本实例上一版自定义规则集，新版本随实例回收一并移除（默认规则集由各实例共享，不移除）
+        if self._rules_finalizer is not None:
+            self._rules_finalizer()
+        self._rules_version = _register_rule_set(_build_checks(self.validation_rules),
+                                                 self._max_issues, self._penalty_cap)
+        self._rules_finalizer = weakref.finalize(self, _RULE_SETS.pop, self._rules_version, None)
     
     def _init_error_patterns(self):
         """初始化学科特定的错误模式"""
-        self.error_patterns = [
-            (r'\ba\s+(water|milk|air|music|information|news|advice|money|time|weather|homework|work|furniture|equipment|bread|rice|sugar|salt|flour|meat|fish|cheese|butter|honey|jam|soup|salad)\b', '不可数名词不能使用不定冠词a', 2.0),
-            (r'\bI\s+am\s+(nice|good|bad|happy|sad|tired|hungry|thirsty)\s*[^a-zA-Z]', 'I am + 形容词的表达不够自然', 1.5),
-            (r'\bI\s+like\s+(nice|good|bad|happy|sad|big|small|tall|short)\s*[^a-zA-Z]', '不能直接说I like + 形容词', 2.0),
-            (r'\bThis\s+is\s+a\s+(they|we|you|I|he|she|it)\b', '代词前不能使用冠词', 2.5),
-            (r'\b(cat|dog|book|table|student|teacher|car|house)s\s+is\b', '复数名词应该用are而不是is', 2.0),
-            (r'\b(He|She|It)\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s', '第三人称单数后动词应该加-s或变形', 2.0),
-            (r'\bThere\s+are\s+many\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s+here\b', '动词不能直接用在"There are many _____ here"句型中', 2.0),
-            (r'\bThere\s+are\s+many\s+(nice|good|bad|happy|sad|big|small|tall|short)\s+here\b', '形容词不能直接用在"There are many _____ here"句型中，需要搭配名词', 2.0),
-            (r'\b(doesn\'t|don\'t|won\'t|can\'t|shouldn\'t|wouldn\'t)\s+\w+\s+(no|not|never|nothing|nobody|nowhere)\b', '英语中不能使用双重否定', 2.5),
-            (r'^[A-Z][^.!?]*$', '句子不完整，缺少标点符号', 1.0),
-            (r'\ba\s+[aeiouAEIOU]', 'a后跟元音音素开头的词，应使用an', 1.5),
-            (r'\ban\s+[bcdfghjklmnpqrstvwxyzBCDFGHJKLMNPQRSTVWXYZ]', 'an后跟辅音音素开头的词，应使用a', 1.5),
-            (r'\b(am|is|are)\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s', '现在进行时动词应该加-ing', 2.0),
-            (r'\b(have|has)\s+(work|study|go|play|run|jump|dance|sing|read|write|eat|drink|sleep|think)\s', '现在完成时动词应该用过去分词', 2.0),
-            (r'\b(can|could|may|might|must|should|would|will)\s+(works|studies|goes|plays|runs|jumps|dances|sings|reads|writes|eats|drinks|sleeps|thinks)\s', '情态动词后应该用动词原形', 2.0)
-        ]
+        self.error_patterns = list(_ERROR_PATTERNS)
     
     def _validate_subject_specific(self, sentence_data, level: ValidationLevel) -> Dict[str, Any]:
         """验证英语学科特定内容"""
-        issues = []
-        suggestions = []
-        penalty = 0.0
-        
-        sentence = sentence_data.sentence
-        grammar_topic = sentence_data.grammar_topic or ""
-        
-        # 检查英语特定的语法规则
-        for rule_name, patterns in self.validation_rules.items():
-            for pattern in patterns:
-                if re.search(pattern, sentence, re.IGNORECASE):
-                    issues.append(f"语法错误: {self._get_error_message(rule_name)}")
-                    suggestions.append(self._get_suggestion(rule_name))
-                    penalty += self._get_penalty(rule_name)
-        
-        # 检查不可数名词使用
-        uncountable_issues = self._check_uncountable_nouns(sentence)
-        issues.extend(uncountable_issues['issues'])
-        suggestions.extend(uncountable_issues['suggestions'])
-        penalty += uncountable_issues['penalty']
-        
-        # 检查动词时态一致性
-        tense_issues = self._check_tense_consistency(sentence, grammar_topic)
-        issues.extend(tense_issues['issues'])
-        suggestions.extend(tense_issues['suggestions'])
-        penalty += tense_issues['penalty']
-        
-        # 检查冠词使用
-        article_issues = self._check_article_usage(sentence)
-        issues.extend(article_issues['issues'])
-        suggestions.extend(article_issues['suggestions'])
-        penalty += article_issues['penalty']
-        
-        return {'issues': issues, 'suggestions': suggestions, 'penalty': penalty}
-    
-    def _check_uncountable_nouns(self, sentence: str) -> Dict[str, Any]:
-        """检查不可数名词使用"""
-        issues = []
-        suggestions = []
-        penalty = 0.0
-        
-        for noun in self.uncountable_nouns:
-            pattern = rf'\ba\s+{noun}\b'
-            if re.search(pattern, sentence, re.IGNORECASE):
-                issues.append(f"不可数名词'{noun}'不能使用不定冠词a")
-                suggestions.append(f"使用some {noun}或直接使用{noun}")
-                penalty += 2.0
-        
-        return {'issues': issues, 'suggestions': suggestions, 'penalty': penalty}
+        issues, suggestions, penalty = self._validate_cached(
+            sentence_data.sentence, sentence_data.grammar_topic or "", self._rules_version)
+        return {'issues': list(issues), 'suggestions': list(suggestions), 'penalty': penalty}
     
-    def _check_tense_consistency(self, sentence: str, grammar_topic: str) -> Dict[str, Any]:
-        """检查时态一致性"""
-        issues = []
-        suggestions = []
-        penalty = 0.0
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _validate_cached(sentence: str, grammar_topic: str,
+                         rules_version: int) -> Tuple[Tuple[str, ...], Tuple[str, ...], float]:
+        """
+        验证句子文本（结果只取决于句子、语法主题和规则版本，按三者缓存）
         
-        if "过去时" in grammar_topic:
-            past_time_words = ['yesterday', 'last', 'ago', 'before', 'then']
-            has_past_time = any(word in sentence.lower() for word in past_time_words)
-            
-            if not has_past_time:
-                issues.append("过去时句子缺少时间标志词")
-                suggestions.append("添加yesterday, last week等时间状语")
-                penalty += 1.0
+        缓存不持有验证器实例，不可数名词和时态检查使用模块级函数，不是可由子类覆盖的钩子；
+        需要额外的检查请通过 add_validation_rule 添加规则
         
-        elif "进行时" in grammar_topic:
-            progressive_time_words = ['now', 'at the moment', 'currently', 'right now']
-            has_progressive_time = any(word in sentence.lower() for word in progressive_time_words)
+        Args:
+            sentence: 句子
+            grammar_topic: 语法主题
+            rules_version: 规则版本号
             
-            if not has_progressive_time:
-                issues.append("进行时句子缺少时间标志词")
-                suggestions.append("添加now, at the moment等时间状语")
-                penalty += 1.0
-        
-        return {'issues': issues, 'suggestions': suggestions, 'penalty': penalty}
-    
-    def _check_article_usage(self, sentence: str) -> Dict[str, Any]:
-        """检查冠词使用"""
+        Returns:
+            Tuple: (问题, 建议, 扣分)
+        """
+        checks, max_issues, penalty_cap = _RULE_SETS[rules_version]
         issues = []
         suggestions = []
         penalty = 0.0
         
-        a_pattern = r'\ba\s+[aeiouAEIOU]'
-        an_pattern = r'\ban\s+[bcdfghjklmnpqrstvwxyzBCDFGHJKLMNPQRSTVWXYZ]'
+        # 检查英语特定的语法规则和冠词使用（每个不同的正则只在小写化的句子上扫描一次）
+        lowered = sentence.lower()
+        for pattern, entries in checks:
+            if pattern.search(lowered):
+                for issue, suggestion, rule_penalty in entries:
+                    issues.append(issue)
+                    suggestions.append(suggestion)
+                    penalty += rule_penalty
+                if _limit_reached(max_issues, penalty_cap, len(issues), penalty):
+                    return tuple(issues), tuple(suggestions), penalty
         
-        if re.search(a_pattern, sentence, re.IGNORECASE):
-            issues.append("a后跟元音音素开头的词，应使用an")
-            suggestions.append("检查冠词a/an的使用规则")
-            penalty += 1.5
+        # 检查不可数名词使用
+        penalty += _check_uncountable_nouns(sentence, issues, suggestions)
+        if _limit_reached(max_issues, penalty_cap, len(issues), penalty):
+            return tuple(issues), tuple(suggestions), penalty
         
-        if re.search(an_pattern, sentence, re.IGNORECASE):
-            issues.append("an后跟辅音音素开头的词，应使用a")
-            suggestions.append("检查冠词a/an的使用规则")
-            penalty += 1.5
+        # 检查动词时态一致性
+        penalty += _check_tense_consistency(sentence, grammar_topic, issues, suggestions)
         
-        return {'issues': issues, 'suggestions': suggestions, 'penalty': penalty}
-    
-    def _get_error_message(self, rule_name: str) -> str:
-        """获取错误信息"""
-        error_messages = {
-            "verb_form": "动词形式错误",
-            "tense_consistency": "时态不一致",
-            "third_person_singular": "第三人称单数形式错误",
-            "article_usage": "冠词使用错误",
-            "adjective_noun_order": "形容词和名词顺序错误",
-            "plural_form": "复数形式错误",
-            "countable_noun": "可数名词使用错误",
-            "there_be_structure": "There be句型结构错误",
-            "past_tense": "过去时形式错误",
-            "time_marker": "时间标志词缺失",
-            "present_continuous": "现在进行时形式错误",
-            "ing_form": "动词-ing形式错误",
-            "preposition_usage": "介词使用错误",
-            "present_perfect": "现在完成时形式错误",
-            "past_participle": "过去分词形式错误",
-            "passive_voice": "被动语态形式错误",
-            "by_phrase": "by短语使用错误",
-            "modal_verb": "情态动词使用错误",
-            "base_verb_form": "动词原形使用错误"
-        }
-        return error_messages.get(rule_name, "语法错误")
-    
-    def _get_suggestion(self, rule_name: str) -> str:
-        """获取建议"""
-        suggestions = {
-            "verb_form": "检查动词形式是否正确",
-            "tense_consistency": "确保时态一致",
-            "third_person_singular": "第三人称单数动词要加-s或变形",
-            "article_usage": "检查冠词a/an的使用规则",
-            "adjective_noun_order": "形容词通常放在名词前面",
-            "plural_form": "检查复数形式是否正确",
-            "countable_noun": "注意可数名词和不可数名词的区别",
-            "there_be_structure": "There be句型中be动词要与后面的名词保持一致",
-            "past_tense": "使用正确的过去时形式",
-            "time_marker": "添加适当的时间标志词",
-            "present_continuous": "现在进行时 = be + 动词-ing",
-            "ing_form": "动词-ing形式变化规则",
-            "preposition_usage": "检查介词的使用",
-            "present_perfect": "现在完成时 = have/has + 过去分词",
-            "past_participle": "使用正确的过去分词形式",
-            "passive_voice": "被动语态 = be + 过去分词",
-            "by_phrase": "被动语态可以用by引出动作执行者",
-            "modal_verb": "情态动词 + 动词原形",
-            "base_verb_form": "情态动词后使用动词原形"
-        }
-        return suggestions.get(rule_name, "请检查语法")
-    
-    def _get_penalty(self, rule_name: str) -> float:
-        """获取惩罚分数"""
-        penalties = {
-            "verb_form": 2.0,
-            "tense_consistency": 2.5,
-            "third_person_singular": 2.0,
-            "article_usage": 1.5,
-            "adjective_noun_order": 1.0,
-            "plural_form": 2.0,
-            "countable_noun": 2.0,
-            "there_be_structure": 2.0,
-            "past_tense": 2.0,
-            "time_marker": 1.0,
-            "present_continuous": 2.0,
-            "ing_form": 2.0,
-            "preposition_usage": 1.5,
-            "present_perfect": 2.0,
-            "past_participle": 2.0,
-            "passive_voice": 2.5,
-            "by_phrase": 1.5,
-            "modal_verb": 2.0,
-            "base_verb_form": 2.0
-        }
-        return penalties.get(rule_name, 1.0)
+        return tuple(issues), tuple(suggestions), penalty
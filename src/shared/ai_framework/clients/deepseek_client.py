@@ -6,13 +6,30 @@ DeepSeek AI客户端
 """
 
 import json
+import asyncio
+import functools
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import hashlib
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Generator
 from dataclasses import dataclass
 import os
 
+# 优先使用orjson序列化请求、解析响应，未安装时回退到标准库json
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+    _json_loads = json.loads
+
+# 已解析的配置文件，键为 (绝对路径, 修改时间)，文件更新后自动重新加载
+_CONFIG_CACHE: Dict[Tuple[str, float], Dict[str, Any]] = {}
+
 @dataclass
 class AIResponse:
     """AI响应数据类"""
@@ -22,6 +39,17 @@ class AIResponse:
     success: bool
     error_message: Optional[str] = None
 
+
+@dataclass
+class StreamChunk:
+    """流式输出数据块（中间数据块的content为None，结束数据块的content为完整内容）"""
+    content: Optional[str]
+    delta: str
+    model: str
+    finish_reason: Optional[str] = None
+    usage: Optional[Dict[str, Any]] = None
+
+
 class DeepSeekAIClient:
     """DeepSeek AI客户端"""
     
@@ -40,6 +68,30 @@ class DeepSeekAIClient:
         
         if not self.api_key:
             raise ValueError("DeepSeek API密钥未配置")
+        
+        # 复用连接的会话（keep-alive），避免每次请求重新建立TCP/TLS连接
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.config.get('pool_connections', 32),
+            pool_maxsize=self.config.get('pool_maxsize', 32),
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._session.headers.update({
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}"
+        })
+    
+        # 响应缓存（内存 + 磁盘），键为请求参数的哈希值；
+        # 磁盘缓存默认放在用户缓存目录（XDG_CACHE_HOME，缺省为 ~/.cache），可用 cache_dir 配置覆盖
+        self._response_cache: Dict[str, AIResponse] = {}
+        self._response_cache_dir = self.config.get('cache_dir') or os.path.join(
+            os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'education', 'deepseek')
+    
+    def close(self):
+        """关闭会话，释放连接池"""
+        self._session.close()
     
     def _get_default_config_path(self) -> str:
         """获取默认配置文件路径"""
@@ -49,14 +101,19 @@ class DeepSeekAIClient:
     def _load_config(self) -> Dict[str, Any]:
         """加载配置文件"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config_path = os.path.abspath(self.config_path)
+            cache_key = (config_path, os.path.getmtime(config_path))
+            config = _CONFIG_CACHE.get(cache_key)
+            if config is None:
+                with open(config_path, 'rb') as f:
+                    config = _json_loads(f.read())
+                _CONFIG_CACHE[cache_key] = config
             
-            # 获取DeepSeek配置
+            # 获取DeepSeek配置（返回副本，实例间互不影响）
             providers = config.get('providers', {})
             deepseek_config = providers.get('deepseek', {})
             
-            return deepseek_config
+            return dict(deepseek_config)
         except Exception as e:
             print(f"⚠️ 加载DeepSeek配置失败: {e}")
             return {}
@@ -67,7 +124,8 @@ class DeepSeekAIClient:
                         temperature: float = 0.7, 
                         max_tokens: int = 2000,
                         model: str = "deepseek-chat",
-                        timeout: Optional[float] = None) -> AIResponse:
+                        timeout: Optional[float] = None,
+                        use_cache: Optional[bool] = None) -> AIResponse:
         """
         生成内容
         
@@ -78,10 +136,21 @@ class DeepSeekAIClient:
             max_tokens: 最大token数
             model: 模型名称
             timeout: 超时时间（秒），None表示使用默认超时
+            use_cache: 是否使用响应缓存，None表示仅在temperature为0（输出确定）时使用
             
         Returns:
             AIResponse: 响应结果
         """
+        cache_key = None
+        if use_cache if use_cache is not None else temperature == 0:
+            cache_key = hashlib.blake2b(
+                json.dumps([model, system_prompt, prompt, temperature, max_tokens], ensure_ascii=False).encode('utf-8'),
+                digest_size=16
+            ).hexdigest()
+            cached = self._load_cached_response(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
             # 构建消息
             messages = []
@@ -98,18 +167,11 @@ class DeepSeekAIClient:
                 "stream": False
             }
             
-            # 设置请求头
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}"
-            }
-            
-            # 发送请求
+            # 发送请求（请求头已在会话中设置）
             actual_timeout = timeout if timeout is not None else self.timeout
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/chat/completions",
-                json=data,
-                headers=headers,
+                data=_json_dumps(data),
                 timeout=actual_timeout
             )
             
@@ -124,7 +186,7 @@ class DeepSeekAIClient:
                 )
             
             # 解析响应
-            result = response.json()
+            result = _json_loads(response.content)
             
             if "error" in result:
                 return AIResponse(
@@ -141,14 +203,17 @@ class DeepSeekAIClient:
                 content = result["choices"][0]["message"]["content"]
             
             # 提取使用情况
-            usage = result.get("usage", {})
+            usage = result.get("usage") or {}
             
-            return AIResponse(
+            ai_response = AIResponse(
                 content=content,
                 usage=usage,
                 model=model,
                 success=True
             )
+            if cache_key is not None:
+                self._save_cached_response(cache_key, ai_response)
+            return ai_response
             
         except requests.exceptions.Timeout:
             return AIResponse(
@@ -174,6 +239,174 @@ class DeepSeekAIClient:
                 success=False,
                 error_message=f"生成内容失败: {e}"
             )
+    
+    def generate_content_stream(self, 
+                               prompt: str, 
+                               system_prompt: str = None,
+                               temperature: float = 0.7, 
+                               max_tokens: int = 2000,
+                               model: str = "deepseek-chat",
+                               timeout: Optional[float] = None) -> Generator[StreamChunk, None, None]:
+        """
+        流式生成内容（SSE），收到数据即逐块返回，无需等待完整响应
+        
+        Args:
+            prompt: 用户提示词
+            system_prompt: 系统提示词
+            temperature: 温度参数
+            max_tokens: 最大token数
+            model: 模型名称
+            timeout: 超时时间（秒），None表示使用默认超时
+            
+        Yields:
+            StreamChunk: 流式输出数据块，delta为本次新增内容；中间数据块的content为None，
+                结束数据块（带finish_reason）的content为完整内容
+        """
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        
+        data = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True
+        }
+        
+        # 增量内容只追加到列表，结束时拼接一次，避免每个数据块都复制一遍累计文本
+        parts: List[str] = []
+        try:
+            actual_timeout = timeout if timeout is not None else self.timeout
+            with self._session.post(
+                f"{self.base_url}/chat/completions",
+                data=_json_dumps(data),
+                timeout=actual_timeout,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    print(f"❌ DeepSeek 流式API调用失败: {response.status_code} - {response.text}")
+                    yield StreamChunk(content="", delta="", model=model, finish_reason="error")
+                    return
+                
+                finish_reason = None
+                usage = None
+                for line in response.iter_lines():
+                    # 处理SSE格式数据，跳过空行和注释
+                    if not line.startswith(b'data:'):
+                        continue
+                    data_str = line[5:].strip()
+                    if data_str == b'[DONE]':
+                        break
+                    
+                    try:
+                        chunk_data = _json_loads(data_str)
+                    except ValueError:
+                        # 忽略无法解析的数据行，继续处理下一行
+                        continue
+                    
+                    choices = chunk_data.get('choices') or [{}]
+                    choice = choices[0]
+                    delta_content = (choice.get('delta') or {}).get('content') or ""
+                    finish_reason = choice.get('finish_reason')
+                    usage = chunk_data.get('usage') or usage
+                    
+                    # 中间数据块只带增量，完成原因只放在结束数据块上
+                    if delta_content:
+                        parts.append(delta_content)
+                        yield StreamChunk(content=None, delta=delta_content, model=model)
+                    if finish_reason:
+                        break
+                
+                yield StreamChunk(
+                    content=''.join(parts),
+                    delta="",
+                    model=model,
+                    finish_reason=finish_reason or "stop",
+                    usage=usage
+                )
+                    
+        except requests.exceptions.RequestException as e:
+            print(f"❌ DeepSeek 流式调用异常: {e}")
+            yield StreamChunk(content=''.join(parts), delta="", model=model, finish_reason="error")
+    
+    def _load_cached_response(self, cache_key: str) -> Optional[AIResponse]:
+        """
+        读取缓存的响应
+        
+        Args:
+            cache_key: 请求参数的哈希值
+            
+        Returns:
+            Optional[AIResponse]: 缓存的响应，未命中时返回None
+        """
+        cached = self._response_cache.get(cache_key)
+        if cached is None:
+            cache_file = os.path.join(self._response_cache_dir, f"{cache_key}.json")
+            if not os.path.exists(cache_file):
+                return None
+            try:
+                with open(cache_file, 'rb') as f:
+                    cached = AIResponse(success=True, **_json_loads(f.read()))
+            except (OSError, ValueError, TypeError) as e:
+                print(f"⚠️ DeepSeek响应缓存读取失败: {e}")
+                return None
+            self._response_cache[cache_key] = cached
+        
+        # 返回副本，调用方修改结果不会影响缓存
+        return AIResponse(content=cached.content, usage=dict(cached.usage), model=cached.model, success=True)
+    
+    def _save_cached_response(self, cache_key: str, response: AIResponse) -> None:
+        """
+        保存成功的响应到内存和磁盘缓存，写入失败不影响使用
+        
+        Args:
+            cache_key: 请求参数的哈希值
+            response: 成功的响应
+        """
+        self._response_cache[cache_key] = AIResponse(
+            content=response.content, usage=dict(response.usage), model=response.model, success=True)
+        try:
+            os.makedirs(self._response_cache_dir, exist_ok=True)
+            with open(os.path.join(self._response_cache_dir, f"{cache_key}.json"), 'wb') as f:
+                f.write(_json_dumps({'content': response.content, 'usage': response.usage, 'model': response.model}))
+        except OSError as e:
+            print(f"⚠️ DeepSeek响应缓存写入失败: {e}")
+    
+    async def agenerate_content(self, prompt: str, **kwargs) -> AIResponse:
+        """
+        异步生成内容（在线程池中执行同步请求，参数与 generate_content 相同）
+        
+        Args:
+            prompt: 用户提示词
+            **kwargs: 传给 generate_content 的其他参数
+            
+        Returns:
+            AIResponse: 响应结果
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(self.generate_content, prompt, **kwargs))
+    
+    async def agenerate_batch(self, prompts: List[str], concurrency: int = 16, **kwargs) -> List[AIResponse]:
+        """
+        并发生成一批内容
+        
+        Args:
+            prompts: 用户提示词列表
+            concurrency: 最大并发请求数
+            **kwargs: 传给 generate_content 的其他参数
+            
+        Returns:
+            List[AIResponse]: 与 prompts 顺序一致的响应结果
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def generate_one(prompt: str) -> AIResponse:
+            async with semaphore:
+                return await self.agenerate_content(prompt, **kwargs)
+        
+        return await asyncio.gather(*(generate_one(prompt) for prompt in prompts))
 
 
 def main():
@@ -6,14 +6,29 @@ GLM客户端
 """
 
 import json
+import logging
+import asyncio
+import functools
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
 import time
+import threading
 import hashlib
-from typing import Dict, List, Any, Optional, Generator
+import hmac
+import base64
+from typing import Dict, List, Any, Optional, Generator, AsyncGenerator, Mapping, Tuple
 from dataclasses import dataclass
 import os
+import sys
+from types import MappingProxyType
 
-@dataclass
+# Python 3.10+ 的 dataclass 支持 slots，实例不再分配 __dict__；旧版本保持普通 dataclass
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class AIResponse:
     """AI响应数据类"""
     content: str
@@ -24,15 +39,98 @@ class AIResponse:
     finish_reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class StreamChunk:
-    """流式输出数据块"""
-    content: str
+    """
+    流式输出数据块
+    
+    中间数据块只带本次增量 delta，content 和 finish_reason 为 None；
+    结束数据块带 finish_reason，content 为完整内容，避免每个数据块都复制一遍累计文本
+    """
+    content: Optional[str]
     delta: str
     model: str
     finish_reason: Optional[str] = None
     usage: Optional[Dict[str, Any]] = None
 
+logger = logging.getLogger(__name__)
+
+# 优先使用orjson序列化请求、解析响应，未安装时回退到标准库json
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    _json_loads = json.loads
+
+# 可选依赖：安装 httpx[http2] 后异步请求走 HTTP/2 多路复用，否则使用线程池执行同步请求
+try:
+    import httpx
+    import h2  # noqa: F401  httpx 的 HTTP/2 支持依赖 h2
+except ImportError:
+    httpx = None
+
+# 会重试的HTTP状态码
+_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+# 同步会话适配器自动重试的状态码：429 不在其中，由 generate_content 冷却该密钥后换密钥重试
+_ADAPTER_RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+
+class _SessionRetry(Retry):
+    """会话适配器的重试策略：带 Retry-After 的 429 也不在适配器内用同一密钥重试"""
+    RETRY_AFTER_STATUS_CODES = Retry.RETRY_AFTER_STATUS_CODES - {429}
+
+
+# SSE数据行前缀及结束标记（"data:" 后可带一个空格）
+_SSE_DATA_PREFIX = b'data:'
+_SSE_DATA_PREFIX_LEN = len(_SSE_DATA_PREFIX)
+_SSE_DONE_PAYLOADS = frozenset((b'[DONE]', b' [DONE]'))
+
+# 请求体模板中用户提示词的占位符
+_PROMPT_PLACEHOLDER = "\x00glm-user-prompt\x00"
+
+
+@functools.lru_cache(maxsize=64)
+def _body_template(system_prompt: Optional[str], model: str, temperature: float,
+                   max_tokens: int, stream: bool) -> Tuple[bytes, bytes]:
+    """
+    生成请求体模板，相同系统提示词和参数的请求只需序列化一次
+    
+    Args:
+        system_prompt: 系统提示词
+        model: 模型名称
+        temperature: 温度参数
+        max_tokens: 最大token数
+        stream: 是否流式输出
+        
+    Returns:
+        Tuple[bytes, bytes]: 用户提示词前后的JSON片段
+    """
+    messages = []
+    if system_prompt:
+        messages.append({"role": "system", "content": system_prompt})
+    messages.append({"role": "user", "content": _PROMPT_PLACEHOLDER})
+    
+    data = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "stream": stream
+    }
+    # 占位符之后只有数值字段，取最后一次出现的位置即可
+    prefix, _, suffix = _json_dumps(data).rpartition(_json_dumps(_PROMPT_PLACEHOLDER))
+    return prefix, suffix
+
+# 配置中找不到模型时使用的默认配置
+_DEFAULT_MODEL_CONFIG = MappingProxyType({
+    "max_tokens": 8192,
+    "temperature": 0.7,
+    "timeout": 60
+})
+
 class GLMClient:
     """GLM客户端"""
     
@@ -46,13 +144,65 @@ class GLMClient:
         self.config_path = config_path or self._get_default_config_path()
         self.config = self._load_config()
         self.base_url = self.config.get('base_url', 'https://open.bigmodel.cn/api/paas/v4')
-        self.api_key = self.config.get('api_key')
+        # 支持配置多个密钥（api_keys），请求间轮流使用以分摊各密钥的频率限制
+        self._api_keys: List[str] = [key for key in (self.config.get('api_keys') or [self.config.get('api_key')]) if key]
+        self.api_key = self._api_keys[0] if self._api_keys else None
         self.timeout = self.config.get('timeout', 60)
         self.max_retries = self.config.get('max_retries', 3)
         self.retry_delay = self.config.get('retry_delay', 1)
         
         if not self.api_key:
             raise ValueError("GLM API密钥未配置")
+        
+        # 复用连接的会话（keep-alive），避免每次请求重新建立TCP/TLS连接；
+        # 超时、连接错误和5xx的重试交给适配器：max_retries 为总尝试次数，503 遵循 Retry-After，其余按 retry_delay 指数退避
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.config.get('pool_connections', 16),
+            pool_maxsize=self.config.get('pool_maxsize', 64),
+            max_retries=_SessionRetry(
+                total=max(self.max_retries - 1, 0),
+                backoff_factor=self.retry_delay,
+                status_forcelist=_ADAPTER_RETRY_STATUS_CODES,
+                allowed_methods=frozenset(['POST']),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._session.headers.update({
+            "Content-Type": "application/json"
+        })
+        
+        # 密钥轮询状态：下一个密钥的位置、被限流密钥的冷却截止时间、各密钥的调用统计
+        self._api_key_lock = threading.Lock()
+        self._api_key_index = 0
+        self._key_cooldown: Dict[str, float] = {}
+        self._api_key_stats: Dict[str, Dict[str, int]] = {
+            key: {"requests": 0, "rate_limited": 0} for key in self._api_keys
+        }
+    
+        # 智谱 v4 接口只校验 Bearer 令牌，签名请求头默认不再生成
+        self._sign_requests = self.config.get('sign_requests', False)
+        if self._sign_requests:
+            self._hmac_prototypes = {
+                key: hmac.new(key.encode('utf-8'), digestmod=hashlib.sha256) for key in self._api_keys
+            }
+        
+        # 异步请求使用的 HTTP/2 客户端，首次异步调用时创建
+        self._async_client = None
+        self._async_client_loop = None
+        
+        # 响应缓存（内存 + 磁盘），键为请求参数的哈希值；
+        # 磁盘缓存默认放在用户缓存目录（XDG_CACHE_HOME，缺省为 ~/.cache），可用 cache_dir 配置覆盖
+        self._response_cache: Dict[str, AIResponse] = {}
+        self._response_cache_dir = self.config.get('cache_dir') or os.path.join(
+            os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'education', 'glm')
+    
+    def close(self):
+        """关闭会话，释放连接池（异步客户端请使用 aclose）"""
+        self._session.close()
     
     def _get_default_config_path(self) -> str:
         """获取默认配置文件路径"""
@@ -60,7 +210,11 @@ class GLMClient:
         return os.path.join(current_dir, '..', '..', 'infrastructure', 'config', 'ai_models.json')
     
     def _load_config(self) -> Dict[str, Any]:
-        """加载配置文件"""
+        """加载配置文件（只读取一次，模型配置一并缓存）"""
+        self._config_loaded_ok = False
+        self._zhipu_models: Dict[str, Dict[str, Any]] = {}
+        self._model_config_index: Dict[str, Mapping[str, Any]] = {}
+        self._lowered_model_names: List[Tuple[str, Dict[str, Any]]] = []
         try:
             with open(self.config_path, 'r', encoding='utf-8') as f:
                 config = json.load(f)
@@ -68,6 +222,8 @@ class GLMClient:
             # 获取智谱AI配置
             providers = config.get('providers', {})
             zhipu_config = providers.get('zhipu', {})
+            self._zhipu_models = zhipu_config.get('models', {})
+            self._lowered_model_names = [(name.lower(), cfg) for name, cfg in self._zhipu_models.items()]
             
             # 获取LLM配置
             llm_config = config.get('llm_config', {})
@@ -75,50 +231,99 @@ class GLMClient:
             # 合并配置
             merged_config = {**zhipu_config, **llm_config}
             
+            self._config_loaded_ok = True
             return merged_config
-        except Exception as e:
-            print(f"⚠️ 加载GLM配置失败: {e}")
+        except (OSError, ValueError, AttributeError) as e:
+            # 文件缺失、JSON格式错误或结构不是预期的字典；其他异常照常抛出
+            logger.warning("加载GLM配置失败: %s", e)
             return {}
     
-    def _get_model_config(self, model: str) -> Dict[str, Any]:
-        """获取模型配置"""
+    def _get_model_config(self, model: str) -> Mapping[str, Any]:
+        """获取模型配置（按模型名缓存匹配结果，命中后只需一次字典查找）"""
+        model_config = self._model_config_index.get(model)
+        if model_config is None:
+            model_config = _DEFAULT_MODEL_CONFIG
+            # 查找匹配的模型配置（按配置顺序，名称相同或包含所查模型名的第一个）
+            model_lower = model.lower()
+            for model_name, config in self._lowered_model_names:
+                if model_name == model_lower or model in model_name:
+                    model_config = config
+                    break
+            self._model_config_index[model] = model_config
+        return model_config
+    
+    def _acquire_api_key(self) -> str:
+        """
+        轮询选择本次请求使用的密钥，跳过仍在冷却中的密钥
+        
+        Returns:
+            str: API密钥，全部在冷却时返回最早结束冷却的密钥
+        """
+        with self._api_key_lock:
+            now = time.monotonic()
+            for _ in range(len(self._api_keys)):
+                api_key = self._api_keys[self._api_key_index]
+                self._api_key_index = (self._api_key_index + 1) % len(self._api_keys)
+                if self._key_cooldown.get(api_key, 0.0) <= now:
+                    break
+            else:
+                api_key = min(self._api_keys, key=lambda key: self._key_cooldown.get(key, 0.0))
+            self._api_key_stats[api_key]["requests"] += 1
+            return api_key
+    
+    def _cool_down_api_key(self, api_key: str, retry_after: Optional[str]) -> None:
+        """
+        密钥被限流（429）后暂停使用一段时间
+        
+        Args:
+            api_key: 被限流的密钥
+            retry_after: 响应中的 Retry-After 请求头（秒），缺失时使用配置的 key_cooldown
+        """
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            
-            providers = config.get('providers', {})
-            zhipu_models = providers.get('zhipu', {}).get('models', {})
-            
-            # 查找匹配的模型配置
-            for model_name, model_config in zhipu_models.items():
-                if model_name.lower() == model.lower() or model in model_name.lower():
-                    return model_config
-            
-            # 返回默认配置
-            return {
-                "max_tokens": 8192,
-                "temperature": 0.7,
-                "timeout": 60
-            }
-        except:
-            return {
-                "max_tokens": 8192,
-                "temperature": 0.7,
-                "timeout": 60
-            }
+            seconds = float(retry_after)
+        except (TypeError, ValueError):
+            seconds = self.config.get('key_cooldown', 60)
+        with self._api_key_lock:
+            self._key_cooldown[api_key] = time.monotonic() + seconds
+            self._api_key_stats[api_key]["rate_limited"] += 1
+    
+    def get_api_key_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        获取各密钥的调用统计，便于按密钥管理额度
+        
+        Returns:
+            Dict[str, Dict[str, int]]: 以密钥末4位标识的请求数和限流次数
+        """
+        with self._api_key_lock:
+            return {f"***{key[-4:]}": dict(stats) for key, stats in self._api_key_stats.items()}
     
-    def _generate_signature(self, timestamp: str, method: str, url: str, body: str) -> str:
+    def _generate_signature(self, timestamp: str, method: str, url: str, body: str,
+                            api_key: Optional[str] = None) -> str:
         """生成签名"""
-        # 智谱AI的签名算法
+        # 智谱AI的签名算法，复制预先设置好密钥的HMAC对象，省去每次的密钥初始化
         string_to_sign = f"{method}\n{url}\n{timestamp}\n{body}"
-        import hmac
-        import base64
-        signature = hmac.new(
-            self.api_key.encode('utf-8'),
-            string_to_sign.encode('utf-8'),
-            hashlib.sha256
-        ).digest()
-        return base64.b64encode(signature).decode('utf-8')
+        mac = self._hmac_prototypes[api_key or self.api_key].copy()
+        mac.update(string_to_sign.encode('utf-8'))
+        return base64.b64encode(mac.digest()).decode('utf-8')
+    
+    def _request_headers(self, api_key: str, body: bytes) -> Dict[str, str]:
+        """
+        生成每次请求的鉴权请求头（签名请求头仅在开启 sign_requests 时生成）
+        
+        Args:
+            api_key: 本次请求使用的密钥
+            body: 序列化后的请求体
+            
+        Returns:
+            Dict[str, str]: 请求头
+        """
+        headers = {"Authorization": f"Bearer {api_key}"}
+        if self._sign_requests:
+            timestamp = str(int(time.time() * 1000))
+            headers["X-Timestamp"] = timestamp
+            headers["X-Signature"] = self._generate_signature(
+                timestamp, "POST", "/api/paas/v4/chat/completions", body.decode('utf-8'), api_key)
+        return headers
     
     def generate_content(self, 
                         prompt: str, 
@@ -126,7 +331,8 @@ class GLMClient:
                         temperature: float = 0.7, 
                         max_tokens: int = 2000,
                         model: str = "glm-4.5-flash",
-                        timeout: Optional[float] = None) -> AIResponse:
+                        timeout: Optional[float] = None,
+                        use_cache: Optional[bool] = None) -> AIResponse:
         """
         生成内容
         
@@ -137,165 +343,187 @@ class GLMClient:
             max_tokens: 最大token数
             model: 模型名称
             timeout: 超时时间（秒），None表示使用默认超时
+            use_cache: 是否使用响应缓存，None表示仅在温度为0（输出确定）时使用
             
         Returns:
             AIResponse: 响应结果
         """
+        cache_key, body, actual_timeout = self._build_request(
+            prompt, system_prompt, temperature, max_tokens, model, timeout, use_cache)
+        
+        # 相同请求直接返回缓存的响应
+        if cache_key is not None:
+            cached = self._load_cached_response(cache_key)
+            if cached is not None:
+                return cached
+        
+        for attempt in range(max(self.max_retries, 1)):
+            # 每次尝试重新选择密钥，被限流的密钥会被跳过
+            api_key = self._acquire_api_key()
+            headers = self._request_headers(api_key, body)
+            
+            # 发送请求（超时、连接错误、5xx 由会话适配器按 Retry-After 和退避策略重试）
+            try:
+                response = self._session.post(
+                    f"{self.base_url}/chat/completions",
+                    data=body,
+                    headers=headers,
+                    timeout=actual_timeout
+                )
+            except requests.exceptions.Timeout as e:
+                raise Exception(f"GLM API请求超时: {e}")
+            except requests.exceptions.ConnectionError as e:
+                # 读超时重试用尽后，requests 会把它包装成 ConnectionError
+                if e.args and isinstance(getattr(e.args[0], 'reason', None), ReadTimeoutError):
+                    raise Exception(f"GLM API请求超时: {e}")
+                raise Exception(f"GLM API网络请求异常: 网络请求失败: {e}")
+            except requests.exceptions.RequestException as e:
+                raise Exception(f"GLM API网络请求异常: 网络请求失败: {e}")
+            
+            # 429：冷却该密钥后换密钥重试（还有可用密钥时不等待），最后一次尝试交给 _handle_response 报错
+            if response.status_code != 429 or attempt >= self.max_retries - 1:
+                return self._handle_response(response, api_key, model, cache_key)
+            retry_after = response.headers.get('Retry-After')
+            self._cool_down_api_key(api_key, retry_after)
+            response.close()
+            wait_time = self._rate_limit_wait_time(retry_after, attempt)
+            if wait_time > 0:
+                logger.info("等待 %s 秒后重试...", wait_time)
+                time.sleep(wait_time)
+    
+    def _retry_wait_time(self, retry_after: Optional[str], attempt: int) -> float:
+        """
+        计算重试前的等待时间（与会话适配器相同：优先遵循 Retry-After，否则按 retry_delay 指数退避）
+        
+        Args:
+            retry_after: 响应中的 Retry-After 请求头（秒）
+            attempt: 已失败的尝试序号（从0开始）
+            
+        Returns:
+            float: 等待秒数
+        """
+        try:
+            return float(retry_after)
+        except (TypeError, ValueError):
+            return self.retry_delay * (2 ** attempt)
+    
+    def _rate_limit_wait_time(self, retry_after: Optional[str], attempt: int) -> float:
+        """
+        计算429后换密钥重试前的等待时间
+        
+        还有未在冷却中的密钥时立即重试；全部在冷却时等到最早结束冷却的密钥可用，
+        但不超过按 Retry-After 或退避计算的时间
+        
+        Args:
+            retry_after: 响应中的 Retry-After 请求头（秒）
+            attempt: 已失败的尝试序号（从0开始）
+            
+        Returns:
+            float: 等待秒数，0表示立即重试
+        """
+        with self._api_key_lock:
+            remaining = min(self._key_cooldown.get(key, 0.0) for key in self._api_keys) - time.monotonic()
+        if remaining <= 0:
+            return 0.0
+        return min(remaining, self._retry_wait_time(retry_after, attempt))
+    
+    def _build_request(self, prompt: str, system_prompt: Optional[str], temperature: Optional[float],
+                       max_tokens: int, model: str, timeout: Optional[float],
+                       use_cache: Optional[bool]) -> Tuple[Optional[str], bytes, float]:
+        """
+        根据模型配置确定实际参数，生成非流式请求的请求体和缓存键
+        
+        Args:
+            参数含义与 generate_content 相同
+            
+        Returns:
+            Tuple[Optional[str], bytes, float]: 缓存键（不使用缓存时为None）、请求体、超时时间
+        """
         # 获取模型配置
         model_config = self._get_model_config(model)
         actual_max_tokens = min(max_tokens, model_config.get('max_tokens', 8192))
         actual_temperature = temperature if temperature is not None else model_config.get('temperature', 0.7)
         actual_timeout = timeout if timeout is not None else model_config.get('timeout', self.timeout)
         
-        # 构建消息
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
-        
-        # 构建请求数据
-        data = {
-            "model": model,
-            "messages": messages,
-            "temperature": actual_temperature,
-            "max_tokens": actual_max_tokens,
-            "stream": False
-        }
+        cache_key = None
+        if use_cache if use_cache is not None else actual_temperature == 0:
+            cache_key = hashlib.blake2b(
+                json.dumps([model, system_prompt, prompt, actual_temperature, actual_max_tokens],
+                           ensure_ascii=False).encode('utf-8'),
+                digest_size=16
+            ).hexdigest()
         
-        # 生成时间戳和签名
-        timestamp = str(int(time.time() * 1000))
-        method = "POST"
-        url = "/api/paas/v4/chat/completions"
-        body = json.dumps(data, separators=(',', ':'))
+        # 构建请求体：除用户提示词外的部分按参数缓存，只序列化提示词后拼接；
+        # 请求体只生成一次，重试时复用，签名（默认关闭）针对实际发送的字节
+        prefix, suffix = _body_template(system_prompt or None, model, actual_temperature, actual_max_tokens, False)
+        body = prefix + _json_dumps(prompt) + suffix
         
-        signature = self._generate_signature(timestamp, method, url, body)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "GLM API调用 模型: %s 温度: %s 最大tokens: %d 超时: %s秒 提示词长度: %d 字符",
+                model, actual_temperature, actual_max_tokens, actual_timeout, len(prompt)
+            )
+        return cache_key, body, actual_timeout
+    
+    def _handle_response(self, response: Any, api_key: str, model: str, cache_key: Optional[str]) -> AIResponse:
+        """
+        处理非流式请求的最终响应（requests 和 httpx 的响应对象接口相同）
         
-        # 设置请求头
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}",
-            "X-Timestamp": timestamp,
-            "X-Signature": signature
-        }
+        Args:
+            response: HTTP响应
+            api_key: 本次请求使用的密钥
+            model: 模型名称
+            cache_key: 缓存键，不为None时缓存成功的响应
+            
+        Returns:
+            AIResponse: 响应结果，HTTP错误或解析失败时抛出异常
+        """
+        logger.debug("API响应状态: %d", response.status_code)
         
-        # 重试机制
-        last_error = None
-        for attempt in range(self.max_retries):
-            try:
-                print(f"🔄 GLM API调用 (尝试 {attempt + 1}/{self.max_retries})")
-                print(f"   模型: {model}")
-                print(f"   温度: {actual_temperature}")
-                print(f"   最大tokens: {actual_max_tokens}")
-                print(f"   超时: {actual_timeout}秒")
-                print(f"   提示词长度: {len(prompt)} 字符")
-                
-                # 发送请求
-                response = requests.post(
-                    f"{self.base_url}/chat/completions",
-                    json=data,
-                    headers=headers,
-                    timeout=actual_timeout
+        if response.status_code == 429:
+            self._cool_down_api_key(api_key, response.headers.get('Retry-After'))
+            raise Exception(f"GLM API频率限制，重试{self.max_retries}次后仍然失败")
+        if response.status_code != 200:
+            last_error = f"API请求失败: {response.status_code} - {response.text}"
+            logger.error("%s", last_error)
+            raise Exception(f"GLM API请求失败: {last_error}")
+        
+        try:
+            # 解析响应
+            result = _json_loads(response.content)
+            
+            if "error" in result:
+                return AIResponse(
+                    content="",
+                    usage={},
+                    model=model,
+                    success=False,
+                    error_message=f"API错误: {result['error']}"
                 )
-                
-                print(f"📡 API响应状态: {response.status_code}")
-                
-                # 检查响应状态
-                if response.status_code == 200:
-                    # 解析响应
-                    result = response.json()
-                    
-                    if "error" in result:
-                        return AIResponse(
-                            content="",
-                            usage={},
-                            model=model,
-                            success=False,
-                            error_message=f"API错误: {result['error']}"
-                        )
-                    
-                    # 提取内容
-                    content = ""
-                    if "choices" in result and len(result["choices"]) > 0:
-                        content = result["choices"][0]["message"]["content"]
-                    
-                    # 提取使用情况
-                    usage = result.get("usage", {})
-                    
-                    # 提取完成原因
-                    finish_reason = None
-                    if "choices" in result and len(result["choices"]) > 0:
-                        finish_reason = result["choices"][0].get("finish_reason")
-                    
-                    return AIResponse(
-                        content=content,
-                        usage=usage,
-                        model=model,
-                        success=True,
-                        finish_reason=finish_reason
-                    )
-                
-                elif response.status_code == 429:
-                    # 频率限制，等待后重试
-                    wait_time = self.retry_delay * (2 ** attempt)
-                    print(f"⚠️ 频率限制，等待 {wait_time} 秒后重试...")
-                    time.sleep(wait_time)
-                    if attempt == self.max_retries - 1:
-                        # 最后一次重试失败，抛出异常
-                        raise Exception(f"GLM API频率限制，重试{self.max_retries}次后仍然失败")
-                    continue
-                
-                else:
-                    last_error = f"API请求失败: {response.status_code} - {response.text}"
-                    print(f"❌ API请求失败: {last_error}")
-                    if attempt < self.max_retries - 1:
-                        print(f"🔄 等待 {self.retry_delay} 秒后重试...")
-                        time.sleep(self.retry_delay)
-                        continue
-                    else:
-                        # 最后一次重试失败，抛出异常
-                        raise Exception(f"GLM API请求失败: {last_error}")
-                        
-            except requests.exceptions.Timeout:
-                last_error = "请求超时"
-                print(f"⏰ 请求超时: {last_error}")
-                if attempt < self.max_retries - 1:
-                    print(f"🔄 等待 {self.retry_delay} 秒后重试...")
-                    time.sleep(self.retry_delay)
-                    continue
-                else:
-                    # 最后一次重试失败，抛出异常
-                    raise Exception(f"GLM API请求超时: {last_error}")
-                    
-            except requests.exceptions.RequestException as e:
-                last_error = f"网络请求失败: {e}"
-                print(f"🌐 网络请求异常: {last_error}")
-                if attempt < self.max_retries - 1:
-                    print(f"🔄 等待 {self.retry_delay} 秒后重试...")
-                    time.sleep(self.retry_delay)
-                    continue
-                else:
-                    # 最后一次重试失败，抛出异常
-                    raise Exception(f"GLM API网络请求异常: {last_error}")
-                    
-            except Exception as e:
-                last_error = f"生成内容失败: {e}"
-                print(f"❓ 未知错误: {last_error}")
-                if attempt < self.max_retries - 1:
-                    print(f"🔄 等待 {self.retry_delay} 秒后重试...")
-                    time.sleep(self.retry_delay)
-                    continue
-                else:
-                    # 最后一次重试失败，抛出异常
-                    raise Exception(f"GLM API未知错误: {last_error}")
+            
+            # 一次取出第一个候选，提取内容和完成原因
+            choices = result.get("choices")
+            first_choice = choices[0] if choices else {}
+            content = (first_choice.get("message") or {}).get("content", "")
+            finish_reason = first_choice.get("finish_reason")
+            
+            # 提取使用情况
+            usage = result.get("usage") or {}
+        except Exception as e:
+            logger.error("未知错误: 生成内容失败: %s", e)
+            raise Exception(f"GLM API未知错误: 生成内容失败: {e}")
         
-        # 所有重试都失败
-        return AIResponse(
-            content="",
-            usage={},
+        ai_response = AIResponse(
+            content=content,
+            usage=usage,
             model=model,
-            success=False,
-            error_message=f"重试 {self.max_retries} 次后仍然失败: {last_error}"
+            success=True,
+            finish_reason=finish_reason
         )
+        if cache_key is not None:
+            self._save_cached_response(cache_key, ai_response)
+        logger.info("GLM API调用成功: 模型 %s, 输出长度 %d 字符", model, len(content))
+        return ai_response
     
     def generate_content_stream(self, 
                                prompt: str, 
@@ -316,7 +544,7 @@ class GLMClient:
             timeout: 超时时间（秒），None表示使用默认超时
             
         Yields:
-            StreamChunk: 流式输出数据块
+            StreamChunk: 流式输出数据块，中间数据块的content为None，结束数据块的content为完整内容
         """
         if not self.api_key:
             yield StreamChunk(
@@ -333,130 +561,101 @@ class GLMClient:
         actual_max_tokens = min(max_tokens, model_config.get('max_tokens', 8192))
         actual_timeout = timeout or model_config.get('timeout', self.timeout)
         
-        # 构建消息
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
-        
-        # 构建请求数据（启用流式输出）
-        data = {
-            "model": model,
-            "messages": messages,
-            "temperature": actual_temperature,
-            "max_tokens": actual_max_tokens,
-            "stream": True
-        }
-        
-        # 生成时间戳和签名
-        timestamp = str(int(time.time() * 1000))
-        method = "POST"
-        url = "/api/paas/v4/chat/completions"
-        body = json.dumps(data, separators=(',', ':'))
-        
-        signature = self._generate_signature(timestamp, method, url, body)
-        
-        # 设置请求头
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}",
-            "X-Timestamp": timestamp,
-            "X-Signature": signature
-        }
+        # 构建请求体：除用户提示词外的部分按参数缓存，只序列化提示词后拼接；
+        # 请求体只生成一次，重试时复用，签名（默认关闭）针对实际发送的字节
+        prefix, suffix = _body_template(system_prompt or None, model, actual_temperature, actual_max_tokens, True)
+        body = prefix + _json_dumps(prompt) + suffix
+        api_key = self._acquire_api_key()
+        headers = self._request_headers(api_key, body)
         
         try:
-            print(f"🚀 GLM 流式API调用开始")
-            print(f"   模型: {model}")
-            print(f"   温度: {actual_temperature}")
-            print(f"   最大tokens: {actual_max_tokens}")
-            print(f"   提示词长度: {len(prompt)} 字符")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "GLM 流式API调用开始 模型: %s 温度: %s 最大tokens: %d 提示词长度: %d 字符",
+                    model, actual_temperature, actual_max_tokens, len(prompt)
+                )
             
-            # 发送流式请求
-            response = requests.post(
+            # 发送流式请求（with 结束时关闭响应，提前退出或出错时连接也会归还连接池）
+            with self._session.post(
                 f"{self.base_url}/chat/completions",
-                json=data,
+                data=body,
                 headers=headers,
                 timeout=actual_timeout,
                 stream=True
-            )
-            
-            if response.status_code == 200:
-                print(f"✅ GLM 流式响应开始")
-                
-                full_content = ""
-                for line in response.iter_lines(decode_unicode=True):
-                    if line:
-                        line_str = line.strip()
+            ) as response:
+                if response.status_code == 200:
+                    logger.debug("GLM 流式响应开始")
+                    
+                    parts: List[str] = []
+                    for line in response.iter_lines():
+                        # 处理SSE格式数据：按字节匹配前缀，只对JSON负载做一次解码
+                        if not line.startswith(_SSE_DATA_PREFIX):
+                            continue
+                        # 去掉 'data:' 前缀；iter_lines 已去掉换行，JSON解析本身容忍首尾空白，无需再 strip
+                        data_str = line[_SSE_DATA_PREFIX_LEN:]
+                        
+                        if data_str in _SSE_DONE_PAYLOADS:
+                            # 流式输出结束
+                            yield StreamChunk(
+                                content=''.join(parts),
+                                delta="",
+                                model=model,
+                                finish_reason="stop"
+                            )
+                            break
+                        
+                        try:
+                            chunk_data = _json_loads(data_str)
+                        except ValueError:
+                            # 忽略JSON解析错误（包括空数据行），继续处理下一行
+                            continue
                         
-                        # 处理SSE格式数据
-                        if line_str.startswith('data: '):
-                            data_str = line_str[6:].strip()  # 去掉 'data: ' 前缀
+                        choices = chunk_data.get('choices')
+                        choice = choices[0] if choices else None
+                        
+                        # 检查delta结构
+                        delta = choice.get('delta') if choice else None
+                        if delta is not None:
+                            finish_reason = choice.get('finish_reason')
+                            
+                            # 智谱AI的流式响应可能在content或reasoning_content字段中
+                            delta_content = delta.get('content') or delta.get('reasoning_content') or ""
                             
-                            if data_str == '[DONE]':
-                                # 流式输出结束
+                            if delta_content:  # 只有当有实际内容时才处理
+                                parts.append(delta_content)
+                                
+                                # 中间数据块不带完成原因，完成原因只放在带完整内容的结束数据块上
                                 yield StreamChunk(
-                                    content=full_content,
+                                    content=None,
+                                    delta=delta_content,
+                                    model=model
+                                )
+                            
+                            # 检查是否完成
+                            if finish_reason:
+                                yield StreamChunk(
+                                    content=''.join(parts),
                                     delta="",
                                     model=model,
-                                    finish_reason="stop"
+                                    finish_reason=finish_reason
                                 )
                                 break
-                            
-                            if data_str:  # 确保不是空字符串
-                                try:
-                                    chunk_data = json.loads(data_str)
-                                    
-                                    if 'choices' in chunk_data and chunk_data['choices']:
-                                        choice = chunk_data['choices'][0]
-                                        
-                                        # 检查delta结构
-                                        if 'delta' in choice:
-                                            delta = choice['delta']
-                                            delta_content = ""
-                                            
-                                            # 智谱AI的流式响应可能在content或reasoning_content字段中
-                                            if 'content' in delta and delta['content']:
-                                                delta_content = delta['content']
-                                            elif 'reasoning_content' in delta and delta['reasoning_content']:
-                                                delta_content = delta['reasoning_content']
-                                            
-                                            if delta_content:  # 只有当有实际内容时才处理
-                                                full_content += delta_content
-                                                
-                                                yield StreamChunk(
-                                                    content=full_content,
-                                                    delta=delta_content,
-                                                    model=model,
-                                                    finish_reason=choice.get('finish_reason')
-                                                )
-                                            
-                                            # 检查是否完成
-                                            if choice.get('finish_reason'):
-                                                yield StreamChunk(
-                                                    content=full_content,
-                                                    delta="",
-                                                    model=model,
-                                                    finish_reason=choice.get('finish_reason')
-                                                )
-                                                break
-                                                
-                                except json.JSONDecodeError:
-                                    # 忽略JSON解析错误，继续处理下一行
-                                    continue
-                
-                print(f"✅ GLM 流式输出完成，总长度: {len(full_content)} 字符")
-            else:
-                print(f"❌ GLM 流式API调用失败: {response.status_code}")
-                error_msg = f"HTTP {response.status_code}: {response.text}"
-                yield StreamChunk(
-                    content="",
-                    delta="",
-                    model=model,
-                    finish_reason="error"
-                )
-                
+                    
+                    logger.info("GLM 流式输出完成，总长度: %d 字符", sum(map(len, parts)))
+                else:
+                    logger.error("GLM 流式API调用失败: %d", response.status_code)
+                    if response.status_code == 429:
+                        self._cool_down_api_key(api_key, response.headers.get('Retry-After'))
+                    error_msg = f"HTTP {response.status_code}: {response.text}"
+                    yield StreamChunk(
+                        content="",
+                        delta="",
+                        model=model,
+                        finish_reason="error"
+                    )
+                    
         except Exception as e:
-            print(f"❌ GLM 流式调用异常: {e}")
+            logger.error("GLM 流式调用异常: %s", e)
             yield StreamChunk(
                 content="",
                 delta="",
@@ -464,22 +663,246 @@ class GLMClient:
                 finish_reason="error"
             )
     
-    def get_available_models(self) -> List[str]:
-        """获取可用的模型列表"""
+    def _load_cached_response(self, cache_key: str) -> Optional[AIResponse]:
+        """
+        读取缓存的响应
+        
+        Args:
+            cache_key: 请求参数的哈希值
+            
+        Returns:
+            Optional[AIResponse]: 缓存的响应，未命中时返回None
+        """
+        cached = self._response_cache.get(cache_key)
+        if cached is None:
+            cache_file = os.path.join(self._response_cache_dir, f"{cache_key}.json")
+            if not os.path.exists(cache_file):
+                return None
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    cached = AIResponse(success=True, **_json_loads(f.read()))
+            except (OSError, ValueError, TypeError) as e:
+                logger.warning("GLM响应缓存读取失败: %s", e)
+                return None
+            self._response_cache[cache_key] = cached
+        
+        # 返回副本，调用方修改结果不会影响缓存
+        return AIResponse(content=cached.content, usage=dict(cached.usage), model=cached.model,
+                          success=True, finish_reason=cached.finish_reason)
+    
+    def _save_cached_response(self, cache_key: str, response: AIResponse) -> None:
+        """
+        保存成功的响应到内存和磁盘缓存，写入失败不影响使用
+        
+        Args:
+            cache_key: 请求参数的哈希值
+            response: 成功的响应
+        """
+        self._response_cache[cache_key] = AIResponse(
+            content=response.content, usage=dict(response.usage), model=response.model,
+            success=True, finish_reason=response.finish_reason)
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            os.makedirs(self._response_cache_dir, exist_ok=True)
+            with open(os.path.join(self._response_cache_dir, f"{cache_key}.json"), 'w', encoding='utf-8') as f:
+                json.dump({'content': response.content, 'usage': response.usage,
+                           'model': response.model, 'finish_reason': response.finish_reason},
+                          f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning("GLM响应缓存写入失败: %s", e)
+    
+    async def agenerate_content(self, prompt: str, **kwargs) -> AIResponse:
+        """
+        异步生成内容（参数与 generate_content 相同）
+        
+        安装了 httpx[http2] 时通过 HTTP/2 连接复用发送，并发请求共享少量连接；
+        否则在线程池中执行同步请求
+        
+        Args:
+            prompt: 用户提示词
+            **kwargs: 传给 generate_content 的其他参数
             
-            providers = config.get('providers', {})
-            zhipu_models = providers.get('zhipu', {}).get('models', {})
+        Returns:
+            AIResponse: 响应结果
+        """
+        if httpx is not None and self.config.get('http2', True):
+            return await self._agenerate_content_http2(prompt, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(self.generate_content, prompt, **kwargs))
+    
+    async def _agenerate_content_http2(self, 
+                                       prompt: str, 
+                                       system_prompt: str = None,
+                                       temperature: float = 0.7, 
+                                       max_tokens: int = 2000,
+                                       model: str = "glm-4.5-flash",
+                                       timeout: Optional[float] = None,
+                                       use_cache: Optional[bool] = None) -> AIResponse:
+        """通过 httpx 异步客户端生成内容，重试策略与同步会话一致"""
+        cache_key, body, actual_timeout = self._build_request(
+            prompt, system_prompt, temperature, max_tokens, model, timeout, use_cache)
+        
+        # 相同请求直接返回缓存的响应
+        if cache_key is not None:
+            cached = self._load_cached_response(cache_key)
+            if cached is not None:
+                return cached
+        
+        client = await self._get_async_client()
+        for attempt in range(max(self.max_retries, 1)):
+            is_last_attempt = attempt >= self.max_retries - 1
+            # 每次尝试重新选择密钥，被限流的密钥会被跳过
+            api_key = self._acquire_api_key()
+            headers = self._request_headers(api_key, body)
+            retry_after = None
+            try:
+                response = await client.post(
+                    f"{self.base_url}/chat/completions",
+                    content=body,
+                    headers=headers,
+                    timeout=actual_timeout
+                )
+            except httpx.TimeoutException as e:
+                if is_last_attempt:
+                    raise Exception(f"GLM API请求超时: {str(e) or type(e).__name__}")
+            except httpx.HTTPError as e:
+                if is_last_attempt:
+                    raise Exception(f"GLM API网络请求异常: 网络请求失败: {str(e) or type(e).__name__}")
+            else:
+                if is_last_attempt or response.status_code not in _RETRY_STATUS_CODES:
+                    return self._handle_response(response, api_key, model, cache_key)
+                retry_after = response.headers.get('Retry-After')
+                if response.status_code == 429:
+                    # 冷却该密钥；还有可用密钥时立即换密钥重试
+                    self._cool_down_api_key(api_key, retry_after)
+                    wait_time = self._rate_limit_wait_time(retry_after, attempt)
+                    if wait_time > 0:
+                        logger.info("等待 %s 秒后重试...", wait_time)
+                        await asyncio.sleep(wait_time)
+                    continue
+            
+            wait_time = self._retry_wait_time(retry_after, attempt)
+            logger.info("等待 %s 秒后重试...", wait_time)
+            await asyncio.sleep(wait_time)
+    
+    async def _get_async_client(self) -> "httpx.AsyncClient":
+        """
+        获取当前事件循环的 HTTP/2 异步客户端（连接池与事件循环绑定，换循环时关闭旧客户端并重新创建）
+        
+        Returns:
+            httpx.AsyncClient: 异步客户端
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is not None and self._async_client_loop is not loop:
+            old_client, self._async_client = self._async_client, None
+            try:
+                await old_client.aclose()
+            except Exception as e:
+                # 旧事件循环可能已关闭，其上的连接无法正常关闭，丢弃即可
+                logger.debug("关闭旧的异步客户端失败: %s", e)
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                http2=True,
+                headers={"Content-Type": "application/json"},
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.config.get('pool_maxsize', 64),
+                    max_keepalive_connections=self.config.get('pool_connections', 16)
+                )
+            )
+            self._async_client_loop = loop
+        return self._async_client
+    
+    async def aclose(self):
+        """关闭异步客户端，释放HTTP/2连接"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_client_loop = None
+    
+    async def agenerate_content_stream(self, prompt: str, **kwargs) -> AsyncGenerator[StreamChunk, None]:
+        """
+        异步流式生成内容（在线程池中逐块读取同步流，参数与 generate_content_stream 相同）
+        
+        Args:
+            prompt: 用户提示词
+            **kwargs: 传给 generate_content_stream 的其他参数
+            
+        Yields:
+            StreamChunk: 流式输出数据块
+        """
+        loop = asyncio.get_running_loop()
+        stream = self.generate_content_stream(prompt, **kwargs)
+        try:
+            while True:
+                chunk = await loop.run_in_executor(None, next, stream, None)
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            stream.close()
+    
+    async def agenerate_batch(self, prompts: List[str], concurrency: int = 10,
+                              rpm: Optional[float] = 100, **kwargs) -> List[AIResponse]:
+        """
+        并发生成一批内容，同时限制并发数和每分钟请求数
+        
+        Args:
+            prompts: 用户提示词列表
+            concurrency: 最大并发请求数
+            rpm: 每分钟最多发起的请求数，None或0表示不限速
+            **kwargs: 传给 generate_content 的其他参数
+            
+        Returns:
+            List[AIResponse]: 与 prompts 顺序一致的响应结果（任一请求重试后仍失败时抛出异常）
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+        # 按固定间隔均匀发起请求；事件循环单线程，预约时间段无需加锁
+        interval = 60.0 / rpm if rpm else 0.0
+        next_slot = [loop.time()]
+        
+        async def generate_one(prompt: str) -> AIResponse:
+            async with semaphore:
+                if interval:
+                    start_at = max(loop.time(), next_slot[0])
+                    next_slot[0] = start_at + interval
+                    await asyncio.sleep(start_at - loop.time())
+                return await self.agenerate_content(prompt, **kwargs)
+        
+        return await asyncio.gather(*(generate_one(prompt) for prompt in prompts))
+    
+    def generate_batch(self, prompts: List[str], concurrency: int = 10,
+                       rpm: Optional[float] = 100, **kwargs) -> List[AIResponse]:
+        """
+        同步接口：并发生成一批内容（不能在运行中的事件循环里调用，此时请使用 agenerate_batch）
+        
+        Args:
+            prompts: 用户提示词列表
+            concurrency: 最大并发请求数
+            rpm: 每分钟最多发起的请求数，None或0表示不限速
+            **kwargs: 传给 generate_content 的其他参数
             
-            return list(zhipu_models.keys())
-        except:
+        Returns:
+            List[AIResponse]: 与 prompts 顺序一致的响应结果
+        """
+        async def run_batch() -> List[AIResponse]:
+            # asyncio.run 结束后事件循环随之关闭，在循环内关闭本次创建的异步客户端
+            try:
+                return await self.agenerate_batch(prompts, concurrency=concurrency, rpm=rpm, **kwargs)
+            finally:
+                await self.aclose()
+        
+        return asyncio.run(run_batch())
+    
+    def get_available_models(self) -> List[str]:
+        """获取可用的模型列表"""
+        if not self._config_loaded_ok:
             return ["glm-4.5-flash", "glm-4.5-turbo", "GLM-4.5"]
+        return list(self._zhipu_models.keys())
     
     def get_model_info(self, model: str) -> Dict[str, Any]:
         """获取模型信息"""
-        return self._get_model_config(model)
+        return dict(self._get_model_config(model))
 
 
 def main():
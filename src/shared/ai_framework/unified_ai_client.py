@@ -57,8 +57,13 @@ class UnifiedAIResponse:
 
 @dataclass
 class StreamChunk:
-    """流式输出数据块"""
-    content: str
+    """
+    流式输出数据块（各提供方统一约定）
+    
+    中间数据块只带本次增量 delta，content 和 finish_reason 为 None；
+    结束数据块带 finish_reason，content 为完整内容
+    """
+    content: Optional[str]
     delta: str
     model: str
     finish_reason: Optional[str] = None
@@ -152,14 +157,24 @@ class DeepSeekAIClientWrapper(BaseAIClient):
             if "coder" in str(request.model).lower():
                 model_name = "deepseek-coder"
             
-            # DeepSeekAIClient需要先实现流式输出，这里暂时返回空流
-            yield StreamChunk(
-                content="DeepSeek流式输出暂未实现",
-                delta="DeepSeek流式输出暂未实现",
-                model=f"{self.model_name}-{model_name}",
-                finish_reason="not_implemented"
-            )
-            
+            # 调用DeepSeekAIClient的流式方法
+            for chunk in self.client.generate_content_stream(
+                prompt=request.prompt,
+                system_prompt=request.system_prompt,
+                temperature=request.temperature,
+                max_tokens=request.max_tokens,
+                model=model_name,
+                timeout=request.timeout
+            ):
+                # 转换为统一的StreamChunk格式
+                yield StreamChunk(
+                    content=chunk.content,
+                    delta=chunk.delta,
+                    model=f"{self.model_name}-{model_name}",
+                    finish_reason=chunk.finish_reason,
+                    usage=chunk.usage
+                )
+                
         except Exception as e:
             yield StreamChunk(
                 content="",
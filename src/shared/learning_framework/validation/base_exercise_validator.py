@@ -8,8 +8,8 @@
 import re
 import random
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple, Any, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Tuple, Any, Optional, Pattern
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -33,6 +33,11 @@ class ValidationRule:
     error_message: str
     suggestion: str
     weight: float = 1.0  # 规则权重
+    # 预编译的正则（忽略大小写），创建规则时编译一次
+    compiled: Pattern = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.compiled = re.compile(self.pattern, re.IGNORECASE)
 
 
 class BaseExerciseValidator(ABC):
@@ -50,10 +55,16 @@ class BaseExerciseValidator(ABC):
         self.config = config or {}
         self.validation_rules: List[ValidationRule] = []
         self.hint_templates: Dict[str, Dict[str, str]] = {}
-        self.error_patterns: List[Tuple[str, str]] = []
+        self.error_patterns: List[Tuple] = []  # (模式, 错误信息[, 权重])
         self._init_validation_rules()
         self._init_hint_templates()
         self._init_error_patterns()
+        # 展平的提示模板：(主题, 难度/类别) -> 提示文本
+        self._flat_hints: Dict[Tuple[str, str], str] = {
+            (topic, key): hint
+            for topic, topic_hints in self.hint_templates.items()
+            for key, hint in topic_hints.items()
+        }
     
     @abstractmethod
     def _init_validation_rules(self):
@@ -203,13 +214,16 @@ class BaseExerciseValidator(ABC):
         question = exercise.get('question', '')
         answer = exercise.get('correct_answer', '')
         
-        # 使用错误模式检查
-        for pattern, error_msg in self.error_patterns:
-            if re.search(pattern, question, re.IGNORECASE):
+        # 使用错误模式检查（模式可以是字符串或预编译正则，元组中错误信息之后的字段忽略）
+        for pattern, error_msg, *_ in self.error_patterns:
+            if isinstance(pattern, str):
+                pattern = re.compile(pattern, re.IGNORECASE)
+            
+            if pattern.search(question):
                 issues.append(f"题目语法错误: {error_msg}")
                 suggestions.append("请检查题目语法")
             
-            if re.search(pattern, answer, re.IGNORECASE):
+            if pattern.search(answer):
                 issues.append(f"答案语法错误: {error_msg}")
                 suggestions.append("请检查答案语法")
         
@@ -319,16 +333,20 @@ class BaseExerciseValidator(ABC):
         difficulty = exercise.get('difficulty', 'medium')
         
         # 从提示模板中获取
-        if topic in self.hint_templates:
-            topic_hints = self.hint_templates[topic]
-            if difficulty in topic_hints:
-                return topic_hints[difficulty]
-            elif 'general' in topic_hints:
-                return topic_hints['general']
+        hint = self._lookup_hint(topic, difficulty)
+        if hint is not None:
+            return hint
         
         # 默认提示
         return "请仔细思考，选择最合适的答案。"
     
+    def _lookup_hint(self, topic: str, difficulty: str) -> Optional[str]:
+        """按主题查找提示：优先匹配难度，其次使用general提示，均无时返回None"""
+        hint = self._flat_hints.get((topic, difficulty))
+        if hint is None:
+            hint = self._flat_hints.get((topic, 'general'))
+        return hint
+    
     def _generate_explanation(self, exercise: Dict[str, Any]) -> str:
         """生成解释"""
         topic = exercise.get('topic', '')
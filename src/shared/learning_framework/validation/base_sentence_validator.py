@@ -8,7 +8,7 @@
 import re
 import random
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Pattern, Union
 from dataclasses import dataclass
 from enum import Enum
 
@@ -69,8 +69,8 @@ class BaseSentenceValidator(ABC):
         self.subject = subject
         self.config = config or {}
         self.templates: Dict[str, List[SentenceTemplate]] = {}
-        self.validation_rules: Dict[str, List[str]] = {}
-        self.error_patterns: List[Tuple[str, str, float]] = []  # (pattern, error_msg, weight)
+        self.validation_rules: Dict[str, List[Pattern]] = {}
+        self.error_patterns: List[Tuple[Union[str, Pattern], str, float]] = []  # (pattern, error_msg, weight)
         self._init_templates()
         self._init_validation_rules()
         self._init_error_patterns()
@@ -189,9 +189,12 @@ class BaseSentenceValidator(ABC):
         
         sentence = sentence_data.sentence
         
-        # 使用错误模式检查
+        # 使用错误模式检查（模式可以是字符串或预编译正则）
         for pattern, error_msg, weight in self.error_patterns:
-            if re.search(pattern, sentence, re.IGNORECASE):
+            if isinstance(pattern, str):
+                pattern = re.compile(pattern, re.IGNORECASE)
+            
+            if pattern.search(sentence):
                 issues.append(f"语法错误: {error_msg}")
                 suggestions.append("请检查语法结构")
                 penalty += weight
@@ -335,8 +338,11 @@ class BaseSentenceValidator(ABC):
         self.templates[topic].append(template)
     
     def add_validation_rule(self, rule_name: str, patterns: List[str]):
-        """添加验证规则"""
-        self.validation_rules[rule_name] = patterns
+        """添加验证规则（字符串模式编译为忽略大小写的正则）"""
+        self.validation_rules[rule_name] = [
+            re.compile(pattern, re.IGNORECASE) if isinstance(pattern, str) else pattern
+            for pattern in patterns
+        ]
     
     def validate_batch(self, sentences: List[SentenceData], 
                       level: ValidationLevel = ValidationLevel.INTERMEDIATE) -> List[ValidationResult]:
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+英语练习题验证器单元测试
+"""
+
+import unittest
+import sys
+import os
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.english.validators.exercise_content_validator import EnglishExerciseValidator
+
+
+class TestEnglishExerciseValidatorTense(unittest.TestCase):
+    """练习题时态标志词检查测试"""
+
+    def setUp(self):
+        """测试前准备"""
+        self.validator = EnglishExerciseValidator()
+
+    def test_past_marker_next_to_chinese(self):
+        """紧挨中文的过去时标志词也应识别"""
+        result = self.validator._check_tense_consistency("用yesterday造句：我昨天去了公园", "", "一般过去时")
+        self.assertEqual(result['issues'], [])
+        self.assertEqual(result['penalty'], 0.0)
+
+    def test_progressive_marker_next_to_chinese(self):
+        """紧挨中文的进行时标志词也应识别"""
+        result = self.validator._check_tense_consistency("我现在now在读书", "", "现在进行时")
+        self.assertEqual(result['issues'], [])
+        self.assertEqual(result['penalty'], 0.0)
+
+    def test_marker_inside_english_word_ignored(self):
+        """英文单词内部的字母组合不算标志词"""
+        result = self.validator._check_tense_consistency("The dragon flew.", "", "一般过去时")
+        self.assertEqual(result['issues'], ["过去时题目缺少时间标志词"])
+        self.assertEqual(result['penalty'], 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+GLM客户端单元测试（使用本地HTTP桩服务，不访问真实接口）
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.shared.ai_framework.clients import glm_client
+from src.shared.ai_framework.clients.glm_client import GLMClient
+
+
+def _completion(content):
+    """非流式成功响应"""
+    return json.dumps({
+        "choices": [{"message": {"content": content}, "finish_reason": "stop"}],
+        "usage": {"total_tokens": 3}
+    }).encode('utf-8')
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """按顺序返回预设响应的桩接口，记录收到的请求"""
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.server.requests.append((self.headers['Authorization'], body))
+        if self.server.responses:
+            status, headers, payload, delay = self.server.responses.pop(0)
+        else:
+            status, headers, payload, delay = 200, {}, _completion("ok"), 0
+        if delay:
+            time.sleep(delay)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        try:
+            self.wfile.write(payload)
+        except OSError:
+            # 客户端已超时断开
+            pass
+
+
+class TestGLMClient(unittest.TestCase):
+    """GLM客户端请求、重试与流式解析测试"""
+
+    @classmethod
+    def setUpClass(cls):
+        """启动本地桩服务"""
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+        cls.server.daemon_threads = True
+        cls.server.requests = []
+        cls.server.responses = []
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """关闭桩服务"""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """测试前准备"""
+        self.server.requests.clear()
+        self.server.responses.clear()
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """测试后清理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def make_client(self, api_keys=("k1",), **llm_config):
+        """用指向桩服务的临时配置创建客户端"""
+        config = {
+            "providers": {"zhipu": {
+                "base_url": f"http://127.0.0.1:{self.server.server_address[1]}",
+                "api_keys": list(api_keys)
+            }},
+            "llm_config": {"max_retries": 3, "retry_delay": 0, "cache_dir": self.temp_dir, **llm_config}
+        }
+        config_path = os.path.join(self.temp_dir, 'ai_models.json')
+        with open(config_path, 'w', encoding='utf-8') as f:
+            json.dump(config, f)
+        client = GLMClient(config_path)
+        self.addCleanup(client.close)
+        return client
+
+    def test_server_error_retried_then_succeeds(self):
+        """5xx由会话适配器重试，随后成功"""
+        self.server.responses.append((500, {}, b'{"error":"busy"}', 0))
+        client = self.make_client()
+        response = client.generate_content("hi")
+        self.assertTrue(response.success)
+        self.assertEqual(response.content, "ok")
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_rate_limited_key_rotated_without_waiting(self):
+        """429后冷却该密钥，立即换用其他密钥重试"""
+        self.server.responses.append((429, {'Retry-After': '30'}, b'{"error":"rate"}', 0))
+        client = self.make_client(api_keys=("k1", "k2"))
+        start = time.monotonic()
+        response = client.generate_content("hi")
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(response.content, "ok")
+        self.assertEqual([auth for auth, _ in self.server.requests], ["Bearer k1", "Bearer k2"])
+        self.assertGreater(client._key_cooldown["k1"], time.monotonic())
+        stats = client.get_api_key_stats()
+        self.assertEqual(stats["***k1"], {"requests": 1, "rate_limited": 1})
+        self.assertEqual(stats["***k2"], {"requests": 1, "rate_limited": 0})
+        # 冷却中的密钥在之后的请求中被跳过
+        client.generate_content("again")
+        self.assertEqual(self.server.requests[-1][0], "Bearer k2")
+
+    @unittest.skipIf(glm_client.httpx is None, "未安装 httpx[http2]")
+    def test_async_rate_limited_key_rotated(self):
+        """异步路径同样在429后立即换密钥重试"""
+        self.server.responses.append((429, {'Retry-After': '30'}, b'{"error":"rate"}', 0))
+        client = self.make_client(api_keys=("k1", "k2"), http2=True)
+
+        async def run():
+            try:
+                return await client.agenerate_content("hi")
+            finally:
+                await client.aclose()
+
+        start = time.monotonic()
+        response = asyncio.run(run())
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(response.content, "ok")
+        self.assertEqual([auth for auth, _ in self.server.requests], ["Bearer k1", "Bearer k2"])
+
+    def test_timeout_message(self):
+        """读超时重试用尽后报告请求超时"""
+        self.server.responses.extend([(200, {}, _completion("late"), 0.5)] * 2)
+        client = self.make_client(max_retries=2)
+        with self.assertRaises(Exception) as context:
+            client.generate_content("hi", timeout=0.1)
+        self.assertTrue(str(context.exception).startswith("GLM API请求超时"), str(context.exception))
+
+    def test_spliced_body_matches_full_payload(self):
+        """模板拼接的请求体与完整载荷直接序列化的结果一致"""
+        client = self.make_client()
+        system_prompt = '你是"英语老师"，回答用\\n分隔'
+        prompt = 'Translate "苹果"   and\ttab'
+        client.generate_content(prompt, system_prompt=system_prompt, temperature=0.3, max_tokens=500)
+        expected = {
+            "model": "glm-4.5-flash",
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.3,
+            "max_tokens": 500,
+            "stream": False
+        }
+        body = self.server.requests[0][1]
+        self.assertEqual(json.loads(body), expected)
+        self.assertEqual(body, json.dumps(expected, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+    def test_stream_done_markers(self):
+        """流式输出支持 data:[DONE] 和 data: [DONE] 两种结束标记"""
+        events = (
+            b'data:{"choices":[{"delta":{"content":"Hello"}}]}\n\n'
+            b': keep-alive\n\n'
+            b'data: {"choices":[{"delta":{"content":" world"}}]}\n\n'
+        )
+        client = self.make_client()
+        for done in (b'data:[DONE]\n\n', b'data: [DONE]\n\n'):
+            with self.subTest(done=done):
+                self.server.responses.append((200, {'Content-Type': 'text/event-stream'}, events + done, 0))
+                chunks = list(client.generate_content_stream("hi"))
+                self.assertEqual([(chunk.content, chunk.delta, chunk.finish_reason) for chunk in chunks], [
+                    (None, "Hello", None),
+                    (None, " world", None),
+                    ("Hello world", "", "stop"),
+                ])
+
+    def test_stream_finish_reason_on_terminal_chunk_only(self):
+        """增量与完成原因同时到达时，完成原因只出现在带完整内容的结束数据块上"""
+        events = (
+            b'data: {"choices":[{"delta":{"content":"Hello"}}]}\n\n'
+            b'data: {"choices":[{"delta":{"content":" world"},"finish_reason":"stop"}]}\n\n'
+        )
+        self.server.responses.append((200, {'Content-Type': 'text/event-stream'}, events, 0))
+        client = self.make_client()
+        chunks = list(client.generate_content_stream("hi"))
+        self.assertEqual([chunk.finish_reason for chunk in chunks], [None, None, "stop"])
+        self.assertEqual(chunks[-1].content, "Hello world")
+
+
+if __name__ == '__main__':
+    unittest.main()
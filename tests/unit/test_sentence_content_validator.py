@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+英语句子验证器单元测试
+"""
+
+import gc
+import re
+import unittest
+import sys
+import os
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# 添加src目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.english.validators import sentence_content_validator
+from src.english.validators.sentence_content_validator import EnglishSentenceValidator
+
+# 引擎一致性检查用的样例：含紧挨汉字的英文、大小写混合和全角空格
+_PARITY_SAMPLES = (
+    "我有a water",
+    "He work hard every day.",
+    "I am happy。",
+    "这是This is a they的例子",
+    "I like good\u3000food.",
+    "She has a apple and an book.",
+    "A honey jar 在桌上",
+)
+
+
+class TestEnglishSentenceValidatorTense(unittest.TestCase):
+    """句子时态标志词检查测试"""
+
+    def check(self, sentence, topic):
+        """返回 (问题列表, 扣分)"""
+        issues, suggestions = [], []
+        penalty = sentence_content_validator._check_tense_consistency(sentence, topic, issues, suggestions)
+        return issues, penalty
+
+    def test_possessive_past_marker(self):
+        """所有格形式的过去时标志词也应识别"""
+        self.assertEqual(self.check("I went to yesterday's party.", "一般过去时"), ([], 0.0))
+
+    def test_possessive_progressive_marker(self):
+        """所有格形式的进行时标志词也应识别"""
+        self.assertEqual(self.check("I am reading now's time.", "现在进行时"), ([], 0.0))
+
+    def test_marker_inside_word_ignored(self):
+        """单词内部的字母组合不算标志词"""
+        issues, penalty = self.check("The dragon will strengthen.", "一般过去时")
+        self.assertEqual(issues, ["过去时句子缺少时间标志词"])
+        self.assertEqual(penalty, 1.0)
+
+
+class TestEnglishSentenceValidatorCache(unittest.TestCase):
+    """验证结果缓存测试"""
+
+    def test_added_rule_invalidates_cache(self):
+        """添加规则后同一句子按新规则重新验证"""
+        validator = EnglishSentenceValidator()
+        sentence = "The cat sat on the mat."
+        before, _, _ = validator._validate_cached(sentence, "", validator._rules_version)
+        validator.add_validation_rule("custom_rule", [r"\bcat\b"])
+        after, _, _ = validator._validate_cached(sentence, "", validator._rules_version)
+        self.assertNotIn("语法错误: 语法错误", before)
+        self.assertIn("语法错误: 语法错误", after)
+
+    def test_other_instances_unaffected(self):
+        """一个实例添加规则不影响其他实例"""
+        validator = EnglishSentenceValidator()
+        other = EnglishSentenceValidator()
+        validator.add_validation_rule("custom_rule", [r"\bcat\b"])
+        issues, _, _ = other._validate_cached("The cat sat.", "", other._rules_version)
+        self.assertNotIn("语法错误: 语法错误", issues)
+
+    def test_rule_sets_released(self):
+        """添加过规则的实例回收后，其规则集从登记表移除"""
+        size = len(sentence_content_validator._RULE_SETS)
+        for _ in range(20):
+            validator = EnglishSentenceValidator()
+            validator.add_validation_rule("custom_rule", [r"\bcat\b"])
+            validator.add_validation_rule("other_rule", [r"\bdog\b"])
+        del validator
+        gc.collect()
+        self.assertEqual(len(sentence_content_validator._RULE_SETS), size)
+
+
+class TestRegexEngineParity(unittest.TestCase):
+    """RE2与标准库re的匹配结果一致性测试"""
+
+    def test_uncountable_noun_next_to_chinese(self):
+        """紧挨汉字的 a water 在任一引擎下都应报错"""
+        validator = EnglishSentenceValidator()
+        issues, _, _ = validator._validate_cached("我有a water", "", validator._rules_version)
+        self.assertIn("不可数名词'water'不能使用不定冠词a", issues)
+
+    @unittest.skipIf(re2 is None, "未安装 google-re2")
+    def test_all_patterns_agree(self):
+        """所有规则在两种引擎下的匹配结果相同"""
+        patterns = [pattern for pattern, _, _ in sentence_content_validator._ERROR_PATTERN_SOURCES]
+        for rule_patterns in sentence_content_validator._VALIDATION_PATTERNS.values():
+            patterns.extend(rule_patterns)
+        for pattern in patterns:
+            std_re = re.compile(f'(?i){pattern}', re.ASCII)
+            re2_re = re2.compile(f'(?i){pattern}')
+            for text in _PARITY_SAMPLES:
+                with self.subTest(pattern=pattern, text=text):
+                    self.assertEqual(std_re.search(text) is not None, re2_re.search(text) is not None)
+
+
+if __name__ == '__main__':
+    unittest.main()